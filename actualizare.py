@@ -0,0 +1,241 @@
+import json
+import os
+import shutil
+from typing import Optional
+
+import pandas as pd
+
+from acumulatori import STATISTICI_ENERGIE, build_statistics, load_statistics, save_statistics, update_statistics
+from agregate import load_aggregates, merge_aggregates, partial_aggregates, save_aggregates
+from convert import transform_data, write_columnar, write_transformed_csv
+from descompunere import DESCOMPUNERE_ENERGIE, decompose_data, update_decomposition, write_decomposition
+from incarcare import (COLOANE_TRANSFORMAT, CSV_TRANSFORMAT, MANIFEST, PARQUET_TRANSFORMAT, PARTITII_TRANSFORMAT,
+                       append_partitioned, is_fresh, load_columns, load_range, load_transformed, write_column_store,
+                       write_partitioned)
+from interval_timp import sort_by_date
+from prognoza import MODELE_PROGNOZA, fit_models, load_models, save_models, update_models
+
+AGREGATE_ENERGIE = "agregate_energie.csv"
+STARE_ACTUALIZARE = "energie_transformata.state.json"
+
+
+def _read_state(state_path: str) -> Optional[dict]:
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    """Scrie JSON-ul într-un fișier temporar și îl mută peste `path` (cititorii văd vechiul sau noul conținut)."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def state_matches(state_path: str, dst: str) -> bool:
+    """
+    True dacă fișierul de stare descrie exact fișierul transformat: mărimea lui `dst` e cea
+    înregistrată la ultima actualizare. O reconstrucție cu alt conținut (sau o stare veche,
+    fără mărime) face starea și agregatele asociate nesigure.
+    """
+    state = _read_state(state_path)
+    return (state is not None and "dst_bytes" in state and os.path.exists(dst)
+            and os.path.getsize(dst) == state["dst_bytes"])
+
+
+def read_high_water_mark(state_path: str, dst: str) -> Optional[pd.Timestamp]:
+    """
+    Cea mai recentă dată deja transformată.
+    Se citește din fișierul de stare dacă acesta corespunde lui `dst` (state_matches);
+    altfel se calculează din coloana 'date' a fișierului transformat (None dacă nu există).
+    """
+    if state_matches(state_path, dst):
+        return pd.Timestamp(_read_state(state_path)["high_water_mark"])
+    if os.path.exists(dst):
+        dates = pd.to_datetime(pd.read_csv(dst, usecols=["date"])["date"])
+        return dates.max()
+    return None
+
+
+def write_high_water_mark(state_path: str, hwm: pd.Timestamp, dst: str = CSV_TRANSFORMAT) -> None:
+    """Înregistrează ultima dată transformată și mărimea curentă a lui `dst` (vezi state_matches)."""
+    _write_json_atomic(state_path, {"high_water_mark": hwm.isoformat(sep=" "), "dst_bytes": os.path.getsize(dst)})
+
+
+def _commit_pending(state_path: str, dst: str, aggregates_path: Optional[str]) -> None:
+    """
+    Aplică (sau reaplică, după o întrerupere) o actualizare pregătită: `dst` se readuce la
+    mărimea dinaintea actualizării, i se adaugă rândurile din fișierul pregătit, agregatele
+    pregătite le înlocuiesc pe cele vechi, iar starea se scrie ultima.
+    Fiecare pas se poate repeta fără efecte duble.
+    """
+    pending = _read_state(state_path)["pending"]
+    staged_csv = dst + ".staged"
+    staged_aggregates = None if aggregates_path is None else aggregates_path + ".staged"
+
+    mode = "r+b" if os.path.exists(dst) else "w+b"
+    with open(dst, mode) as out, open(staged_csv, "rb") as staged:
+        out.truncate(pending["from_bytes"])
+        out.seek(pending["from_bytes"])
+        shutil.copyfileobj(staged, out)
+    if staged_aggregates is not None and os.path.exists(staged_aggregates):
+        os.replace(staged_aggregates, aggregates_path)
+    write_high_water_mark(state_path, pd.Timestamp(pending["high_water_mark"]), dst)
+    os.remove(staged_csv)
+
+
+def append_incremental(
+    src: str,
+    dst: str = CSV_TRANSFORMAT,
+    aggregates_path: Optional[str] = AGREGATE_ENERGIE,
+    state_path: str = STARE_ACTUALIZARE,
+    columnar_path: Optional[str] = None,
+    store_path: Optional[str] = None,
+    partitions_path: Optional[str] = None,
+    decomposition_path: Optional[str] = None,
+    forecast_path: Optional[str] = None,
+    statistics_path: Optional[str] = None,
+    chunksize: int = 100_000,
+    encoding: str = "utf-8"
+) -> int:
+    """
+    Actualizare incrementală: transformă doar rândurile din `src` cu 'date' strict
+    mai mare decât ultima dată procesată și le adaugă la `dst`.
+    - aggregates_path: agregatele parțiale (agregate.partial_aggregates) se actualizează
+      doar cu rândurile noi; dacă fișierul nu există, se construiește o dată din `dst`
+    - columnar_path: dacă e dat, copia Parquet se rescrie (citire columnară + rânduri noi)
+    - store_path: dacă e dat, depozitul de coloane .npy se rescrie la fel
+    - partitions_path: dacă e dat, în setul partiționat se rescriu doar lunile cu rânduri noi
+    - decomposition_path: dacă e dat, componentele descompunerii (descompunere.py) se
+      recalculează doar pe coada afectată de rândurile noi
+    - forecast_path: dacă e dat, modelele de prognoză (prognoza.py) se actualizează
+      doar cu rândurile noi
+    - statistics_path: dacă e dat, acumulatorii statistici (acumulatori.py) primesc
+      doar rândurile noi
+    Copiile columnare rămân sortate după dată: rândurile noi sunt toate după
+    high-water mark, deci e suficient să fie sortate între ele.
+    Istoricul este considerat imuabil: rândurile cu dată <= high-water mark sunt ignorate.
+    O copie derivată care lipsește sau era deja în urmă față de `dst` se reconstruiește din
+    tot fișierul transformat, în loc să primească doar rândurile noi.
+    Rândurile noi și agregatele se pregătesc în fișiere '.staged' și se aplică împreună cu
+    noua stare (_commit_pending); o rulare întreruptă se reia la pornirea următoare, deci
+    `dst` nu primește rânduri duble. Copiile derivate se actualizează după acest pas; dacă
+    rămân în urmă, verificările is_fresh le ocolesc până la următoarea actualizare.
+    Returnează numărul de rânduri noi.
+    """
+    state = _read_state(state_path)
+    if state is not None and "pending" in state:
+        _commit_pending(state_path, dst, aggregates_path)
+
+    trusted = state_matches(state_path, dst)
+    hwm = read_high_water_mark(state_path, dst)
+    dst_exists = os.path.exists(dst)
+    dst_bytes = os.path.getsize(dst) if dst_exists else 0
+
+    aggregates = None
+    if aggregates_path is not None:
+        # agregatele salvate sunt valabile doar împreună cu o stare care corespunde lui dst
+        if trusted and os.path.exists(aggregates_path):
+            aggregates = load_aggregates(aggregates_path)
+        elif dst_exists:
+            df_dst = pd.read_csv(dst)
+            df_dst["date"] = pd.to_datetime(df_dst["date"])
+            aggregates = partial_aggregates(df_dst)
+
+    staged_csv = dst + ".staged"
+    n_new = 0
+    new_max = hwm
+    new_parts = []
+    for chunk in pd.read_csv(src, chunksize=chunksize, encoding=encoding):
+        if hwm is not None:
+            chunk = chunk[pd.to_datetime(chunk["date"], errors="coerce") > hwm]
+        if chunk.empty:
+            continue
+        df_t = transform_data(chunk, copy=False)
+        write_transformed_csv(df_t, staged_csv, header=not dst_exists and n_new == 0,
+                              mode="w" if n_new == 0 else "a")
+        n_new += len(df_t)
+
+        chunk_max = df_t["date"].max()
+        if new_max is None or chunk_max > new_max:
+            new_max = chunk_max
+        if aggregates_path is not None:
+            aggregates = merge_aggregates(aggregates, partial_aggregates(df_t))
+        if (columnar_path is not None or store_path is not None or partitions_path is not None
+                or decomposition_path is not None or forecast_path is not None
+                or statistics_path is not None):
+            new_parts.append(df_t)
+
+    if n_new == 0:
+        return 0
+
+    # copiile derivate care erau la zi primesc doar rândurile noi; celelalte se reconstruiesc
+    def manifest(directory):
+        return None if directory is None else os.path.join(directory, MANIFEST)
+
+    markers = {"columnar": columnar_path, "store": manifest(store_path), "partitions": manifest(partitions_path),
+               "decomposition": manifest(decomposition_path), "forecast": forecast_path,
+               "statistics": statistics_path}
+    fresh = {name: path is not None and is_fresh(path, dst) for name, path in markers.items()}
+
+    if aggregates_path is not None:
+        save_aggregates(aggregates, aggregates_path + ".staged")
+    # punctul de commit: de aici, o întrerupere se termină la rularea următoare
+    pending = {"high_water_mark": new_max.isoformat(sep=" "), "from_bytes": dst_bytes}
+    _write_json_atomic(state_path, dict(state or {}, pending=pending))
+    _commit_pending(state_path, dst, aggregates_path)
+
+    # fără copii derivate cerute nu se păstrează rândurile noi în memorie
+    df_new = sort_by_date(pd.concat(new_parts, ignore_index=True)) if new_parts else pd.DataFrame()
+
+    def complete(existing) -> pd.DataFrame:
+        # fără copie validă: dst conține deja tot istoricul, inclusiv rândurile noi
+        if existing is None:
+            return sort_by_date(load_transformed(dst))
+        return sort_by_date(pd.concat([existing, df_new], ignore_index=True))
+
+    if columnar_path is not None:
+        write_columnar(complete(pd.read_parquet(columnar_path) if fresh["columnar"] else None), columnar_path)
+    if store_path is not None:
+        write_column_store(complete(load_columns(store_path) if fresh["store"] else None), store_path)
+    if partitions_path is not None:
+        if fresh["partitions"]:
+            append_partitioned(df_new, partitions_path)
+        else:
+            write_partitioned(complete(None), partitions_path)
+    sources = {"csv_path": dst, "partitions_path": partitions_path or PARTITII_TRANSFORMAT}
+    if decomposition_path is not None:
+        if fresh["decomposition"]:
+            update_decomposition(df_new["date"].min(), decomposition_path, **sources)
+        else:
+            write_decomposition(decompose_data(load_range(**sources)), decomposition_path)
+    if forecast_path is not None:
+        if fresh["forecast"]:
+            models = update_models(load_models(forecast_path), df_new)
+        else:
+            models = fit_models(load_range(**sources))
+        save_models(models, forecast_path)
+    if statistics_path is not None:
+        if fresh["statistics"]:
+            statistici = update_statistics(load_statistics(statistics_path), df_new)
+        else:
+            statistici = build_statistics(complete(None))
+        save_statistics(statistici, statistics_path)
+    return n_new
+
+
+if __name__ == "__main__":
+    # toate copiile derivate folosite de statistici și de dashboard rămân la zi
+    # (copia Parquet doar dacă există, ca în convert.py: necesită pyarrow)
+    n = append_incremental(
+        "energy_data.csv",
+        columnar_path=PARQUET_TRANSFORMAT if os.path.exists(PARQUET_TRANSFORMAT) else None,
+        store_path=COLOANE_TRANSFORMAT,
+        partitions_path=PARTITII_TRANSFORMAT,
+        decomposition_path=DESCOMPUNERE_ENERGIE,
+        forecast_path=MODELE_PROGNOZA,
+        statistics_path=STATISTICI_ENERGIE,
+    )
+    print(f"✔ {n} rânduri noi adăugate în '{CSV_TRANSFORMAT}'.")
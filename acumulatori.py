@@ -0,0 +1,344 @@
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from motor_statistici import PERCENTILE, percentile_label
+
+STATISTICI_ENERGIE = "statistici_energie.json"
+# coloanele și grupările păstrate incremental (acoperă secțiunile 3-7 ale raportului)
+COLOANE_STATISTICI = ["carbune", "hidro", "hidrocarburi", "nuclear", "eolian", "fotovolt", "biomasa",
+                      "productie", "consum", "sold", "stocare", "raport_pret_calitate"]
+GRUPARI_STATISTICI = {"total": None, "an": "an", "luna": "luna", "ora": "ora"}
+
+
+class Momente:
+    """
+    Momentele (n, medie, M2, M3, M4, min, max) pentru mai multe coloane, actualizate pe loturi
+    și combinate cu formulele Welford / Chan / Pébay, fără a păstra valorile.
+    Valorile lipsă sunt ignorate; statisticile finale folosesc aceleași corecții ca describe_all.
+    """
+
+    CAMPURI = ["n", "mean", "m2", "m3", "m4", "min", "max"]
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+        self.m4 = np.zeros(k)
+        self.min = np.full(k, np.nan)
+        self.max = np.full(k, np.nan)
+
+    @classmethod
+    def from_values(cls, columns: Sequence[str], values: np.ndarray) -> "Momente":
+        """Momentele unui lot (matrice rânduri × coloane), calculate direct."""
+        acc = cls(columns)
+        mask = ~np.isnan(values)
+        n = mask.sum(axis=0).astype("float64")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(mask, values, 0.0).sum(axis=0) / n
+            dev = np.where(mask, values - mean, 0.0)
+        dev2 = dev * dev
+        acc.n = n
+        acc.mean = np.where(n > 0, mean, 0.0)
+        acc.m2 = dev2.sum(axis=0)
+        acc.m3 = (dev2 * dev).sum(axis=0)
+        acc.m4 = (dev2 * dev2).sum(axis=0)
+        if len(values):
+            with np.errstate(invalid="ignore"):
+                acc.min = np.fmin.reduce(values, axis=0)
+                acc.max = np.fmax.reduce(values, axis=0)
+        return acc
+
+    def merge(self, other: "Momente") -> "Momente":
+        """Combină (pe loc) momentele altei partiții cu aceleași coloane."""
+        na, nb = self.n, other.n
+        n = na + nb
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            d_n = np.where(n > 0, delta / n, 0.0)
+            d_n2 = d_n * d_n
+            term = delta * d_n * na * nb
+            m2 = self.m2 + other.m2 + term
+            m3 = (self.m3 + other.m3 + term * d_n * (na - nb)
+                  + 3 * d_n * (na * other.m2 - nb * self.m2))
+            m4 = (self.m4 + other.m4 + term * d_n2 * (na * na - na * nb + nb * nb)
+                  + 6 * d_n2 * (na * na * other.m2 + nb * nb * self.m2)
+                  + 4 * d_n * (na * other.m3 - nb * self.m3))
+            self.mean = np.where(n > 0, self.mean + d_n * nb, 0.0)
+        self.n, self.m2, self.m3, self.m4 = n, m2, m3, m4
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    def update(self, values: np.ndarray) -> "Momente":
+        return self.merge(Momente.from_values(self.columns, values))
+
+    def stats(self) -> Dict[str, np.ndarray]:
+        """count, mean, std, var, min, max, range, cv, skew, kurtosis (ca describe_all)."""
+        n, m2, m3, m4 = self.n, self.m2, self.m3, self.m4
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, self.mean, np.nan)
+            var = np.where(n > 1, m2 / (n - 1), np.nan)
+            std = np.sqrt(var)
+            skew = np.where(n > 2, np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5, np.nan)
+            kurt = np.where(
+                n > 3,
+                n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)),
+                np.nan
+            )
+            skew = np.where(m2 == 0, 0.0, skew)
+            kurt = np.where(m2 == 0, 0.0, kurt)
+            cv = std / mean * 100
+        return {
+            "count": n, "mean": mean, "std": std, "var": var,
+            "min": self.min, "max": self.max, "range": self.max - self.min,
+            "cv": cv, "skew": skew, "kurtosis": kurt,
+        }
+
+    def to_dict(self) -> dict:
+        data = {"columns": self.columns}
+        for camp in self.CAMPURI:
+            data[camp] = [None if np.isnan(v) else float(v) for v in getattr(self, camp)]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Momente":
+        acc = cls(data["columns"])
+        for camp in cls.CAMPURI:
+            setattr(acc, camp, np.array([np.nan if v is None else v for v in data[camp]], dtype="float64"))
+        return acc
+
+
+class SchitaCuantile:
+    """
+    Schiță de cuantile combinabilă (histogramă pe găleți logaritmice, în stilul DDSketch),
+    câte una pentru fiecare coloană.
+    Orice cuantilă are eroare relativă cel mult `relative_accuracy` (implicit 1%), iar
+    memoria depinde de domeniul valorilor, nu de numărul de rânduri. Două schițe cu
+    aceeași precizie se combină adunând numărătorile.
+    """
+
+    def __init__(self, columns: Sequence[str], relative_accuracy: float = 0.01):
+        self.columns = list(columns)
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        # per coloană: numărători pe cheia găleții, separat pentru valori pozitive / negative
+        self.pos: List[pd.Series] = [pd.Series(dtype="float64") for _ in self.columns]
+        self.neg: List[pd.Series] = [pd.Series(dtype="float64") for _ in self.columns]
+        self.zero = np.zeros(len(self.columns))
+
+    def _keys(self, x: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(x) / self._log_gamma).astype("int64")
+
+    def update(self, values: np.ndarray, weights: Optional[np.ndarray] = None) -> "SchitaCuantile":
+        """
+        Adaugă rândurile matricei `values` (rânduri × coloane).
+        - weights: numărul de apariții al fiecărui rând (ex. dintr-un value_counts); None -> 1
+        """
+        if weights is None:
+            weights = np.ones(len(values))
+        weights = np.asarray(weights, dtype="float64")
+        for j in range(len(self.columns)):
+            col = values[:, j]
+            present = ~np.isnan(col)
+            col, w = col[present], weights[present]
+            self.zero[j] += w[col == 0].sum()
+            for store, sign, mask in ((self.pos, 1, col > 0), (self.neg, -1, col < 0)):
+                if mask.any():
+                    counts = pd.Series(w[mask]).groupby(self._keys(sign * col[mask])).sum()
+                    store[j] = counts if store[j].empty else store[j].add(counts, fill_value=0)
+        return self
+
+    def merge(self, other: "SchitaCuantile") -> "SchitaCuantile":
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Schițele combinate trebuie să aibă aceeași precizie relativă.")
+        for j in range(len(self.columns)):
+            self.pos[j] = self.pos[j].add(other.pos[j], fill_value=0)
+            self.neg[j] = self.neg[j].add(other.neg[j], fill_value=0)
+        self.zero = self.zero + other.zero
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Cuantilele `qs` (rânduri) pentru fiecare coloană (coloane); NaN pentru coloane fără valori."""
+        result = np.full((len(qs), len(self.columns)), np.nan)
+        for j in range(len(self.columns)):
+            neg = self.neg[j].sort_index(ascending=False)
+            pos = self.pos[j].sort_index()
+            # valoarea reprezentativă a găleții k: 2·γ^k / (γ + 1)
+            estimates = np.r_[-2 * self.gamma ** neg.index.to_numpy(dtype="float64") / (self.gamma + 1),
+                              0.0,
+                              2 * self.gamma ** pos.index.to_numpy(dtype="float64") / (self.gamma + 1)]
+            counts = np.r_[neg.to_numpy(), self.zero[j], pos.to_numpy()]
+            cum = counts.cumsum()
+            total = cum[-1] if len(cum) else 0
+            if total == 0:
+                continue
+            # interpolare liniară între rangurile vecine (ca în pandas / describe_all)
+            ranks = np.asarray(qs, dtype="float64") * (total - 1)
+            lo, hi = np.floor(ranks), np.ceil(ranks)
+            v_lo = estimates[np.searchsorted(cum, lo, side="right")]
+            v_hi = estimates[np.searchsorted(cum, hi, side="right")]
+            result[:, j] = v_lo + (v_hi - v_lo) * (ranks - lo)
+        return result
+
+    def to_dict(self) -> dict:
+        def store(series_list):
+            return [{str(k): float(v) for k, v in s.items()} for s in series_list]
+        return {
+            "columns": self.columns,
+            "relative_accuracy": self.relative_accuracy,
+            "pos": store(self.pos),
+            "neg": store(self.neg),
+            "zero": self.zero.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SchitaCuantile":
+        sketch = cls(data["columns"], data["relative_accuracy"])
+
+        def load(stores):
+            return [pd.Series({int(k): v for k, v in s.items()}, dtype="float64") for s in stores]
+        sketch.pos, sketch.neg = load(data["pos"]), load(data["neg"])
+        sketch.zero = np.array(data["zero"], dtype="float64")
+        return sketch
+
+
+def _json_key(key):
+    return key.item() if isinstance(key, np.generic) else key
+
+
+class StatisticiIncrementale:
+    """
+    Statistici descriptive actualizate incremental, pe tot setul de date sau pe grupuri
+    (by='an' / 'luna' / 'ora'): pentru fiecare grup un acumulator de momente și o schiță de cuantile.
+    Se pot combina între partiții (merge) și salva / încărca în JSON.
+    describe() întoarce același format ca motor_statistici.describe_all, deci tabelele
+    secțiunilor 3-5 (describe_table, percentile_table, group_table) se pot construi direct din el;
+    mediana și percentilele au eroarea relativă a schiței.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        by: Optional[str] = None,
+        relative_accuracy: float = 0.01,
+        percentiles: Sequence[float] = PERCENTILE
+    ):
+        self.columns = list(columns)
+        self.by = by
+        self.relative_accuracy = relative_accuracy
+        self.percentiles = list(percentiles)
+        self.groups: Dict[object, tuple] = {}
+
+    def _group(self, key) -> tuple:
+        if key not in self.groups:
+            self.groups[key] = (Momente(self.columns), SchitaCuantile(self.columns, self.relative_accuracy))
+        return self.groups[key]
+
+    def update(self, df: pd.DataFrame) -> "StatisticiIncrementale":
+        """Adaugă un lot de rânduri noi."""
+        values = df[self.columns].to_numpy(dtype="float64")
+        if self.by is None:
+            blocks = [(None, values)]
+        else:
+            codes, keys = pd.factorize(df[self.by], sort=True)
+            blocks = [(_json_key(key), values[codes == i]) for i, key in enumerate(keys)]
+        for key, block in blocks:
+            moments, sketch = self._group(key)
+            moments.update(block)
+            sketch.update(block)
+        return self
+
+    def merge(self, other: "StatisticiIncrementale") -> "StatisticiIncrementale":
+        """Combină acumulatorii altei partiții (aceleași coloane și aceeași grupare)."""
+        if other.columns != self.columns or other.by != self.by:
+            raise ValueError("Se pot combina doar acumulatori cu aceleași coloane și aceeași grupare.")
+        for key, (moments, sketch) in other.groups.items():
+            own_moments, own_sketch = self._group(key)
+            own_moments.merge(moments)
+            own_sketch.merge(sketch)
+        return self
+
+    def describe(self) -> pd.DataFrame:
+        """Statisticile curente, în formatul describe_all (un rând per coloană sau per (grup, coloană))."""
+        if not self.groups:
+            return pd.DataFrame()
+        keys = [None] if self.by is None else sorted(self.groups)
+        qs = [0.5] + self.percentiles
+        frames = []
+        for key in keys:
+            moments, sketch = self.groups[key]
+            stats = moments.stats()
+            quant = sketch.quantiles(qs)
+            ordered = {name: stats[name] for name in ["count", "mean"]}
+            ordered["median"] = quant[0]
+            ordered.update({name: stats[name] for name in
+                            ["std", "var", "min", "max", "range", "cv", "skew", "kurtosis"]})
+            for i, q in enumerate(self.percentiles, start=1):
+                ordered[percentile_label(q)] = quant[i]
+            frames.append(pd.DataFrame(ordered, index=pd.Index(self.columns)))
+        if self.by is None:
+            return frames[0]
+        return pd.concat(frames, keys=keys, names=[self.by, None])
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": self.columns,
+            "by": self.by,
+            "relative_accuracy": self.relative_accuracy,
+            "percentiles": self.percentiles,
+            "groups": [[key, m.to_dict(), s.to_dict()] for key, (m, s) in self.groups.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatisticiIncrementale":
+        acc = cls(data["columns"], data["by"], data["relative_accuracy"], data["percentiles"])
+        for key, moments, sketch in data["groups"]:
+            acc.groups[key] = (Momente.from_dict(moments), SchitaCuantile.from_dict(sketch))
+        return acc
+
+    def save(self, path: str) -> None:
+        _write_json(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path: str) -> "StatisticiIncrementale":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _write_json(path: str, data) -> None:
+    # scriere atomică: un cititor vede fie fișierul vechi, fie pe cel nou
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
+def build_statistics(df: pd.DataFrame) -> Dict[str, StatisticiIncrementale]:
+    """Acumulatorii COLOANE_STATISTICI pentru fiecare grupare din GRUPARI_STATISTICI, pe tot `df`."""
+    return {name: StatisticiIncrementale(COLOANE_STATISTICI, by).update(df)
+            for name, by in GRUPARI_STATISTICI.items()}
+
+
+def update_statistics(statistici: Dict[str, StatisticiIncrementale],
+                      df_new: pd.DataFrame) -> Dict[str, StatisticiIncrementale]:
+    """Adaugă rândurile noi în toți acumulatorii (costul depinde doar de df_new)."""
+    for acc in statistici.values():
+        acc.update(df_new)
+    return statistici
+
+
+def save_statistics(statistici: Dict[str, StatisticiIncrementale], path: str = STATISTICI_ENERGIE) -> None:
+    _write_json(path, {name: acc.to_dict() for name, acc in statistici.items()})
+
+
+def load_statistics(path: str = STATISTICI_ENERGIE) -> Dict[str, StatisticiIncrementale]:
+    with open(path, encoding="utf-8") as f:
+        return {name: StatisticiIncrementale.from_dict(data) for name, data in json.load(f).items()}
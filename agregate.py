@@ -0,0 +1,155 @@
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+COLOANE_ENERGIE = ["carbune", "consum", "hidro", "hidrocarburi", "nuclear",
+                   "eolian", "productie", "fotovolt", "biomasa", "stocare", "sold"]
+
+STATISTICI = ["sum", "mean", "std", "count", "min", "max"]
+
+# Agregatele parțiale se păstrează la nivel de (an, luna, zi, ora): se pot combina
+# între ele (adunare / min / max) și se pot restrânge la orice granularitate mai mare
+CHEI_PARTIALE = ["an", "luna", "zi", "ora"]
+STATISTICI_PARTIALE = ["sum", "count", "sumsq", "min", "max"]
+
+
+def partial_aggregates(df: pd.DataFrame, columns: List[str] = COLOANE_ENERGIE) -> pd.DataFrame:
+    """
+    Calculează agregatele combinabile (sum, count, sumsq, min, max) pe (an, luna, zi, ora).
+    Returnează DataFrame cu index CHEI_PARTIALE și coloane (col, statistică).
+    """
+    columns = [c for c in columns if c in df.columns]
+    values = df[columns].astype("float64")
+    keys = [df[k] for k in CHEI_PARTIALE]
+    grouped = values.groupby(keys)
+    parts = {
+        "sum": grouped.sum(),
+        "count": grouped.count(),
+        "sumsq": (values ** 2).groupby(keys).sum(),
+        "min": grouped.min(),
+        "max": grouped.max(),
+    }
+    partial = pd.concat(parts, axis=1).swaplevel(axis=1)
+    return partial.reindex(columns=pd.MultiIndex.from_product([columns, STATISTICI_PARTIALE]))
+
+
+def _combine(partial: pd.DataFrame, keys) -> pd.DataFrame:
+    """Combină agregate parțiale după `keys`: sum/count/sumsq se adună, min/max se păstrează."""
+    funcs = {c: c[1] if c[1] in ("min", "max") else "sum" for c in partial.columns}
+    return partial.groupby(keys).agg(funcs)
+
+
+def merge_aggregates(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Adaugă agregatele rândurilor noi la cele existente, fără a reciti istoricul."""
+    if old is None or old.empty:
+        return new
+    return _combine(pd.concat([old, new]), CHEI_PARTIALE)
+
+
+def _finalize(combined: pd.DataFrame) -> pd.DataFrame:
+    """Din sum/count/sumsq/min/max calculează STATISTICI (inclusiv medie și deviație standard)."""
+    columns = combined.columns.get_level_values(0).unique()
+    result = {}
+    for col in columns:
+        s, n, sq = combined[(col, "sum")], combined[(col, "count")], combined[(col, "sumsq")]
+        mean = s / n
+        var = ((sq - s * mean) / (n - 1)).where(n > 1).clip(lower=0)
+        result[(col, "sum")] = s
+        result[(col, "mean")] = mean
+        result[(col, "std")] = np.sqrt(var)
+        result[(col, "count")] = n
+        result[(col, "min")] = combined[(col, "min")]
+        result[(col, "max")] = combined[(col, "max")]
+    return pd.DataFrame(result)
+
+
+def cube_from_aggregates(partial: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Restrânge agregatele parțiale la structura folosită de dashboard.
+    Returnează dict bucket -> DataFrame cu index (an, bucket) și coloane (col, statistică),
+    pentru bucket în 'ora', 'zi_an', 'luna', plus 'an' (totaluri pe an, index doar an).
+    """
+    idx = partial.index
+    an = idx.get_level_values("an")
+    zi_an = pd.to_datetime(pd.DataFrame({
+        "year": an,
+        "month": idx.get_level_values("luna"),
+        "day": idx.get_level_values("zi"),
+    })).dt.dayofyear
+    chei = {
+        "ora": idx.get_level_values("ora"),
+        "zi_an": pd.Index(zi_an.to_numpy(), name="zi_an"),
+        "luna": idx.get_level_values("luna"),
+    }
+    cube = {}
+    for bucket, cheie in chei.items():
+        cube[bucket] = _finalize(_combine(partial, [an, cheie]))
+    cube["an"] = _finalize(_combine(partial, an))
+    return cube
+
+
+def build_cube(df: pd.DataFrame, columns: List[str] = COLOANE_ENERGIE) -> Dict[str, pd.DataFrame]:
+    """Construiește o singură dată agregatele folosite de dashboard (vezi cube_from_aggregates)."""
+    return cube_from_aggregates(partial_aggregates(df, columns))
+
+
+def save_aggregates(partial: pd.DataFrame, path: str) -> None:
+    """Salvează agregatele parțiale în CSV (coloane 'col__statistică')."""
+    flat = partial.copy()
+    flat.columns = [f"{col}__{stat}" for col, stat in flat.columns]
+    flat.reset_index().to_csv(path, index=False)
+
+
+def load_aggregates(path: str) -> pd.DataFrame:
+    """Citește agregatele parțiale salvate cu save_aggregates."""
+    flat = pd.read_csv(path, float_precision="round_trip").set_index(CHEI_PARTIALE)
+    flat.columns = pd.MultiIndex.from_tuples([tuple(c.split("__")) for c in flat.columns])
+    return flat
+
+
+def cube_series(
+    cube: Dict[str, pd.DataFrame],
+    bucket: str,
+    an: int,
+    columns: Union[str, List[str]],
+    stat: str
+) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Seria agregată pentru un an: index = bucket (ora / zi_an / luna), valori = `stat`.
+    - columns: o coloană -> Series; listă -> DataFrame cu o coloană per sursă
+    """
+    tabel = cube[bucket]
+    cols = [columns] if isinstance(columns, str) else list(columns)
+    if an in tabel.index.get_level_values("an"):
+        rezultat = tabel.xs(an, level="an")[[(c, stat) for c in cols]]
+    else:
+        rezultat = pd.DataFrame(columns=pd.MultiIndex.from_tuples([(c, stat) for c in cols]))
+    rezultat.columns = cols
+    return rezultat[columns] if isinstance(columns, str) else rezultat
+
+
+def cube_frame(
+    cube: Dict[str, pd.DataFrame],
+    bucket: str,
+    ani: List[int],
+    columns: List[str],
+    stat: str
+) -> pd.DataFrame:
+    """
+    Seriile agregate pentru mai mulți ani deodată (o singură selecție din cub):
+    index (an, bucket), o coloană per sursă. Anii lipsă din date sunt ignorați.
+    """
+    tabel = cube[bucket]
+    prezenti = [an for an in ani if an in tabel.index.get_level_values("an")]
+    rezultat = tabel.loc[tabel.index.get_level_values("an").isin(prezenti), [(c, stat) for c in columns]]
+    rezultat.columns = list(columns)
+    return rezultat
+
+
+def cube_value(cube: Dict[str, pd.DataFrame], an: int, column: str, stat: str) -> float:
+    """Statistica `stat` pentru întregul an (ex. total, medie, maxim); NaN pentru un an fără date."""
+    tabel = cube["an"]
+    if an not in tabel.index:
+        return np.nan
+    return tabel.loc[an, (column, stat)]
@@ -1,9 +1,23 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
+import os
+import threading
 from datetime import datetime
 
+from actualizare import AGREGATE_ENERGIE
+from autocorelatie import SURSE_DECALAJ, TINTE_DECALAJ, acf, ccf, lead_lag, pacf, regular_series
+from descompunere import (COLOANE_DESCOMPUNERE, DESCOMPUNERE_ENERGIE, decompose_data, is_decomposition_fresh,
+                          load_decomposition)
+from agregate import (CHEI_PARTIALE, COLOANE_ENERGIE, build_cube, cube_from_aggregates,
+                      cube_value, load_aggregates)
+from ferestre_mobile import COLOANE_MONITORIZARE, FRECVENTE, MonitorRulant, resample_energy, rolling_stats
+from grafice_energie import (GRANULARITATI, METRICI, area_figure, components_figure, forecast_figure, lag_figure,
+                             lines_figure, year_series)
+from incarcare import CSV_TRANSFORMAT, dataset_date_span, is_fresh, load_range, load_transformed
+from prognoza import MODELE_PROGNOZA, ORIZONT, TINTE_PROGNOZA, fit_models, forecast, load_models
+from randare import CacheImagini
+
 # Configurare pagină
 st.set_page_config(
     page_title="Dashboard Energie România",
@@ -34,15 +48,107 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# Încărcare date
+# Funcțiile din cache primesc `versiune` (versiune_date()): după o actualizare a datelor
+# cheia se schimbă și rezultatele vechi nu mai sunt refolosite
+
+# Încărcare date: doar lunile din intervalul cerut (setul partiționat an/lună), sortate după dată;
+# cache_resource: coloanele memory-mapped se păstrează ca atare (cache_data le-ar copia la fiecare citire)
+@st.cache_resource
+def load_interval(versiune, start, end, columns):
+    return load_range(start=start, end=end, columns=["date"] + list(columns))
+
+
 @st.cache_data
-def load_data():
-    df = pd.read_csv("energie_transformata.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    return df
+def load_date_span(versiune):
+    return dataset_date_span()
+
 
+# Descompunerea trend / sezonalitate: din depozitul salvat (convert.py / actualizare.py), dacă e la zi;
+# altfel calculată o dată pe tot istoricul coloanei și păstrată în cache (fără copie, ca load_interval)
+@st.cache_resource
+def load_components(versiune, column, start, end):
+    if is_decomposition_fresh():
+        return load_decomposition([column], start=start, end=end)
+    componente = decompose_data(load_range(columns=["date", column]), [column])
+    return componente[(componente.index >= start) & (componente.index < end)]
 
-df = load_data()
+
+# Modelele de prognoză: salvate de convert.py / actualizare.py, dacă sunt la zi, altfel antrenate o dată;
+# la fiecare rerulare se face doar inferența
+@st.cache_resource
+def get_models(versiune):
+    if is_fresh(MODELE_PROGNOZA, CSV_TRANSFORMAT):
+        return load_models(MODELE_PROGNOZA)
+    return fit_models(load_range(columns=["date"] + TINTE_PROGNOZA))
+
+
+# Agregate (sum/mean/std/count/min/max pe an × oră/zi/lună), calculate o singură dată
+@st.cache_data
+def load_cube(versiune):
+    # agregatele actualizate incremental (actualizare.py), dacă sunt la zi
+    if is_fresh(AGREGATE_ENERGIE, CSV_TRANSFORMAT):
+        return cube_from_aggregates(load_aggregates(AGREGATE_ENERGIE))
+    # doar coloanele necesare (din depozitul .npy, dacă există, fără copie)
+    return build_cube(load_transformed(columns=CHEI_PARTIALE + COLOANE_ENERGIE))
+
+
+# Monitorul ferestrelor mobile, partajat între sesiuni și reîncărcări: după o actualizare a datelor
+# primește doar rândurile noi, fără să recalculeze ferestrele pe tot istoricul
+# (cheia prima_data: un set reconstruit de convert.py pornește un monitor nou)
+ISTORIC_MONITOR = pd.Timedelta(days=7)
+
+
+@st.cache_resource
+def get_monitor(prima_data):
+    return {"monitor": MonitorRulant(COLOANE_MONITORIZARE, window="1h", freq="15min"),
+            "lock": threading.Lock(), "versiune": None, "rolling": None, "ewma": None}
+
+
+def refresh_monitor(stare, versiune):
+    """Trece prin monitor rândurile de după ultima dată procesată; păstrează ultimele ISTORIC_MONITOR."""
+    with stare["lock"]:
+        if stare["versiune"] == versiune:
+            return
+        monitor = stare["monitor"]
+        df_nou = load_range(start=monitor.last_date, columns=["date"] + COLOANE_MONITORIZARE)
+        df_nou = df_nou.dropna(subset=["date"])
+        if monitor.last_date is not None:
+            df_nou = df_nou[df_nou["date"] > monitor.last_date]
+        rezultat = monitor.update(df_nou)
+        for nume in ("rolling", "ewma"):
+            serie = rezultat[nume] if stare[nume] is None else pd.concat([stare[nume], rezultat[nume]])
+            if not serie.empty:
+                serie = serie[serie.index > serie.index[-1] - ISTORIC_MONITOR]
+            stare[nume] = serie
+        stare["versiune"] = versiune
+
+
+# Imaginile PNG ale graficelor, partajate între sesiuni (LRU, limitat în bytes)
+@st.cache_resource
+def get_render_cache():
+    return CacheImagini(max_bytes=64 * 1024 * 1024)
+
+
+def versiune_date():
+    """Momentul ultimei modificări a datelor: graficele vechi nu mai sunt refolosite după o actualizare."""
+    return tuple(os.path.getmtime(p) if os.path.exists(p) else None
+                 for p in (CSV_TRANSFORMAT, AGREGATE_ENERGIE, DESCOMPUNERE_ENERGIE, MODELE_PROGNOZA))
+
+
+def cheie_grafic(*selectie):
+    """Cheia din cache a unui grafic: versiunea datelor + toate selecțiile care îl determină."""
+    return (versiune_date(),) + selectie
+
+
+versiune = versiune_date()
+# fără înregistrări cu dată validă nu există nimic de afișat în niciun tab
+interval_date = load_date_span(versiune)
+if interval_date is None:
+    st.warning("⚠️ Setul de date nu conține înregistrări cu dată validă (rulează convert.py).")
+    st.stop()
+prima_data, ultima_data = interval_date
+cube = load_cube(versiune)
+cache_imagini = get_render_cache()
 
 # Titlu principal
 st.title("⚡ Dashboard Analiza Energiei Electrice România")
@@ -54,17 +160,49 @@ st.sidebar.header("🎛️ Configurare Analiză")
 # Selector tip analiză
 tip_analiza = st.sidebar.selectbox(
     "Selectează tipul de analiză:",
-    ["📊 Surse de Energie", "⚡ Producție", "💡 Consum", "⚖️ Comparație Producție-Consum"]
+    ["📊 Surse de Energie", "⚡ Producție", "💡 Consum", "⚖️ Comparație Producție-Consum",
+     "📅 Interval Personalizat", "📡 Monitorizare Sold", "🔁 Corelații Decalate", "📉 Trend și Sezonalitate", "🔮 Prognoză 24h"]
 )
 
 st.sidebar.markdown("---")
 
+# Textele tabului de surse: graficul arată producția fiecărei surse
+TAB_SURSE = {
+    "titluri": {"Orar": "Producție medie orară pe surse", "Zilnic": "Producție zilnică pe surse",
+                "Lunar": "Producție lunară pe surse"},
+}
+
+# Taburile cu o singură metrică au aceeași logică; diferă doar textele
+TABURI_METRICA = {
+    "⚡ Producție": {
+        "metrica": "productie",
+        "emoji": "⚡",
+        "header": "⚡ Analiza Producției Totale",
+        "titluri": {"Orar": "Producție medie orară", "Zilnic": "Producție zilnică", "Lunar": "Producție lunară"},
+        "medie": "📈 Producție Medie",
+        "maxim": "🔝 Producție Maximă",
+    },
+    "💡 Consum": {
+        "metrica": "consum",
+        "emoji": "💡",
+        "header": "💡 Analiza Consumului Total",
+        "titluri": {"Orar": "Consum mediu orar", "Zilnic": "Consum zilnic", "Lunar": "Consum lunar"},
+        "medie": "📈 Consum Mediu",
+        "maxim": "🔝 Consum Maxim",
+    },
+}
+ANI = [2024, 2025]
+
+# Grila corelațiilor decalate -> decalajele maxime oferite (în pași ai grilei) și unitatea
+DECALAJE = {
+    "Orar": {"maxime": [24, 72, 168, 336], "unitate": "ore"},
+    "Zilnic": {"maxime": [7, 14, 30, 90], "unitate": "zile"},
+}
+
 # ==================== ANALIZĂ SURSE DE ENERGIE ====================
 if tip_analiza == "📊 Surse de Energie":
     st.header("📊 Analiza Surselor de Energie")
 
-    col1, col2 = st.sidebar.columns(2)
-
     # Selectare surse
     surse_disponibile = ["carbune", "hidro", "hidrocarburi", "nuclear", "eolian", "fotovolt", "biomasa"]
     surse_selectate = st.sidebar.multiselect(
@@ -74,77 +212,31 @@ if tip_analiza == "📊 Surse de Energie":
     )
 
     # Selectare an
-    an_selectat = st.sidebar.selectbox("Selectează anul:", [2024, 2025])
+    an_selectat = st.sidebar.selectbox("Selectează anul:", ANI)
 
     # Selectare granularitate
     granularitate = st.sidebar.radio(
         "Granularitate date:",
-        ["Orar", "Zilnic", "Lunar"]
+        list(GRANULARITATI)
     )
 
     if surse_selectate:
-        # Filtrare date
-        df_filtrat = df[df["an"] == an_selectat].copy()
-
-        # Agregare în funcție de granularitate
-        if granularitate == "Orar":
-            df_agregat = df_filtrat.groupby("ora")[surse_selectate].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-            titlu = f"Producție medie orară - {an_selectat}"
-        elif granularitate == "Zilnic":
-            df_filtrat["zi_an"] = df_filtrat["date"].dt.dayofyear
-            df_agregat = df_filtrat.groupby("zi_an")[surse_selectate].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-            titlu = f"Producție zilnică - {an_selectat}"
-        else:  # Lunar
-            df_agregat = df_filtrat.groupby("luna")[surse_selectate].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-            titlu = f"Producție lunară - {an_selectat}"
-
-        # Creare grafic
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        culori = {
-            "carbune": "#4a4a4a",
-            "hidro": "#2196F3",
-            "hidrocarburi": "#795548",
-            "nuclear": "#9C27B0",
-            "eolian": "#00BCD4",
-            "fotovolt": "#FFC107",
-            "biomasa": "#4CAF50"
-        }
-
-        for sursa in surse_selectate:
-            ax.plot(df_agregat.index, df_agregat[sursa],
-                    label=sursa.capitalize(), linewidth=2.5,
-                    marker='o', markersize=6, color=culori[sursa], alpha=0.8)
-
-        ax.set_xlabel(x_label, fontsize=13, fontweight='bold')
-        ax.set_ylabel("Energie (MWh)", fontsize=13, fontweight='bold')
-        ax.set_title(titlu, fontsize=15, fontweight='bold', pad=20)
-        ax.legend(loc='best', fontsize=11, framealpha=0.9)
-        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
-
-        if x_ticks is not None:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.tight_layout()
-        st.pyplot(fig)
+        cheie = cheie_grafic(tip_analiza, an_selectat, granularitate, tuple(surse_selectate))
+        png = cache_imagini.get(cheie)
+        if png is None:
+            serii = year_series(cube, surse_selectate, [an_selectat], granularitate)
+            titlu = f"{TAB_SURSE['titluri'][granularitate]} - {an_selectat}"
+            png = cache_imagini.render(
+                cheie, lines_figure(serii[an_selectat], surse_selectate, granularitate, titlu))
+        st.image(png)
 
         # Statistici
         st.subheader("📈 Statistici Surse Selectate")
         col1, col2, col3 = st.columns(3)
 
         for i, sursa in enumerate(surse_selectate[:3]):
-            total = df_filtrat[sursa].sum()
-            medie = df_filtrat[sursa].mean()
+            total = cube_value(cube, an_selectat, sursa, "sum")
+            medie = cube_value(cube, an_selectat, sursa, "mean")
             with [col1, col2, col3][i]:
                 st.metric(
                     label=f"💡 {sursa.capitalize()}",
@@ -154,380 +246,110 @@ if tip_analiza == "📊 Surse de Energie":
     else:
         st.warning("⚠️ Te rog să selectezi cel puțin o sursă de energie!")
 
-# ==================== ANALIZĂ PRODUCȚIE ====================
-elif tip_analiza == "⚡ Producție":
-    st.header("⚡ Analiza Producției Totale")
+# ==================== ANALIZĂ PRODUCȚIE / CONSUM ====================
+elif tip_analiza in TABURI_METRICA:
+    tab = TABURI_METRICA[tip_analiza]
+    metrica = tab["metrica"]
+    eticheta = METRICI[metrica]["eticheta"]
+    st.header(tab["header"])
 
     # Selectare an
-    an_selectat = st.sidebar.selectbox("Selectează anul:", [2024, 2025, "Ambii ani"])
+    an_selectat = st.sidebar.selectbox("Selectează anul:", ANI + ["Ambii ani"])
 
     # Selectare granularitate
     granularitate = st.sidebar.radio(
         "Granularitate date:",
-        ["Orar", "Zilnic", "Lunar"]
+        list(GRANULARITATI)
     )
 
-    if an_selectat == "Ambii ani":
-        # Comparație între ani
-        df_2024 = df[df["an"] == 2024].copy()
-        df_2025 = df[df["an"] == 2025].copy()
-
-        if granularitate == "Orar":
-            df_2024_ag = df_2024.groupby("ora")["productie"].mean()
-            df_2025_ag = df_2025.groupby("ora")["productie"].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-        elif granularitate == "Zilnic":
-            df_2024["zi_an"] = df_2024["date"].dt.dayofyear
-            df_2025["zi_an"] = df_2025["date"].dt.dayofyear
-            df_2024_ag = df_2024.groupby("zi_an")["productie"].sum()
-            df_2025_ag = df_2025.groupby("zi_an")["productie"].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-        else:  # Lunar
-            df_2024_ag = df_2024.groupby("luna")["productie"].sum()
-            df_2025_ag = df_2025.groupby("luna")["productie"].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        ax.fill_between(df_2024_ag.index, 0, df_2024_ag.values,
-                        color="#4ECDC4", alpha=0.5, label="Producție 2024")
-        ax.plot(df_2024_ag.index, df_2024_ag.values,
-                color="#008B8B", linewidth=2.5, marker='o', markersize=7)
-
-        ax.fill_between(df_2025_ag.index, 0, df_2025_ag.values,
-                        color="#90EE90", alpha=0.5, label="Producție 2025")
-        ax.plot(df_2025_ag.index, df_2025_ag.values,
-                color="#228B22", linewidth=2.5, marker='s', markersize=7)
-
-        ax.set_xlabel(x_label, fontsize=13, fontweight='bold')
-        ax.set_ylabel("Producție (MWh)", fontsize=13, fontweight='bold')
-        ax.set_title(f"Comparație Producție {granularitate}: 2024 vs 2025", fontsize=15, fontweight='bold', pad=20)
-        ax.legend(loc='best', fontsize=12)
-        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        ax.set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.tight_layout()
-        st.pyplot(fig)
-
-        # Statistici comparative
-        st.subheader("📊 Comparație Statistici")
-        col1, col2 = st.columns(2)
-
-        total_2024 = df_2024["productie"].sum()
-        total_2025 = df_2025["productie"].sum()
-        diferenta = total_2025 - total_2024
-        procent = (diferenta / total_2024) * 100
-
-        with col1:
-            st.metric("⚡ Total Producție 2024", f"{total_2024:,.0f} MWh")
-        with col2:
-            st.metric("⚡ Total Producție 2025", f"{total_2025:,.0f} MWh",
-                      delta=f"{diferenta:+,.0f} MWh ({procent:+.1f}%)")
-
-    else:
-        # Un singur an
-        df_filtrat = df[df["an"] == an_selectat].copy()
-
-        if granularitate == "Orar":
-            df_agregat = df_filtrat.groupby("ora")["productie"].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-            titlu = f"Producție medie orară - {an_selectat}"
-        elif granularitate == "Zilnic":
-            df_filtrat["zi_an"] = df_filtrat["date"].dt.dayofyear
-            df_agregat = df_filtrat.groupby("zi_an")["productie"].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-            titlu = f"Producție zilnică - {an_selectat}"
-        else:  # Lunar
-            df_agregat = df_filtrat.groupby("luna")["productie"].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-            titlu = f"Producție lunară - {an_selectat}"
-
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        ax.fill_between(df_agregat.index, 0, df_agregat.values,
-                        color="#4ECDC4", alpha=0.7)
-        ax.plot(df_agregat.index, df_agregat.values,
-                color="#008B8B", linewidth=2.5, marker='o', markersize=7)
-
-        ax.set_xlabel(x_label, fontsize=13, fontweight='bold')
-        ax.set_ylabel("Producție (MWh)", fontsize=13, fontweight='bold')
-        ax.set_title(titlu, fontsize=15, fontweight='bold', pad=20)
-        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        ax.set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.tight_layout()
-        st.pyplot(fig)
-
-        # Statistici
-        total = df_filtrat["productie"].sum()
-        medie = df_filtrat["productie"].mean()
-        maxim = df_filtrat["productie"].max()
-
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("📊 Total Producție", f"{total:,.0f} MWh")
-        with col2:
-            st.metric("📈 Producție Medie", f"{medie:.1f} MWh")
-        with col3:
-            st.metric("🔝 Producție Maximă", f"{maxim:,.0f} MWh")
-
-# ==================== ANALIZĂ CONSUM ====================
-elif tip_analiza == "💡 Consum":
-    st.header("💡 Analiza Consumului Total")
-
-    # Selectare an
-    an_selectat = st.sidebar.selectbox("Selectează anul:", [2024, 2025, "Ambii ani"])
-
-    # Selectare granularitate
-    granularitate = st.sidebar.radio(
-        "Granularitate date:",
-        ["Orar", "Zilnic", "Lunar"]
-    )
+    ani = ANI if an_selectat == "Ambii ani" else [an_selectat]
 
-    if an_selectat == "Ambii ani":
-        # Comparație între ani
-        df_2024 = df[df["an"] == 2024].copy()
-        df_2025 = df[df["an"] == 2025].copy()
-
-        if granularitate == "Orar":
-            df_2024_ag = df_2024.groupby("ora")["consum"].mean()
-            df_2025_ag = df_2025.groupby("ora")["consum"].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-        elif granularitate == "Zilnic":
-            df_2024["zi_an"] = df_2024["date"].dt.dayofyear
-            df_2025["zi_an"] = df_2025["date"].dt.dayofyear
-            df_2024_ag = df_2024.groupby("zi_an")["consum"].sum()
-            df_2025_ag = df_2025.groupby("zi_an")["consum"].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-        else:  # Lunar
-            df_2024_ag = df_2024.groupby("luna")["consum"].sum()
-            df_2025_ag = df_2025.groupby("luna")["consum"].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        ax.fill_between(df_2024_ag.index, 0, df_2024_ag.values,
-                        color="#FF6B6B", alpha=0.5, label="Consum 2024")
-        ax.plot(df_2024_ag.index, df_2024_ag.values,
-                color="#CC0000", linewidth=2.5, marker='o', markersize=7)
-
-        ax.fill_between(df_2025_ag.index, 0, df_2025_ag.values,
-                        color="#FFA500", alpha=0.5, label="Consum 2025")
-        ax.plot(df_2025_ag.index, df_2025_ag.values,
-                color="#FF6500", linewidth=2.5, marker='s', markersize=7)
-
-        ax.set_xlabel(x_label, fontsize=13, fontweight='bold')
-        ax.set_ylabel("Consum (MWh)", fontsize=13, fontweight='bold')
-        ax.set_title(f"Comparație Consum {granularitate}: 2024 vs 2025", fontsize=15, fontweight='bold', pad=20)
-        ax.legend(loc='best', fontsize=12)
-        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        ax.set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.tight_layout()
-        st.pyplot(fig)
+    cheie = cheie_grafic(tip_analiza, an_selectat, granularitate)
+    png = cache_imagini.get(cheie)
+    if png is None:
+        serii = year_series(cube, [metrica], ani, granularitate)
+        if len(ani) > 1:
+            titlu = f"Comparație {eticheta} {granularitate}: 2024 vs 2025"
+        else:
+            titlu = f"{tab['titluri'][granularitate]} - {an_selectat}"
+        png = cache_imagini.render(cheie, area_figure(serii, [metrica], granularitate, [titlu]))
+    st.image(png)
 
+    if len(ani) > 1:
         # Statistici comparative
         st.subheader("📊 Comparație Statistici")
         col1, col2 = st.columns(2)
 
-        total_2024 = df_2024["consum"].sum()
-        total_2025 = df_2025["consum"].sum()
+        total_2024 = cube_value(cube, 2024, metrica, "sum")
+        total_2025 = cube_value(cube, 2025, metrica, "sum")
         diferenta = total_2025 - total_2024
         procent = (diferenta / total_2024) * 100
 
         with col1:
-            st.metric("💡 Total Consum 2024", f"{total_2024:,.0f} MWh")
+            st.metric(f"{tab['emoji']} Total {eticheta} 2024", f"{total_2024:,.0f} MWh")
         with col2:
-            st.metric("💡 Total Consum 2025", f"{total_2025:,.0f} MWh",
+            st.metric(f"{tab['emoji']} Total {eticheta} 2025", f"{total_2025:,.0f} MWh",
                       delta=f"{diferenta:+,.0f} MWh ({procent:+.1f}%)")
-
     else:
-        # Un singur an
-        df_filtrat = df[df["an"] == an_selectat].copy()
-
-        if granularitate == "Orar":
-            df_agregat = df_filtrat.groupby("ora")["consum"].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-            titlu = f"Consum mediu orar - {an_selectat}"
-        elif granularitate == "Zilnic":
-            df_filtrat["zi_an"] = df_filtrat["date"].dt.dayofyear
-            df_agregat = df_filtrat.groupby("zi_an")["consum"].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-            titlu = f"Consum zilnic - {an_selectat}"
-        else:  # Lunar
-            df_agregat = df_filtrat.groupby("luna")["consum"].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-            titlu = f"Consum lunar - {an_selectat}"
-
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        ax.fill_between(df_agregat.index, 0, df_agregat.values,
-                        color="#FF6B6B", alpha=0.7)
-        ax.plot(df_agregat.index, df_agregat.values,
-                color="#CC0000", linewidth=2.5, marker='o', markersize=7)
-
-        ax.set_xlabel(x_label, fontsize=13, fontweight='bold')
-        ax.set_ylabel("Consum (MWh)", fontsize=13, fontweight='bold')
-        ax.set_title(titlu, fontsize=15, fontweight='bold', pad=20)
-        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        ax.set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.tight_layout()
-        st.pyplot(fig)
-
         # Statistici
-        total = df_filtrat["consum"].sum()
-        medie = df_filtrat["consum"].mean()
-        maxim = df_filtrat["consum"].max()
+        total = cube_value(cube, an_selectat, metrica, "sum")
+        medie = cube_value(cube, an_selectat, metrica, "mean")
+        maxim = cube_value(cube, an_selectat, metrica, "max")
 
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("📊 Total Consum", f"{total:,.0f} MWh")
+            st.metric(f"📊 Total {eticheta}", f"{total:,.0f} MWh")
         with col2:
-            st.metric("📈 Consum Mediu", f"{medie:.1f} MWh")
+            st.metric(tab["medie"], f"{medie:.1f} MWh")
         with col3:
-            st.metric("🔝 Consum Maxim", f"{maxim:,.0f} MWh")
+            st.metric(tab["maxim"], f"{maxim:,.0f} MWh")
 
 # ==================== COMPARAȚIE PRODUCȚIE-CONSUM ====================
-else:  # Comparație Producție-Consum
+elif tip_analiza == "⚖️ Comparație Producție-Consum":
     st.header("⚖️ Comparație Producție vs Consum")
 
     # Selectare an
-    an_selectat = st.sidebar.selectbox("Selectează anul:", [2024, 2025, "Ambii ani"])
+    an_selectat = st.sidebar.selectbox("Selectează anul:", ANI + ["Ambii ani"])
 
     # Selectare granularitate
     granularitate = st.sidebar.radio(
         "Granularitate date:",
-        ["Orar", "Zilnic", "Lunar"]
+        list(GRANULARITATI)
     )
 
-    if an_selectat == "Ambii ani":
-        # Comparație pe ambii ani
-        df_2024 = df[df["an"] == 2024].copy()
-        df_2025 = df[df["an"] == 2025].copy()
-
-        if granularitate == "Lunar":
-            df_2024_ag = df_2024.groupby("luna")[["consum", "productie"]].sum()
-            df_2025_ag = df_2025.groupby("luna")[["consum", "productie"]].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-        elif granularitate == "Orar":
-            df_2024_ag = df_2024.groupby("ora")[["consum", "productie"]].mean()
-            df_2025_ag = df_2025.groupby("ora")[["consum", "productie"]].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-        else:  # Zilnic
-            df_2024["zi_an"] = df_2024["date"].dt.dayofyear
-            df_2025["zi_an"] = df_2025["date"].dt.dayofyear
-            df_2024_ag = df_2024.groupby("zi_an")[["consum", "productie"]].sum()
-            df_2025_ag = df_2025.groupby("zi_an")[["consum", "productie"]].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-
-        fig, axes = plt.subplots(2, 1, figsize=(14, 12), sharex=True)
-
-        # Grafic Consum
-        axes[0].fill_between(df_2024_ag.index, 0, df_2024_ag["consum"],
-                             color="#FF6B6B", alpha=0.5, label="Consum 2024")
-        axes[0].plot(df_2024_ag.index, df_2024_ag["consum"],
-                     color="#CC0000", linewidth=2, marker='o', markersize=6)
-
-        axes[0].fill_between(df_2025_ag.index, 0, df_2025_ag["consum"],
-                             color="#FFA500", alpha=0.5, label="Consum 2025")
-        axes[0].plot(df_2025_ag.index, df_2025_ag["consum"],
-                     color="#FF6500", linewidth=2, marker='s', markersize=6)
-
-        axes[0].set_ylabel("Consum (MWh)", fontsize=12, fontweight='bold')
-        axes[0].set_title(f"Comparație Consum {granularitate}: 2024 vs 2025", fontsize=13, fontweight='bold')
-        axes[0].legend(loc='upper left', fontsize=11)
-        axes[0].grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        axes[0].set_ylim(bottom=0)
-
-        # Grafic Producție
-        axes[1].fill_between(df_2024_ag.index, 0, df_2024_ag["productie"],
-                             color="#4ECDC4", alpha=0.5, label="Producție 2024")
-        axes[1].plot(df_2024_ag.index, df_2024_ag["productie"],
-                     color="#008B8B", linewidth=2, marker='o', markersize=6)
-
-        axes[1].fill_between(df_2025_ag.index, 0, df_2025_ag["productie"],
-                             color="#90EE90", alpha=0.5, label="Producție 2025")
-        axes[1].plot(df_2025_ag.index, df_2025_ag["productie"],
-                     color="#228B22", linewidth=2, marker='s', markersize=6)
-
-        axes[1].set_xlabel(x_label, fontsize=12, fontweight='bold')
-        axes[1].set_ylabel("Producție (MWh)", fontsize=12, fontweight='bold')
-        axes[1].set_title(f"Comparație Producție {granularitate}: 2024 vs 2025", fontsize=13, fontweight='bold')
-        axes[1].legend(loc='upper left', fontsize=11)
-        axes[1].grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        axes[1].set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            axes[1].set_xticks(x_ticks)
-            axes[1].set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.suptitle("Comparare anuală: Consum și Producție (2024 vs 2025)",
-                     fontsize=15, fontweight='bold', y=0.995)
-        plt.tight_layout()
-        st.pyplot(fig)
-
+    ani = ANI if an_selectat == "Ambii ani" else [an_selectat]
+    metrici = ["consum", "productie"]
+
+    cheie = cheie_grafic(tip_analiza, an_selectat, granularitate)
+    png = cache_imagini.get(cheie)
+    if png is None:
+        serii = year_series(cube, metrici, ani, granularitate)
+        if len(ani) > 1:
+            titluri = [f"Comparație Consum {granularitate}: 2024 vs 2025",
+                       f"Comparație Producție {granularitate}: 2024 vs 2025"]
+            suptitlu = "Comparare anuală: Consum și Producție (2024 vs 2025)"
+        else:
+            titluri = [f"Evoluția consumului - {an_selectat}", f"Evoluția producției - {an_selectat}"]
+            suptitlu = f"Comparare Consum și Producție - {an_selectat} ({granularitate})"
+        png = cache_imagini.render(cheie, area_figure(serii, metrici, granularitate, titluri, suptitlu))
+    st.image(png)
+
+    if len(ani) > 1:
         # Statistici Sold
         st.subheader("⚖️ Bilanț Energetic")
         col1, col2, col3, col4 = st.columns(4)
 
-        sold_2024 = df_2024["sold"].sum()
-        sold_2025 = df_2025["sold"].sum()
+        sold_2024 = cube_value(cube, 2024, "sold", "sum")
+        sold_2025 = cube_value(cube, 2025, "sold", "sum")
 
         with col1:
-            st.metric("💡 Consum 2024", f"{df_2024['consum'].sum():,.0f} MWh")
+            st.metric("💡 Consum 2024", f"{cube_value(cube, 2024, 'consum', 'sum'):,.0f} MWh")
         with col2:
-            st.metric("⚡ Producție 2024", f"{df_2024['productie'].sum():,.0f} MWh")
+            st.metric("⚡ Producție 2024", f"{cube_value(cube, 2024, 'productie', 'sum'):,.0f} MWh")
         with col3:
-            st.metric("💡 Consum 2025", f"{df_2025['consum'].sum():,.0f} MWh")
+            st.metric("💡 Consum 2025", f"{cube_value(cube, 2025, 'consum', 'sum'):,.0f} MWh")
         with col4:
-            st.metric("⚡ Producție 2025", f"{df_2025['productie'].sum():,.0f} MWh")
+            st.metric("⚡ Producție 2025", f"{cube_value(cube, 2025, 'productie', 'sum'):,.0f} MWh")
 
         col1, col2 = st.columns(2)
         with col1:
@@ -536,68 +358,11 @@ else:  # Comparație Producție-Consum
         with col2:
             culoare_2025 = "🟢" if sold_2025 >= 0 else "🔴"
             st.metric(f"{culoare_2025} Sold 2025", f"{sold_2025:+,.0f} MWh")
-
     else:
-        # Un singur an
-        df_filtrat = df[df["an"] == an_selectat].copy()
-
-        if granularitate == "Orar":
-            df_agregat = df_filtrat.groupby("ora")[["consum", "productie"]].mean()
-            x_label = "Ora"
-            x_ticks = range(0, 24)
-            x_labels = [f"{h}:00" for h in range(0, 24)]
-        elif granularitate == "Zilnic":
-            df_filtrat["zi_an"] = df_filtrat["date"].dt.dayofyear
-            df_agregat = df_filtrat.groupby("zi_an")[["consum", "productie"]].sum()
-            x_label = "Ziua anului"
-            x_ticks = None
-            x_labels = None
-        else:  # Lunar
-            df_agregat = df_filtrat.groupby("luna")[["consum", "productie"]].sum()
-            x_label = "Luna"
-            x_ticks = range(1, 13)
-            x_labels = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
-
-        fig, axes = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
-
-        # Grafic Consum
-        axes[0].fill_between(df_agregat.index, 0, df_agregat["consum"],
-                             color="#FF6B6B", alpha=0.7, label="Consum")
-        axes[0].plot(df_agregat.index, df_agregat["consum"],
-                     color="#CC0000", linewidth=2.5, alpha=0.9, marker='o', markersize=7)
-
-        axes[0].set_ylabel("Consum (MWh)", fontsize=12, fontweight='bold')
-        axes[0].set_title(f"Evoluția consumului - {an_selectat}", fontsize=13, fontweight='bold')
-        axes[0].legend(loc='upper left', fontsize=11)
-        axes[0].grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        axes[0].set_ylim(bottom=0)
-
-        # Grafic Producție
-        axes[1].fill_between(df_agregat.index, 0, df_agregat["productie"],
-                             color="#4ECDC4", alpha=0.7, label="Producție")
-        axes[1].plot(df_agregat.index, df_agregat["productie"],
-                     color="#008B8B", linewidth=2.5, alpha=0.9, marker='o', markersize=7)
-
-        axes[1].set_xlabel(x_label, fontsize=12, fontweight='bold')
-        axes[1].set_ylabel("Producție (MWh)", fontsize=12, fontweight='bold')
-        axes[1].set_title(f"Evoluția producției - {an_selectat}", fontsize=13, fontweight='bold')
-        axes[1].legend(loc='upper left', fontsize=11)
-        axes[1].grid(alpha=0.3, linestyle='--', linewidth=0.7)
-        axes[1].set_ylim(bottom=0)
-
-        if x_ticks is not None:
-            axes[1].set_xticks(x_ticks)
-            axes[1].set_xticklabels(x_labels, rotation=45 if granularitate == "Orar" else 0)
-
-        plt.suptitle(f"Comparare Consum și Producție - {an_selectat} ({granularitate})",
-                     fontsize=15, fontweight='bold', y=0.995)
-        plt.tight_layout()
-        st.pyplot(fig)
-
         # Statistici
-        total_consum = df_filtrat["consum"].sum()
-        total_productie = df_filtrat["productie"].sum()
-        sold = df_filtrat["sold"].sum()
+        total_consum = cube_value(cube, an_selectat, "consum", "sum")
+        total_productie = cube_value(cube, an_selectat, "productie", "sum")
+        sold = cube_value(cube, an_selectat, "sold", "sum")
 
         st.subheader("📊 Statistici Generale")
         col1, col2, col3 = st.columns(3)
@@ -610,6 +375,256 @@ else:  # Comparație Producție-Consum
             culoare = "🟢" if sold >= 0 else "🔴"
             st.metric(f"{culoare} Sold Energetic", f"{sold:+,.0f} MWh")
 
+# ==================== INTERVAL PERSONALIZAT ====================
+elif tip_analiza == "📅 Interval Personalizat":
+    st.header("📅 Analiza pe un Interval de Timp")
+
+    interval = st.sidebar.date_input(
+        "Selectează intervalul:",
+        value=(prima_data.date(), ultima_data.date()),
+        min_value=prima_data.date(),
+        max_value=ultima_data.date()
+    )
+
+    coloane_selectate = st.sidebar.multiselect(
+        "Selectează variabilele:",
+        COLOANE_ENERGIE,
+        default=["consum", "productie"]
+    )
+
+    granularitate = st.sidebar.radio(
+        "Granularitate date:",
+        list(FRECVENTE)
+    )
+
+    fereastra = st.sidebar.selectbox(
+        "Medie mobilă (fereastră):",
+        ["Fără", "6h", "1D", "7D"]
+    )
+
+    # date_input întoarce o singură dată cât timp utilizatorul alege capătul intervalului
+    if len(interval) != 2:
+        st.info("ℹ️ Selectează și data de final a intervalului.")
+    elif not coloane_selectate:
+        st.warning("⚠️ Te rog să selectezi cel puțin o variabilă!")
+    else:
+        data_start, data_final = interval
+        # capătul din dreapta e inclusiv în selector -> [start, final + 1 zi)
+        df_interval = load_interval(versiune, pd.Timestamp(data_start),
+                                    pd.Timestamp(data_final) + pd.Timedelta(days=1),
+                                    tuple(coloane_selectate))
+
+        if df_interval.empty:
+            st.warning("⚠️ Nu există date în intervalul selectat.")
+        else:
+            cheie = cheie_grafic(tip_analiza, data_start, data_final, tuple(coloane_selectate), granularitate, fereastra)
+            png = cache_imagini.get(cheie)
+            if png is None:
+                df_agregat = resample_energy(df_interval, coloane_selectate, FRECVENTE[granularitate])
+                df_mobil = None
+                if fereastra != "Fără":
+                    df_mobil = rolling_stats(df_interval, coloane_selectate, window=fereastra, stats=["mean"])
+                    df_mobil = df_mobil.xs("mean", axis=1, level=1)
+                titlu = f"Valori medii ({granularitate.lower()}) - {data_start} → {data_final}"
+                png = cache_imagini.render(
+                    cheie, lines_figure(df_agregat, coloane_selectate, None, titlu, rolling=df_mobil,
+                                        rolling_label=f"medie mobilă {fereastra}"))
+            st.image(png)
+
+            # Statistici
+            st.subheader("📈 Statistici Interval")
+            st.caption(f"{len(df_interval):,} înregistrări")
+            coloane_metrici = st.columns(min(len(coloane_selectate), 3))
+            for i, col in enumerate(coloane_selectate[:3]):
+                with coloane_metrici[i]:
+                    st.metric(
+                        label=f"💡 {col.capitalize()}",
+                        value=f"{df_interval[col].sum():,.0f} MWh",
+                        delta=f"Medie: {df_interval[col].mean():.1f} MWh"
+                    )
+
+# ==================== MONITORIZARE SOLD ====================
+elif tip_analiza == "📡 Monitorizare Sold":
+    st.header("📡 Monitorizare Sold - Ferestre Mobile")
+
+    coloane_selectate = st.sidebar.multiselect(
+        "Selectează variabilele:",
+        COLOANE_MONITORIZARE,
+        default=["sold"]
+    )
+
+    if not coloane_selectate:
+        st.warning("⚠️ Te rog să selectezi cel puțin o variabilă!")
+    else:
+        stare = get_monitor(prima_data)
+        refresh_monitor(stare, versiune)
+        mobil, netezit = stare["rolling"], stare["ewma"]
+
+        if mobil.empty:
+            st.warning("⚠️ Nu există date pentru monitorizare.")
+        else:
+            cheie = cheie_grafic(tip_analiza, tuple(coloane_selectate))
+            png = cache_imagini.get(cheie)
+            if png is None:
+                medii = stare["monitor"].resampled()
+                medii = medii[medii.index > mobil.index[-1] - ISTORIC_MONITOR]
+                titlu = f"Medii pe 15 minute - ultimele 7 zile până la {mobil.index[-1]:%Y-%m-%d %H:%M}"
+                png = cache_imagini.render(
+                    cheie, lines_figure(medii, coloane_selectate, None, titlu,
+                                        rolling=mobil.xs("mean", axis=1, level=1), rolling_label="medie mobilă 1h"))
+            st.image(png)
+
+            # Ultima fereastră de o oră, per variabilă
+            st.subheader("📈 Ultima Fereastră (1h)")
+            ultima = mobil.iloc[-1]
+            coloane_metrici = st.columns(len(coloane_selectate))
+            for i, col in enumerate(coloane_selectate):
+                with coloane_metrici[i]:
+                    st.metric(
+                        label=f"📊 {col.capitalize()} (medie mobilă)",
+                        value=f"{ultima[(col, 'mean')]:,.0f} MWh",
+                        delta=f"EWMA: {netezit[col].iloc[-1]:,.0f} MWh"
+                    )
+                    st.caption(f"min {ultima[(col, 'min')]:,.0f} · max {ultima[(col, 'max')]:,.0f} MWh")
+            st.caption("Monitorul se actualizează doar cu rândurile adăugate de actualizare.py")
+
+# ==================== CORELAȚII DECALATE ====================
+elif tip_analiza == "🔁 Corelații Decalate":
+    st.header("🔁 Corelații Decalate între Surse și Consum")
+
+    surse_selectate = st.sidebar.multiselect(
+        "Selectează sursele:",
+        COLOANE_ENERGIE,
+        default=SURSE_DECALAJ
+    )
+
+    tinte_selectate = st.sidebar.multiselect(
+        "Selectează țintele:",
+        ["consum", "sold", "productie"],
+        default=TINTE_DECALAJ
+    )
+
+    granularitate = st.sidebar.radio(
+        "Granularitate date:",
+        list(DECALAJE)
+    )
+
+    decalaj_maxim = st.sidebar.selectbox(
+        f"Decalaj maxim ({DECALAJE[granularitate]['unitate']}):",
+        DECALAJE[granularitate]["maxime"],
+        index=min(2, len(DECALAJE[granularitate]["maxime"]) - 1)
+    )
+
+    if not surse_selectate or not tinte_selectate:
+        st.warning("⚠️ Te rog să selectezi cel puțin o sursă și o țintă!")
+    else:
+        coloane = tuple(dict.fromkeys(surse_selectate + tinte_selectate))
+        df_interval = load_interval(versiune, prima_data, ultima_data + pd.Timedelta(seconds=1), coloane)
+        serii = regular_series(df_interval, list(coloane), FRECVENTE[granularitate])
+        corelatii = ccf(serii, surse_selectate, tinte_selectate, decalaj_maxim)
+
+        cheie = cheie_grafic(tip_analiza, coloane, tuple(tinte_selectate), granularitate, decalaj_maxim)
+        png = cache_imagini.get(cheie)
+        if png is None:
+            autocorelatii = acf(serii[tinte_selectate], decalaj_maxim)
+            unitate = DECALAJE[granularitate]["unitate"]
+            paneluri = {
+                "Corelație încrucișată (decalaj > 0 → sursa precede ținta)": corelatii,
+                "Autocorelație (ACF)": autocorelatii,
+            }
+            # PACF (Durbin-Levinson) cere ACF la toate decalajele: de regulă doar pe grila zilnică
+            if autocorelatii.notna().all().all():
+                paneluri["Autocorelație parțială (PACF)"] = pacf(autocorelatii)
+            png = cache_imagini.render(cheie, lag_figure(paneluri, f"Decalaj ({unitate})"))
+        st.image(png)
+
+        # Decalajul cu corelația maximă pentru fiecare pereche
+        st.subheader("📈 Decalajul cu Corelația Maximă")
+        tabel = lead_lag(corelatii, freq=None).rename(columns={
+            "sursa": "Sursă", "tinta": "Țintă", "corelatie_0": "Corelație (0)",
+            "decalaj": f"Decalaj ({DECALAJE[granularitate]['unitate']})", "corelatie_max": "Corelație maximă"})
+        st.dataframe(tabel.round(3), hide_index=True)
+        st.caption(f"{serii[tinte_selectate[0]].notna().mean():.1%} din intervalele grilei au măsurători; "
+                   "fiecare decalaj folosește doar perechile prezente")
+
+# ==================== TREND ȘI SEZONALITATE ====================
+elif tip_analiza == "📉 Trend și Sezonalitate":
+    st.header("📉 Descompunere în Trend și Sezonalitate")
+
+    coloana = st.sidebar.selectbox("Selectează variabila:", COLOANE_DESCOMPUNERE)
+
+    interval = st.sidebar.date_input(
+        "Selectează intervalul:",
+        value=(prima_data.date(), ultima_data.date()),
+        min_value=prima_data.date(),
+        max_value=ultima_data.date()
+    )
+
+    if len(interval) != 2:
+        st.info("ℹ️ Selectează și data de final a intervalului.")
+    else:
+        data_start, data_final = interval
+        componente = load_components(versiune, coloana, pd.Timestamp(data_start),
+                                     pd.Timestamp(data_final) + pd.Timedelta(days=1))[coloana]
+
+        if componente["observat"].notna().sum() == 0:
+            st.warning("⚠️ Nu există date în intervalul selectat.")
+        else:
+            cheie = cheie_grafic(tip_analiza, coloana, data_start, data_final)
+            png = cache_imagini.get(cheie)
+            if png is None:
+                titlu = f"{coloana.capitalize()}: trend și sezonalitate - {data_start} → {data_final}"
+                png = cache_imagini.render(cheie, components_figure(componente, titlu))
+            st.image(png)
+
+            # Amplitudinea fiecărei componente în interval
+            st.subheader("📈 Amplitudinea Componentelor")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                trend = componente["trend"].dropna()
+                st.metric("📈 Trend", f"{trend.iloc[-1]:,.0f} MWh",
+                          delta=f"{trend.iloc[-1] - trend.iloc[0]:+,.0f} MWh în interval")
+            with col2:
+                zilnic = componente["zilnic"]
+                st.metric("🕐 Variație zilnică", f"{zilnic.max() - zilnic.min():,.0f} MWh")
+            with col3:
+                saptamanal = componente["saptamanal"]
+                st.metric("📅 Variație săptămânală", f"{saptamanal.max() - saptamanal.min():,.0f} MWh")
+            st.caption(f"Abaterea standard a rezidualului: {componente['rezidual'].std():,.1f} MWh")
+
+# ==================== PROGNOZĂ 24H ====================
+elif tip_analiza == "🔮 Prognoză 24h":
+    st.header("🔮 Prognoză pe Următoarele 24 de Ore")
+
+    tinte_selectate = st.sidebar.multiselect(
+        "Selectează variabilele:",
+        TINTE_PROGNOZA,
+        default=TINTE_PROGNOZA
+    )
+
+    if not tinte_selectate:
+        st.warning("⚠️ Te rog să selectezi cel puțin o variabilă!")
+    else:
+        modele = get_models(versiune)
+        prognoze = forecast(modele, ORIZONT)
+
+        cheie = cheie_grafic(tip_analiza, tuple(tinte_selectate))
+        png = cache_imagini.get(cheie)
+        if png is None:
+            origine = prognoze.index[0]
+            observat = load_interval(versiune, origine - pd.Timedelta(days=3), origine, tuple(TINTE_PROGNOZA))
+            titlu = f"Prognoză {ORIZONT} - de la {origine:%Y-%m-%d %H:%M}"
+            png = cache_imagini.render(cheie, forecast_figure(observat, prognoze, tinte_selectate, titlu))
+        st.image(png)
+
+        # Valorile prognozate, per model
+        st.subheader("📋 Valori Prognozate")
+        tabel = prognoze.loc[:, (slice(None), tinte_selectate)].round(0)
+        tabel.columns = [f"{model} · {tinta}" for model, tinta in tabel.columns]
+        st.dataframe(tabel)
+        st.caption("Modelele se actualizează incremental la fiecare import de date noi (actualizare.py); "
+                   "comparația lor pe istoric: python prognoza.py (backtest cu origine mobilă)")
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -0,0 +1,162 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import fft
+
+from ferestre_mobile import resample_energy
+
+# Sursele variabile și mărimile față de care se caută decalajul
+SURSE_DECALAJ = ["eolian", "fotovolt", "hidro"]
+TINTE_DECALAJ = ["consum", "sold"]
+
+
+def regular_series(df: pd.DataFrame, columns: Sequence[str], freq: str = "h") -> pd.DataFrame:
+    """
+    Seriile pe grila regulată `freq` (media pe interval); intervalele fără măsurători rămân NaN
+    și sunt excluse din perechile folosite de acf / ccf, fără interpolare.
+    """
+    return resample_energy(df, columns, freq)
+
+
+def _spectra(values: np.ndarray, nlags: int):
+    """
+    Transformatele Fourier (pe coloane) ale seriilor centrate, cu golurile puse pe 0, și ale
+    măștilor de valori prezente. Lungimea FFT acoperă n + nlags, deci produsele nu se suprapun circular.
+    """
+    valid = ~np.isnan(values)
+    centered = np.where(valid, values - np.nanmean(values, axis=0), 0.0)
+    nfft = fft.next_fast_len(len(values) + nlags, real=True)
+    return (fft.rfft(centered, n=nfft, axis=0, workers=-1),
+            fft.rfft(valid.astype("float64"), n=nfft, axis=0, workers=-1), nfft)
+
+
+def _lag_sums(a: np.ndarray, b: np.ndarray, nfft: int) -> np.ndarray:
+    """sum_t a_t * b_(t+k) pentru toate decalajele k (k negativ la finalul vectorului)."""
+    return fft.irfft(np.conj(a) * b, n=nfft, axis=0, workers=-1)
+
+
+def acf(series: pd.DataFrame, nlags: int, adjusted: bool = True) -> pd.DataFrame:
+    """
+    Autocorelația fiecărei coloane pentru decalajele 0..nlags, prin FFT (O(n log n), toate
+    decalajele și toate coloanele într-o singură trecere).
+    - adjusted: True -> fiecare decalaj e normalizat cu numărul de perechi prezente la acel
+      decalaj (corect pe serii cu goluri; NaN unde nu există perechi); False -> estimatorul
+      clasic, împărțit la n (seriile fără goluri dau aceleași valori ca statsmodels.acf)
+    Index: decalajul în pași ai grilei; attrs['pairs'] are numărul de perechi pe decalaj.
+    """
+    values = series.to_numpy(dtype="float64")
+    spec, mask, nfft = _spectra(values, nlags)
+    sums = _lag_sums(spec, spec, nfft)[:nlags + 1]
+    pairs = np.rint(_lag_sums(mask, mask, nfft)[:nlags + 1])
+    if adjusted:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = np.where(pairs > 0, sums / pairs, np.nan)
+    else:
+        cov = sums
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = cov / cov[0]
+    index = pd.RangeIndex(nlags + 1, name="decalaj")
+    result = pd.DataFrame(result, index=index, columns=series.columns)
+    result.attrs["pairs"] = pd.DataFrame(pairs, index=index, columns=series.columns)
+    return result
+
+
+def pacf(acf_values: pd.DataFrame) -> pd.DataFrame:
+    """
+    Autocorelația parțială din ACF (recursia Durbin-Levinson, vectorizată pe coloane).
+    După primul decalaj cu ACF lipsă, valorile rămân NaN: pe serii cu goluri se folosește
+    o grilă mai rară (ex. 'D').
+    """
+    r = acf_values.to_numpy(dtype="float64")
+    nlags = len(r) - 1
+    result = np.full_like(r, np.nan)
+    result[0] = 1.0
+    if nlags == 0:
+        return pd.DataFrame(result, index=acf_values.index, columns=acf_values.columns)
+
+    phi = np.zeros((nlags + 1, r.shape[1]))
+    phi[1] = r[1]
+    result[1] = r[1]
+    sigma = 1.0 - r[1] ** 2
+    for k in range(2, nlags + 1):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            phi_kk = (r[k] - (phi[1:k] * r[k - 1:0:-1]).sum(axis=0)) / sigma
+        phi[1:k] = phi[1:k] - phi_kk * phi[k - 1:0:-1]
+        phi[k] = phi_kk
+        result[k] = phi_kk
+        sigma = sigma * (1.0 - phi_kk ** 2)
+    return pd.DataFrame(result, index=acf_values.index, columns=acf_values.columns)
+
+
+def ccf(
+    series: pd.DataFrame,
+    sources: Sequence[str] = SURSE_DECALAJ,
+    targets: Sequence[str] = TINTE_DECALAJ,
+    nlags: int = 168,
+    adjusted: bool = True
+) -> pd.DataFrame:
+    """
+    Corelația încrucișată corr(sursa_t, tinta_(t+k)) pentru k = -nlags..nlags, pentru toate
+    perechile (sursă, țintă); fiecare coloană trece o singură dată prin FFT.
+    Un maxim la k > 0 înseamnă că sursa precede ținta cu k pași ai grilei.
+    - adjusted: ca la acf (normalizare cu numărul de perechi prezente la fiecare decalaj)
+    Coloane MultiIndex (sursa, tinta); attrs['pairs'] are numărul de perechi pe decalaj.
+    """
+    columns = list(dict.fromkeys(list(sources) + list(targets)))
+    values = series[columns].to_numpy(dtype="float64")
+    spec, mask, nfft = _spectra(values, nlags)
+    pos = {col: i for i, col in enumerate(columns)}
+    lags = np.arange(-nlags, nlags + 1)
+
+    # sumele de pătrate ale abaterilor și numărul de valori prezente, per coloană
+    ss = np.nansum((values - np.nanmean(values, axis=0)) ** 2, axis=0)
+    n_valid = (~np.isnan(values)).sum(axis=0)
+
+    data, pairs, keys = [], [], []
+    for src in sources:
+        for tgt in targets:
+            i, j = pos[src], pos[tgt]
+            sums = _lag_sums(spec[:, i], spec[:, j], nfft)[lags]
+            n_pairs = np.rint(_lag_sums(mask[:, i], mask[:, j], nfft)[lags])
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if adjusted:
+                    scale = np.sqrt(ss[i] / n_valid[i] * ss[j] / n_valid[j])
+                    values_k = np.where(n_pairs > 0, sums / n_pairs, np.nan) / scale
+                else:
+                    values_k = sums / np.sqrt(ss[i] * ss[j])
+            data.append(values_k)
+            pairs.append(n_pairs)
+            keys.append((src, tgt))
+
+    index = pd.Index(lags, name="decalaj")
+    names = pd.MultiIndex.from_tuples(keys, names=["sursa", "tinta"])
+    result = pd.DataFrame(np.column_stack(data), index=index, columns=names)
+    result.attrs["pairs"] = pd.DataFrame(np.column_stack(pairs), index=index, columns=names)
+    return result
+
+
+def lead_lag(ccf_values: pd.DataFrame, freq: Optional[str] = "h", min_pairs: int = 30) -> pd.DataFrame:
+    """
+    Pentru fiecare pereche: corelația la același moment și decalajul cu |corelația| maximă,
+    ignorând decalajele cu mai puțin de `min_pairs` perechi (estimări instabile).
+    - freq: pasul grilei, pentru exprimarea decalajului ca durată (None -> doar în pași)
+    """
+    pairs = ccf_values.attrs.get("pairs")
+    values = ccf_values if pairs is None else ccf_values.where(pairs >= min_pairs)
+    rows = []
+    for sursa, tinta in values.columns:
+        col = values[(sursa, tinta)]
+        k = col.abs().idxmax() if col.notna().any() else np.nan
+        rows.append({
+            "sursa": sursa,
+            "tinta": tinta,
+            "corelatie_0": col.get(0, np.nan),
+            "decalaj": k,
+            "corelatie_max": col[k] if not pd.isna(k) else np.nan,
+        })
+    result = pd.DataFrame(rows)
+    if freq is not None:
+        pas = pd.to_timedelta(pd.tseries.frequencies.to_offset(freq))
+        result["decalaj_timp"] = [pas * k if not pd.isna(k) else pd.NaT for k in result["decalaj"]]
+    return result
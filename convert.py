@@ -1,27 +1,124 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
-def transform_data(df: pd.DataFrame) -> pd.DataFrame:
+ZILE_SAPTAMANA = ["monday", "tuesday", "wednesday", "thursday",
+                  "friday", "saturday", "sunday"]
+
+# Formatul coloanei 'date' din fișierele brute
+FORMAT_DATA = "%Y-%m-%d %H:%M:%S"
+
+# Schema compactă a datelor transformate (MW încap în int16, totalurile în int32)
+SCHEMA = {
+    "carbune": "int16",
+    "consum": "int32",
+    "hidro": "int16",
+    "hidrocarburi": "int16",
+    "nuclear": "int16",
+    "eolian": "int16",
+    "productie": "int32",
+    "fotovolt": "int16",
+    "biomasa": "int16",
+    "stocare": "int16",
+    "sold": "int32",
+    "an": "uint16",
+    "luna": "uint8",
+    "zi": "uint8",
+    "ora": "uint8",
+    "minut": "uint8",
+    "zi_saptamana": pd.CategoricalDtype(categories=ZILE_SAPTAMANA),
+    "raport_pret_calitate": "float32",
+}
+
+def parse_dates(values: pd.Series, strict: bool = False) -> pd.Series:
+    """
+    Parsează coloana 'date' cu formatul fix FORMAT_DATA (fără inferența formatului).
+    - strict: True -> ridică ValueError la prima valoare care nu respectă formatul;
+      False -> valorile care nu respectă formatul se mai încearcă o dată cu
+      inferență (format="mixed"), iar cele care nu pot fi parsate devin NaT
+    """
+    if strict:
+        return pd.to_datetime(values, format=FORMAT_DATA, errors="raise")
+    dates = pd.to_datetime(values, format=FORMAT_DATA, errors="coerce")
+    failed = dates.isna() & values.notna()
+    if failed.any():
+        retry = pd.to_datetime(values[failed], format="mixed", errors="coerce")
+        dates = dates.copy()
+        dates[failed] = retry.astype(dates.dtype)
+    return dates
+
+
+def calendar_fields(dates: pd.Series) -> dict:
+    """
+    Componentele calendaristice (an, luna, zi, ora, minut, zi_saptamana) calculate
+    într-o singură trecere vectorizată din valorile int64 ale coloanei datetime
+    (algoritmul civil-from-days, fără accesori .dt separați).
+    Fără NaT, coloanele au direct tipurile din SCHEMA; cu NaT sunt float64 cu NaN.
+    zi_saptamana este categorie cu cele 7 niveluri din ZILE_SAPTAMANA.
+    """
+    values = dates.to_numpy()
+    nat = np.isnat(values)
+    seconds = values.astype("datetime64[s]").view("int64")
+    if nat.any():
+        seconds = np.where(nat, 0, seconds)
+
+    days, sec_of_day = np.divmod(seconds, 86_400)
+    # 1970-01-01 a fost joi (monday = 0)
+    weekday = (days + 3) % 7
+
+    z = days + 719_468
+    era = z // 146_097
+    doe = z - era * 146_097
+    yoe = (doe - doe // 1_460 + doe // 36_524 - doe // 146_096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+
+    fields = {
+        "an": year,
+        "luna": month,
+        "zi": day,
+        "ora": sec_of_day // 3_600,
+        "minut": sec_of_day % 3_600 // 60,
+    }
+    index = dates.index
+    for col, arr in fields.items():
+        if nat.any():
+            arr = np.where(nat, np.nan, arr)
+        else:
+            arr = arr.astype(SCHEMA[col])
+        fields[col] = pd.Series(arr, index=index, name=col)
+
+    codes = np.where(nat, -1, weekday).astype("int8")
+    fields["zi_saptamana"] = pd.Series(
+        pd.Categorical.from_codes(codes, dtype=SCHEMA["zi_saptamana"]), index=index, name="zi_saptamana"
+    )
+    return fields
+
+
+def transform_data(df: pd.DataFrame, copy: bool = True, strict: bool = False) -> pd.DataFrame:
     """
     Transformări:
       1. Descompunere coloana 'date' în an, luna, zi, ora, minut, zi_saptamana
       2. Convertire coloane numerice la tip numeric
-      3. Standardizare categorice
-      4. Creare variabilă nouă raport_pret_calitate
+      3. Creare variabilă nouă raport_pret_calitate
+    - copy: False -> transformă direct DataFrame-ul primit (util pentru chunk-uri
+      citite din CSV, care nu mai sunt folosite în altă parte)
+    - strict: True -> o dată care nu respectă FORMAT_DATA ridică ValueError
+      (implicit devine NaT, vezi parse_dates)
     """
 
-    df_trans = df.copy()
+    df_trans = df.copy() if copy else df
 
     # ------------------------------
     # 1. Descompunere coloana 'date'
     # ------------------------------
-    df_trans["date"] = pd.to_datetime(df_trans["date"], errors="coerce")
-
-    df_trans["an"] = df_trans["date"].dt.year
-    df_trans["luna"] = df_trans["date"].dt.month
-    df_trans["zi"] = df_trans["date"].dt.day
-    df_trans["ora"] = df_trans["date"].dt.hour
-    df_trans["minut"] = df_trans["date"].dt.minute
-    df_trans["zi_saptamana"] = df_trans["date"].dt.day_name().str.lower()
+    df_trans["date"] = parse_dates(df_trans["date"], strict=strict)
+    for col, values in calendar_fields(df_trans["date"]).items():
+        df_trans[col] = values
 
     # ------------------------------
     # 2. Convertire numeric
@@ -35,27 +132,180 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         df_trans[col] = pd.to_numeric(df_trans[col], errors="coerce")
 
     # ------------------------------
-    # 3. Standardizare categorice
-    # ------------------------------
-    df_trans["zi_saptamana"] = df_trans["zi_saptamana"].str.strip().str.lower()
-
-    # ------------------------------
-    # 4. Variabilă nouă: raport_pret_calitate
+    # 3. Variabilă nouă: raport_pret_calitate
     # ------------------------------
     df_trans["raport_pret_calitate"] = df_trans["productie"] / df_trans["consum"]
 
     return df_trans
 
 
+def apply_schema(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """
+    Aplică SCHEMA pe coloanele prezente în df.
+    O coloană întreagă care are NaN sau valori în afara domeniului tipului țintă
+    nu poate fi convertită fără pierderi: cu NaN devine float32, iar cea
+    în afara domeniului rămâne neschimbată.
+    """
+    df_c = df.copy() if copy else df
+    for col, dtype in SCHEMA.items():
+        if col not in df_c.columns or df_c[col].dtype == dtype:
+            continue
+        if isinstance(dtype, pd.CategoricalDtype):
+            df_c[col] = df_c[col].astype(dtype)
+            continue
+        np_dtype = np.dtype(dtype)
+        if np_dtype.kind in "iu":
+            values = df_c[col]
+            if values.isna().any():
+                df_c[col] = values.astype("float32")
+                continue
+            info = np.iinfo(np_dtype)
+            if values.min() < info.min or values.max() > info.max:
+                continue
+        df_c[col] = df_c[col].astype(np_dtype)
+    return df_c
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compară memoria ocupată de fiecare coloană înainte și după apply_schema.
+    Returnează DataFrame (col: bytes_inainte, bytes_dupa, reducere_pct), cu rândul TOTAL la final.
+    """
+    before = df.memory_usage(index=False, deep=True)
+    after = apply_schema(df).memory_usage(index=False, deep=True)
+    report = pd.DataFrame({"bytes_inainte": before, "bytes_dupa": after})
+    report.loc["TOTAL"] = report.sum()
+    report["reducere_pct"] = (1 - report["bytes_dupa"] / report["bytes_inainte"]) * 100
+    return report
+
+
+def write_transformed_csv(df_trans: pd.DataFrame, path: str, header: bool = True, mode: str = "w") -> None:
+    """
+    Scrie datele transformate în CSV cu o formatare fixă pe coloană, care nu depinde de
+    conținutul fragmentului scris (un chunk cu NaN se formatează ca unul fără):
+      - coloanele întregi din SCHEMA se scriu ca Int64 (NaN -> câmp gol, fără sufixul '.0');
+        o valoare neîntreagă se scrie ca atare, fără să schimbe formatarea celorlalte
+      - 'date' se scrie mereu cu FORMAT_DATA (și la miezul nopții)
+    """
+    out = {}
+    for col, dtype in SCHEMA.items():
+        if col not in df_trans.columns or isinstance(dtype, pd.CategoricalDtype):
+            continue
+        values = df_trans[col]
+        if np.dtype(dtype).kind not in "iu" or values.dtype.kind not in "f":
+            continue
+        whole = values % 1 == 0
+        if (whole | values.isna()).all():
+            out[col] = values.astype("Int64")
+        else:
+            ints = values.fillna(0).to_numpy().astype("int64").astype(object)
+            out[col] = pd.Series(np.where(whole, ints, values.to_numpy().astype(object)),
+                                 index=values.index, dtype=object)
+    if out:
+        df_trans = df_trans.assign(**out)
+    df_trans.to_csv(path, index=False, header=header, mode=mode, date_format=FORMAT_DATA)
+
+
+def write_columnar(df_trans: pd.DataFrame, path: str) -> None:
+    """Salvează datele transformate în format Parquet, cu SCHEMA aplicată (necesită pyarrow)."""
+    apply_schema(df_trans).to_parquet(path, index=False)
+
+
+def transform_csv_chunked(
+    src: str,
+    dst: str,
+    chunksize: int = 100_000,
+    encoding: str = "utf-8",
+    columnar_path: Optional[str] = None,
+    strict: bool = False
+) -> int:
+    """
+    Variantă streaming a transformării: citește CSV-ul brut în bucăți de
+    `chunksize` rânduri, aplică transform_data pe fiecare și le adaugă în `dst`.
+    Memoria folosită depinde de chunksize, nu de mărimea fișierului.
+    Rezultatul este identic, byte cu byte, cu write_transformed_csv(transform_data(pd.read_csv(src)), dst)
+    (formatarea fiecărei coloane e fixă, deci nu depinde de împărțirea în chunk-uri).
+    - columnar_path: dacă e dat, scrie în paralel și fișierul Parquet cu SCHEMA
+      aplicată (un row group per chunk)
+    - strict: transmis mai departe la transform_data
+    Returnează numărul de rânduri scrise.
+    """
+    writer = None
+    if columnar_path is not None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    n_rows = 0
+    try:
+        for chunk in pd.read_csv(src, chunksize=chunksize, encoding=encoding):
+            df_t = transform_data(chunk, copy=False, strict=strict)
+            # antetul se scrie doar la primul chunk, restul se adaugă la final
+            write_transformed_csv(df_t, dst, header=(n_rows == 0), mode="w" if n_rows == 0 else "a")
+            n_rows += len(df_t)
+
+            if columnar_path is not None:
+                table = pa.Table.from_pandas(apply_schema(df_t, copy=False), preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(columnar_path, table.schema)
+                else:
+                    # un chunk cu NaN are float32 în loc de int -> aliniem la schema inițială
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n_rows
+
+
 # Exemplu de rulare
 if __name__ == "__main__":
-    # Citește fișierul inițial
-    df = pd.read_csv("energy_data.csv")
+    # Citește fișierul inițial pe bucăți, aplică transformările
+    # și salvează rezultatul într-un nou fișier CSV
+    n = transform_csv_chunked("energy_data.csv", "energie_transformata.csv")
 
-    # Aplică transformările
-    df_t = transform_data(df)
+    print(f"✔ {n} rânduri transformate.")
+    print("✔ Datele transformate au fost salvate în 'energie_transformata.csv'")
 
-    # Salvează rezultatul într-un nou fișier CSV
-    df_t.to_csv("energie_transformata.csv", index=False)
+    # Copiile columnare se păstrează sortate după dată (interogări pe interval prin căutare binară);
+    # CSV-ul rămâne în ordinea fișierului brut.
+    # Depozitul de coloane .npy (memory-map) e partajat de dashboard și de statistici.
+    from incarcare import (COLOANE_TRANSFORMAT, CSV_TRANSFORMAT, PARQUET_TRANSFORMAT, PARTITII_TRANSFORMAT,
+                           load_transformed, write_column_store, write_partitioned)
+    from interval_timp import sort_by_date
+    df_sortat = sort_by_date(load_transformed())
 
-    print("✔ Datele transformate au fost salvate în 'energie_transformata.csv'")
+    # Starea și agregatele actualizării incrementale descriu acum fișierul reconstruit
+    # (altfel actualizare.py ar porni de la high-water mark-ul și agregatele vechi)
+    from actualizare import AGREGATE_ENERGIE, STARE_ACTUALIZARE, write_high_water_mark
+    from agregate import partial_aggregates, save_aggregates
+    save_aggregates(partial_aggregates(df_sortat), AGREGATE_ENERGIE)
+    write_high_water_mark(STARE_ACTUALIZARE, df_sortat["date"].max(), CSV_TRANSFORMAT)
+
+    # copia Parquet folosită de incarcare.load_transformed se scrie o singură dată, direct sortată
+    try:
+        write_columnar(df_sortat, PARQUET_TRANSFORMAT)
+        print(f"✔ Copia columnară a fost salvată în '{PARQUET_TRANSFORMAT}'")
+    except ImportError:
+        # fără pyarrow rămâne doar CSV-ul
+        pass
+    write_column_store(df_sortat, COLOANE_TRANSFORMAT)
+    print(f"✔ Depozitul de coloane a fost salvat în '{COLOANE_TRANSFORMAT}/'")
+
+    # Același conținut, partiționat pe an / lună (citire doar a lunilor necesare)
+    n_part = write_partitioned(df_sortat, PARTITII_TRANSFORMAT)
+    print(f"✔ {n_part} partiții an/lună salvate în '{PARTITII_TRANSFORMAT}/'")
+
+    # Descompunerea trend / sezonalitate pe grila orară, folosită de dashboard și notebook
+    from descompunere import DESCOMPUNERE_ENERGIE, decompose_data, write_decomposition
+    write_decomposition(decompose_data(df_sortat), DESCOMPUNERE_ENERGIE)
+    print(f"✔ Descompunerea în trend și sezonalitate a fost salvată în '{DESCOMPUNERE_ENERGIE}/'")
+
+    # Modelele de prognoză pe 24h (actualizate apoi incremental de actualizare.py)
+    from prognoza import MODELE_PROGNOZA, fit_models, save_models
+    save_models(fit_models(df_sortat), MODELE_PROGNOZA)
+    print(f"✔ Modelele de prognoză au fost salvate în '{MODELE_PROGNOZA}'")
+
+    # Acumulatorii statistici (momente + schițe de cuantile), îmbinați apoi de actualizare.py
+    from acumulatori import STATISTICI_ENERGIE, build_statistics, save_statistics
+    save_statistics(build_statistics(df_sortat), STATISTICI_ENERGIE)
+    print(f"✔ Statisticile incrementale au fost salvate în '{STATISTICI_ENERGIE}'")
@@ -0,0 +1,63 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+class MatriceCorelatie:
+    """
+    Matricea completă de corelație pentru un set de coloane, calculată o singură dată:
+    valorile se centrează și se standardizează, iar matricea rezultă dintr-un singur produs
+    Z^T Z / (n - 1). Toate interogările derivate (submatrice, corelațiile unei coloane)
+    se citesc din ea, fără recalculare.
+    - method: 'pearson' sau 'spearman' (Pearson pe ranguri, o singură trecere de rangare
+      pentru toate coloanele; egalitățile primesc rangul mediu, ca în pandas)
+    Cu valori lipsă se folosesc perechile complete, exact ca DataFrame.corr().
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Sequence[str], method: str = "pearson"):
+        if method not in ("pearson", "spearman"):
+            raise ValueError(f"Metodă de corelație necunoscută: {method}")
+        self.columns = list(columns)
+        self.method = method
+
+        values = df[self.columns].to_numpy(dtype="float64")
+        if np.isnan(values).any():
+            # perechi complete diferite pe fiecare pereche de coloane -> calculul pandas
+            matrix = df[self.columns].astype("float64").corr(method=method).to_numpy()
+        else:
+            if method == "spearman":
+                values = stats.rankdata(values, axis=0)
+            centered = values - values.mean(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                z = centered / np.sqrt((centered * centered).sum(axis=0))
+                matrix = np.clip(z.T @ z, -1.0, 1.0)
+            np.fill_diagonal(matrix, np.where(np.isnan(np.diag(matrix)), np.nan, 1.0))
+        self._matrix = pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def matrix(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Matricea completă sau submatricea pentru `columns`."""
+        if columns is None:
+            return self._matrix.copy()
+        return self._matrix.loc[columns, columns]
+
+    def with_column(self, col: str, among: Optional[List[str]] = None) -> pd.Series:
+        """
+        Corelațiile coloanei `col` cu `among` (implicit toate coloanele), plus ea însăși,
+        sortate descrescător (ca df[among + [col]].corr()[col].sort_values(ascending=False)).
+        """
+        among = self.columns if among is None else among
+        keys = list(dict.fromkeys(list(among) + [col]))
+        return self._matrix.loc[keys, col].sort_values(ascending=False)
+
+    def strongest_pairs(self, n: int = 10) -> pd.DataFrame:
+        """Perechile distincte de coloane cu cele mai mari corelații în valoare absolută."""
+        i, j = np.triu_indices(len(self.columns), k=1)
+        values = self._matrix.to_numpy()[i, j]
+        pairs = pd.DataFrame({
+            "col1": [self.columns[k] for k in i],
+            "col2": [self.columns[k] for k in j],
+            "corelatie": values,
+        })
+        return pairs.reindex(pairs["corelatie"].abs().sort_values(ascending=False).index).head(n)
@@ -0,0 +1,200 @@
+import json
+import os
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ferestre_mobile import resample_energy
+from incarcare import CSV_TRANSFORMAT, MANIFEST, is_fresh, load_columns, load_range, write_column_store
+
+DESCOMPUNERE_ENERGIE = "energie_descompunere"
+PARAMETRI = "parametri.json"
+
+COLOANE_DESCOMPUNERE = ["consum", "productie", "sold", "carbune", "hidro", "hidrocarburi",
+                        "nuclear", "eolian", "fotovolt", "biomasa"]
+
+# Grila -> componentele sezoniere: (perioada în pași, numărul de cicluri mediate pe fază,
+# câți pași vecini fazei intră în medie de fiecare parte: ±12h la ciclul săptămânal,
+# deci profilul pe zile al săptămânii, fără ciclul zilnic)
+SEZONALITATI = {
+    "h": {"zilnic": (24, 29, 1), "saptamanal": (168, 7, 12)},
+    "D": {"saptamanal": (7, 7, 0)},
+}
+COMPONENTE = ["observat", "trend", "zilnic", "saptamanal", "rezidual"]
+
+
+def _centered_mean(values: np.ndarray, radius: int) -> np.ndarray:
+    """Media centrată pe fereastra [t - radius, t + radius], ignorând NaN (NaN dacă fereastra e goală)."""
+    valid = ~np.isnan(values)
+    pad = np.zeros((1,) + values.shape[1:])
+    sums = np.concatenate([pad, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.concatenate([pad, np.cumsum(valid, axis=0)])
+    n = len(values)
+    hi = np.minimum(np.arange(n) + radius + 1, n)
+    lo = np.maximum(np.arange(n) - radius, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (sums[hi] - sums[lo]) / (counts[hi] - counts[lo])
+
+
+def _seasonal(values: np.ndarray, period: int, cycles: int, spread: int = 0) -> np.ndarray:
+    """
+    Componenta sezonieră de perioadă `period`: media valorilor cu aceeași fază (± `spread` pași)
+    din cele `cycles` cicluri centrate în jurul fiecărui moment (variază lent în timp, ca
+    subseriile de ciclu din STL), apoi centrată (media pe o perioadă ~ 0, nivelul rămâne în trend).
+    Fazele fără nicio observație primesc 0.
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    sums = np.zeros_like(filled)
+    counts = np.zeros_like(filled)
+    n = len(values)
+    shifts = [j * period + i for j in range(-(cycles // 2), cycles // 2 + 1) for i in range(-spread, spread + 1)]
+    for shift in shifts:
+        if abs(shift) >= n:
+            continue
+        src, dst = (slice(shift, n), slice(0, n - shift)) if shift >= 0 else (slice(0, n + shift), slice(-shift, n))
+        sums[dst] += filled[src]
+        counts[dst] += valid[src]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        season = np.where(counts > 0, sums / counts, 0.0)
+    return season - _centered_mean(season, period // 2)
+
+
+def dependency_radius(freq: str = "h", passes: int = 2, trend_window: Optional[int] = None) -> int:
+    """
+    Numărul de pași de grilă de care depinde o valoare a descompunerii, în fiecare sens:
+    datele adăugate schimbă doar componentele din ultimii `dependency_radius` pași.
+    """
+    sezon = SEZONALITATI[freq]
+    half = _trend_window(freq, trend_window) // 2
+    per_pass = half + sum(cycles // 2 * period + spread + period // 2 for period, cycles, spread in sezon.values())
+    return passes * per_pass + half
+
+
+def _trend_window(freq: str, trend_window: Optional[int]) -> int:
+    # implicit două perioade sezoniere maxime: ciclul săptămânal nu trece în trend
+    return trend_window or 2 * max(spec[0] for spec in SEZONALITATI[freq].values()) + 1
+
+
+def decompose(
+    series: pd.DataFrame,
+    freq: str = "h",
+    trend_window: Optional[int] = None,
+    passes: int = 2
+) -> pd.DataFrame:
+    """
+    Descompunere aditivă observat = trend + zilnic + săptămânal + rezidual, pentru toate
+    coloanele deodată (serii pe grila regulată `freq`, intervalele fără date fiind NaN).
+    Componentele se estimează alternativ, în `passes` treceri (ca bucla interioară STL):
+    fiecare sezonalitate din seria fără trend și fără celelalte sezonalități, apoi trendul
+    ca medie mobilă centrată pe `trend_window` pași din seria desezonalizată.
+    Pe grila zilnică ('D') componenta zilnică e 0.
+    Coloane MultiIndex (coloană, componentă) în ordinea COMPONENTE; rezidualul e NaN unde nu există date.
+    """
+    values = series.to_numpy(dtype="float64")
+    sezon = SEZONALITATI[freq]
+    half = _trend_window(freq, trend_window) // 2
+
+    components = {name: np.zeros_like(values) for name in sezon}
+    trend = _centered_mean(values, half)
+    for _ in range(passes):
+        for name, (period, cycles, spread) in sezon.items():
+            others = sum(components[o] for o in sezon if o != name)
+            components[name] = _seasonal(values - trend - others, period, cycles, spread)
+        trend = _centered_mean(values - sum(components.values()), half)
+
+    zero = np.zeros_like(values)
+    parts = {
+        "observat": values,
+        "trend": trend,
+        "zilnic": components.get("zilnic", zero),
+        "saptamanal": components.get("saptamanal", zero),
+    }
+    parts["rezidual"] = values - trend - parts["zilnic"] - parts["saptamanal"]
+    frames = {comp: pd.DataFrame(arr, index=series.index, columns=series.columns) for comp, arr in parts.items()}
+    return pd.concat(frames, axis=1).swaplevel(axis=1)[list(series.columns)].reindex(columns=COMPONENTE, level=1)
+
+
+def decompose_data(
+    df: pd.DataFrame,
+    columns: Sequence[str] = COLOANE_DESCOMPUNERE,
+    freq: str = "h",
+    **kwargs
+) -> pd.DataFrame:
+    """Resamplează datele pe grila `freq` (timestamp-uri neregulate -> medii pe interval) și le descompune."""
+    return decompose(resample_energy(df, columns, freq), freq, **kwargs)
+
+
+# ------------------------------
+# Depozitul de componente (o coloană .npy per (variabilă, componentă))
+# ------------------------------
+def _flat(dec: pd.DataFrame) -> pd.DataFrame:
+    flat = dec.copy()
+    flat.columns = [f"{col}_{comp}" for col, comp in dec.columns]
+    return flat.rename_axis("date").reset_index()
+
+
+def write_decomposition(
+    dec: pd.DataFrame,
+    directory: str = DESCOMPUNERE_ENERGIE,
+    freq: str = "h",
+    trend_window: Optional[int] = None,
+    passes: int = 2
+) -> None:
+    """Salvează componentele în depozitul de coloane (write_column_store) și parametrii folosiți."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, PARAMETRI), "w", encoding="utf-8") as f:
+        json.dump({"freq": freq, "trend_window": trend_window, "passes": passes,
+                   "columns": list(dec.columns.get_level_values(0).unique())}, f, indent=1)
+    write_column_store(_flat(dec), directory)
+
+
+def load_decomposition(
+    columns: Optional[List[str]] = None,
+    components: Sequence[str] = COMPONENTE,
+    start=None,
+    end=None,
+    directory: str = DESCOMPUNERE_ENERGIE
+) -> pd.DataFrame:
+    """
+    Componentele salvate pentru coloanele și intervalul [start, end) cerute: se deschid doar
+    fișierele (variabilă, componentă) necesare, iar intervalul se caută binar pe 'date'.
+    """
+    with open(os.path.join(directory, PARAMETRI), encoding="utf-8") as f:
+        columns = columns or json.load(f)["columns"]
+    names = [f"{col}_{comp}" for col in columns for comp in components]
+    flat = load_columns(directory, ["date"] + names, start, end)
+    dec = flat[names].set_axis(pd.MultiIndex.from_product([columns, list(components)]), axis=1)
+    dec.index = pd.DatetimeIndex(flat["date"], name="date")
+    return dec
+
+
+def is_decomposition_fresh(directory: str = DESCOMPUNERE_ENERGIE, csv_path: str = CSV_TRANSFORMAT) -> bool:
+    return is_fresh(os.path.join(directory, MANIFEST), csv_path)
+
+
+def update_decomposition(since, directory: str = DESCOMPUNERE_ENERGIE, **load_kwargs) -> int:
+    """
+    Actualizează componentele după adăugarea de rânduri cu 'date' >= `since` (setul de date
+    trebuie să le conțină deja). Se recalculează doar coada: o valoare depinde de cel mult
+    dependency_radius pași în fiecare sens, deci se recitesc datele începând cu 2 * rază
+    înainte de `since` și se înlocuiesc componentele de la `since` - rază încolo.
+    Rezultatul e același cu al unei descompuneri complete (până la erori de rotunjire).
+    Returnează numărul de pași recalculați.
+    """
+    with open(os.path.join(directory, PARAMETRI), encoding="utf-8") as f:
+        params = json.load(f)
+    freq, columns = params["freq"], params["columns"]
+    step = pd.to_timedelta(pd.tseries.frequencies.to_offset(freq))
+    radius = dependency_radius(freq, params["passes"], params["trend_window"])
+
+    first_bin = pd.Timestamp(since).floor(freq)
+    keep_from = first_bin - radius * step
+    df_tail = load_range(start=keep_from - radius * step, columns=["date"] + columns, **load_kwargs)
+    tail = decompose_data(df_tail, columns, freq, trend_window=params["trend_window"], passes=params["passes"])
+    tail = tail[tail.index >= keep_from]
+
+    old = load_decomposition(columns, directory=directory, end=keep_from)
+    write_decomposition(pd.concat([old, tail]), directory, freq, params["trend_window"], params["passes"])
+    return len(tail)
@@ -0,0 +1,140 @@
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+# Coloanele urmărite implicit (soldul și totalurile)
+COLOANE_MONITORIZARE = ["sold", "productie", "consum"]
+
+STATISTICI_RULANTE = ["mean", "std", "min", "max"]
+
+# Etichete pentru resamplare calendaristică -> frecvența pandas
+FRECVENTE = {
+    "15 minute": "15min",
+    "Orar": "h",
+    "Zilnic": "D",
+    "Săptămânal": "W",
+    "Lunar": "MS",
+}
+
+Fereastra = Union[str, pd.Timedelta, int]
+
+
+def _by_date(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """Coloanele cerute, indexate după 'date' (datele trebuie să fie sortate după dată)."""
+    return df.set_index("date")[list(columns)].astype("float64")
+
+
+def rolling_stats(
+    df: pd.DataFrame,
+    columns: Sequence[str] = COLOANE_MONITORIZARE,
+    window: Fereastra = "1h",
+    stats: Sequence[str] = STATISTICI_RULANTE
+) -> pd.DataFrame:
+    """
+    Statistici pe fereastră mobilă pentru toate coloanele într-un singur apel.
+    - window: durată ("15min", "1h", "1D"; fereastra (t - window, t]) sau număr de rânduri
+    Media și abaterea standard se actualizează incremental, min / max cu coadă monotonă,
+    deci costul este O(n) indiferent de mărimea ferestrei.
+    Rezultatul are coloane MultiIndex (coloană, statistică) și index 'date'.
+    """
+    return _by_date(df, columns).rolling(window).agg(list(stats))
+
+
+def ewma(
+    df: pd.DataFrame,
+    columns: Sequence[str] = COLOANE_MONITORIZARE,
+    halflife: Union[str, pd.Timedelta] = "1h"
+) -> pd.DataFrame:
+    """
+    Media mobilă exponențială ponderată cu timpul: o observație pierde jumătate din
+    pondere după `halflife`, oricât de neregulat ar fi eșantionarea.
+    Forma recursivă (adjust=False), care poate fi continuată pe date adăugate ulterior.
+    """
+    data = _by_date(df, columns)
+    return data.ewm(halflife=halflife, times=data.index, adjust=False).mean()
+
+
+def resample_energy(
+    df: pd.DataFrame,
+    columns: Sequence[str] = COLOANE_MONITORIZARE,
+    freq: str = "h",
+    how: Union[str, List[str]] = "mean"
+) -> pd.DataFrame:
+    """Resamplare calendaristică (vezi FRECVENTE) a tuturor coloanelor într-un singur apel."""
+    return _by_date(df, columns).resample(freq).agg(how)
+
+
+class MonitorRulant:
+    """
+    Statistici mobile, EWMA și resamplare actualizate incremental pe date adăugate.
+    La fiecare update se recalculează doar rândurile noi: se păstrează coada de rânduri
+    care mai intră în fereastră, ultima valoare EWMA și sumele / numărul de valori pe
+    intervalele de resamplare (intervalul deschis se completează cu rândurile noi).
+    Rândurile noi trebuie să fie sortate și ulterioare celor deja procesate.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] = COLOANE_MONITORIZARE,
+        window: Fereastra = "1h",
+        halflife: Union[str, pd.Timedelta] = "1h",
+        freq: Optional[str] = "15min",
+        stats: Sequence[str] = STATISTICI_RULANTE
+    ):
+        self.columns = list(columns)
+        self.window = window
+        self.halflife = halflife
+        self.freq = freq
+        self.stats = list(stats)
+        self._tail: Optional[pd.DataFrame] = None
+        self._ewma_last: Optional[pd.DataFrame] = None
+        self._sum: Optional[pd.DataFrame] = None
+        self._count: Optional[pd.DataFrame] = None
+        # ultima dată procesată: următorul update primește doar rândurile de după ea
+        self.last_date: Optional[pd.Timestamp] = None
+
+    def update(self, df_new: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Procesează rândurile noi și întoarce {'rolling': ..., 'ewma': ...} doar pentru ele
+        (aceleași valori ca rolling_stats / ewma pe tot istoricul).
+        """
+        new = _by_date(df_new, self.columns)
+        if new.empty:
+            return {"rolling": new.iloc[:0], "ewma": new.iloc[:0]}
+
+        # fereastra mobilă: coada păstrată + rândurile noi
+        data = new if self._tail is None else pd.concat([self._tail, new])
+        rolling = data.rolling(self.window).agg(self.stats).iloc[-len(new):]
+        if isinstance(self.window, int):
+            self._tail = data.iloc[-(self.window - 1):] if self.window > 1 else data.iloc[:0]
+        else:
+            self._tail = data[data.index > data.index[-1] - pd.Timedelta(self.window)]
+
+        # EWMA: recursia continuă de la ultima valoare calculată
+        seeded = new if self._ewma_last is None else pd.concat([self._ewma_last, new])
+        smoothed = seeded.ewm(halflife=self.halflife, times=seeded.index, adjust=False).mean()
+        smoothed = smoothed.iloc[-len(new):]
+        self._ewma_last = smoothed.iloc[-1:]
+        self.last_date = new.index[-1]
+
+        # resamplare: sume și număr de valori, combinate pe intervalul comun; intervalele
+        # goale dintre două loturi lipsesc din ambele, deci se reindexează pe toată grila
+        if self.freq is not None:
+            grouped = new.resample(self.freq)
+            sums, counts = grouped.sum(), grouped.count()
+            if self._sum is None:
+                self._sum, self._count = sums, counts
+            else:
+                sums = self._sum.add(sums, fill_value=0)
+                counts = self._count.add(counts, fill_value=0)
+                bins = pd.date_range(sums.index[0], sums.index[-1], freq=self.freq, name=sums.index.name)
+                self._sum = sums.reindex(bins, fill_value=0)
+                self._count = counts.reindex(bins, fill_value=0)
+
+        return {"rolling": rolling, "ewma": smoothed}
+
+    def resampled(self) -> pd.DataFrame:
+        """Media pe fiecare interval de resamplare, pentru toate datele procesate până acum."""
+        if self._sum is None:
+            return pd.DataFrame(columns=self.columns, dtype="float64")
+        return self._sum / self._count.where(self._count > 0)
@@ -0,0 +1,230 @@
+from typing import Dict, Optional, Sequence
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from agregate import cube_frame
+
+LUNI = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
+
+# Granularitate -> nivelul din cub, statistica și formatarea axei X
+GRANULARITATI = {
+    "Orar": {"bucket": "ora", "stat": "mean", "x_label": "Ora",
+             "ticks": range(0, 24), "labels": [f"{h}:00" for h in range(0, 24)], "rotation": 45},
+    "Zilnic": {"bucket": "zi_an", "stat": "sum", "x_label": "Ziua anului",
+               "ticks": None, "labels": None, "rotation": 0},
+    "Lunar": {"bucket": "luna", "stat": "sum", "x_label": "Luna",
+              "ticks": range(1, 13), "labels": LUNI, "rotation": 0},
+}
+
+# Stilul fiecărei metrici: culori de umplere / linie pentru primul și al doilea an comparat
+METRICI = {
+    "productie": {"eticheta": "Producție", "fill": ["#4ECDC4", "#90EE90"], "linie": ["#008B8B", "#228B22"]},
+    "consum": {"eticheta": "Consum", "fill": ["#FF6B6B", "#FFA500"], "linie": ["#CC0000", "#FF6500"]},
+}
+
+CULORI_SURSE = {
+    "carbune": "#4a4a4a",
+    "hidro": "#2196F3",
+    "hidrocarburi": "#795548",
+    "nuclear": "#9C27B0",
+    "eolian": "#00BCD4",
+    "fotovolt": "#FFC107",
+    "biomasa": "#4CAF50"
+}
+
+MARKERE = ['o', 's', '^', 'D']
+
+
+def year_series(
+    cube: Dict[str, pd.DataFrame],
+    metrics: Sequence[str],
+    ani: Sequence[int],
+    granularitate: str
+) -> Dict[int, pd.DataFrame]:
+    """
+    Seriile tuturor metricilor pentru toți anii ceruți, la granularitatea dată:
+    o singură selecție din cubul agregat (calculat o dată, pe (an, bucket)), împărțită pe ani.
+    """
+    spec = GRANULARITATI[granularitate]
+    frame = cube_frame(cube, spec["bucket"], list(ani), list(metrics), spec["stat"])
+    prezenti = set(frame.index.get_level_values("an"))
+    # un an fără date -> serie goală (graficul rămâne gol, ca înainte)
+    return {an: frame.xs(an, level="an") if an in prezenti else pd.DataFrame(columns=list(metrics), dtype="float64")
+            for an in ani}
+
+
+def _format_x(ax, granularitate: str, with_label: bool = True) -> None:
+    spec = GRANULARITATI[granularitate]
+    if with_label:
+        ax.set_xlabel(spec["x_label"], fontsize=13, fontweight='bold')
+    if spec["ticks"] is not None:
+        ax.set_xticks(spec["ticks"])
+        ax.set_xticklabels(spec["labels"], rotation=spec["rotation"])
+
+
+def area_figure(
+    serii: Dict[int, pd.DataFrame],
+    metrics: Sequence[str],
+    granularitate: str,
+    titluri: Sequence[str],
+    suptitlu: Optional[str] = None
+):
+    """
+    Un grafic (arie + linie) per metrică, cu anii suprapuși pe același grafic.
+    - serii: rezultatul year_series
+    - titluri: câte un titlu per metrică
+    """
+    n = len(metrics)
+    fig, axes = plt.subplots(n, 1, figsize=(14, 7 if n == 1 else 5 * n + 2), sharex=True, squeeze=False)
+    axes = axes[:, 0]
+    mai_multi_ani = len(serii) > 1
+    for ax, metric, titlu in zip(axes, metrics, titluri):
+        stil = METRICI[metric]
+        for i, (an, date) in enumerate(serii.items()):
+            eticheta = f"{stil['eticheta']} {an}" if mai_multi_ani else stil["eticheta"]
+            ax.fill_between(date.index, 0, date[metric], color=stil["fill"][i % 2],
+                            alpha=0.5 if mai_multi_ani else 0.7, label=eticheta)
+            ax.plot(date.index, date[metric], color=stil["linie"][i % 2], linewidth=2.5,
+                    marker=MARKERE[i % len(MARKERE)], markersize=7)
+        ax.set_ylabel(f"{stil['eticheta']} (MWh)", fontsize=12, fontweight='bold')
+        ax.set_title(titlu, fontsize=15 if n == 1 else 13, fontweight='bold', pad=20 if n == 1 else 6)
+        if mai_multi_ani or n > 1:
+            ax.legend(loc='best' if n == 1 else 'upper left', fontsize=11)
+        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
+        ax.set_ylim(bottom=0)
+    _format_x(axes[-1], granularitate)
+
+    if suptitlu is not None:
+        plt.suptitle(suptitlu, fontsize=15, fontweight='bold', y=0.995)
+    plt.tight_layout()
+    return fig
+
+
+def lines_figure(date: pd.DataFrame, columns: Sequence[str], granularitate: Optional[str],
+                 titlu: str, x_label: Optional[str] = None, rolling: Optional[pd.DataFrame] = None,
+                 rolling_label: str = "medie mobilă"):
+    """
+    Câte o linie per coloană (ex. surse de energie) pe același grafic.
+    - granularitate: formatarea axei X din GRANULARITATI; None -> axă de timp (x_label)
+    - rolling: serii suplimentare desenate punctat (ex. medii mobile), aceleași coloane
+    """
+    fig, ax = plt.subplots(figsize=(14, 7))
+    pe_granularitate = granularitate is not None
+    for col in columns:
+        ax.plot(date.index, date[col], label=col.capitalize(),
+                linewidth=2.5 if pe_granularitate else 2, alpha=0.8 if pe_granularitate else 0.85,
+                marker='o' if pe_granularitate else None, markersize=6,
+                color=CULORI_SURSE.get(col))
+    if rolling is not None:
+        for col in columns:
+            ax.plot(rolling.index, rolling[col], linestyle='--', linewidth=1.5,
+                    label=f"{col.capitalize()} ({rolling_label})")
+
+    ax.set_ylabel("Energie (MWh)", fontsize=13, fontweight='bold')
+    ax.set_title(titlu, fontsize=15, fontweight='bold', pad=20)
+    ax.legend(loc='best', fontsize=11, framealpha=0.9)
+    ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
+    if pe_granularitate:
+        _format_x(ax, granularitate)
+    else:
+        ax.set_xlabel(x_label or "Data", fontsize=13, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+def lag_figure(paneluri: Dict[str, pd.DataFrame], x_label: str):
+    """
+    Câte un grafic per panou (titlu -> valori indexate după decalaj, ex. CCF, ACF, PACF),
+    cu o linie per coloană; coloanele MultiIndex (sursa, tinta) devin "sursa → tinta".
+    """
+    n = len(paneluri)
+    fig, axes = plt.subplots(n, 1, figsize=(14, 5 * n + 1), squeeze=False)
+    for ax, (titlu, valori) in zip(axes[:, 0], paneluri.items()):
+        for col in valori.columns:
+            eticheta = " → ".join(col) if isinstance(col, tuple) else col.capitalize()
+            culoare = CULORI_SURSE.get(col[0] if isinstance(col, tuple) else col)
+            ax.plot(valori.index, valori[col], linewidth=1.8, alpha=0.85, label=eticheta, color=culoare)
+        ax.axhline(0, color="black", linewidth=0.8)
+        ax.set_ylabel("Corelație", fontsize=12, fontweight='bold')
+        ax.set_title(titlu, fontsize=13, fontweight='bold')
+        ax.legend(loc='best', fontsize=10, framealpha=0.9)
+        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
+        ax.set_ylim(-1.05, 1.05)
+    axes[-1, 0].set_xlabel(x_label, fontsize=13, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+# Componenta descompunerii -> titlul panoului și culoarea
+COMPONENTE_GRAFIC = {
+    "trend": ("Trend", "#1e3a8a"),
+    "zilnic": ("Sezonalitate zilnică", "#FF6500"),
+    "saptamanal": ("Sezonalitate săptămânală", "#228B22"),
+    "rezidual": ("Rezidual", "#666666"),
+}
+
+
+def components_figure(componente: pd.DataFrame, titlu: str):
+    """
+    Descompunerea unei variabile (coloanele din descompunere.COMPONENTE): valorile observate
+    cu trendul suprapus, apoi câte un panou per sezonalitate și rezidual.
+    Componentele constant 0 (ex. ciclul zilnic pe grila zilnică) nu se desenează.
+    """
+    paneluri = [c for c in ["zilnic", "saptamanal", "rezidual"] if componente[c].abs().max() > 0]
+    fig, axes = plt.subplots(len(paneluri) + 1, 1, figsize=(14, 3.2 * len(paneluri) + 5), sharex=True)
+    observat = componente["observat"].dropna()
+    axes[0].scatter(observat.index, observat, s=6, alpha=0.4, color="#888888", label="Observat")
+    axes[0].plot(componente.index, componente["trend"], linewidth=2.2,
+                 color=COMPONENTE_GRAFIC["trend"][1], label=COMPONENTE_GRAFIC["trend"][0])
+    axes[0].set_title(titlu, fontsize=15, fontweight='bold')
+    axes[0].legend(loc='best', fontsize=11)
+    for ax, comp in zip(axes[1:], paneluri):
+        eticheta, culoare = COMPONENTE_GRAFIC[comp]
+        if comp == "rezidual":
+            valori = componente[comp].dropna()
+            ax.scatter(valori.index, valori, s=5, alpha=0.5, color=culoare)
+        else:
+            ax.plot(componente.index, componente[comp], linewidth=1, color=culoare)
+        ax.axhline(0, color="black", linewidth=0.8)
+        ax.set_title(eticheta, fontsize=12, fontweight='bold')
+    for ax in axes:
+        ax.set_ylabel("MWh", fontsize=11, fontweight='bold')
+        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
+    axes[-1].set_xlabel("Data", fontsize=13, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
+
+
+# Modelul de prognoză -> eticheta și stilul liniei
+MODELE_GRAFIC = {
+    "naiv_sezonier": ("Naiv sezonier", ":"),
+    "holt_winters": ("Holt-Winters", "--"),
+    "ridge": ("Ridge (decalaje)", "-"),
+}
+
+
+def forecast_figure(observat: pd.DataFrame, prognoze: pd.DataFrame, targets: Sequence[str], titlu: str):
+    """
+    Câte un panou per țintă: ultimele observații și prognozele fiecărui model
+    (coloane MultiIndex (model, țintă), ca în prognoza.forecast).
+    """
+    fig, axes = plt.subplots(len(targets), 1, figsize=(14, 4 * len(targets) + 1), sharex=True, squeeze=False)
+    for ax, tinta in zip(axes[:, 0], targets):
+        ax.plot(observat["date"], observat[tinta], color="#333333", marker='o', markersize=5,
+                linewidth=1.5, label="Observat")
+        for model in prognoze.columns.get_level_values(0).unique():
+            eticheta, stil = MODELE_GRAFIC.get(model, (model, "-"))
+            ax.plot(prognoze.index, prognoze[(model, tinta)], linestyle=stil, linewidth=2, label=eticheta)
+        ax.axvline(observat["date"].iloc[-1], color="red", linewidth=1, alpha=0.6)
+        ax.set_ylabel(f"{tinta.capitalize()} (MWh)", fontsize=12, fontweight='bold')
+        ax.legend(loc='best', fontsize=10, framealpha=0.9)
+        ax.grid(alpha=0.3, linestyle='--', linewidth=0.7)
+    axes[0, 0].set_title(titlu, fontsize=15, fontweight='bold')
+    axes[-1, 0].set_xlabel("Data", fontsize=13, fontweight='bold')
+
+    plt.tight_layout()
+    return fig
@@ -0,0 +1,359 @@
+import json
+import os
+import shutil
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from convert import apply_schema, memory_report
+from interval_timp import date_bounds, slice_range, sort_by_date
+
+CSV_TRANSFORMAT = "energie_transformata.csv"
+PARQUET_TRANSFORMAT = "energie_transformata.parquet"
+COLOANE_TRANSFORMAT = "energie_transformata_coloane"
+PARTITII_TRANSFORMAT = "energie_transformata_partitii"
+MANIFEST = "manifest.json"
+
+
+def is_fresh(derived_path: str, csv_path: str) -> bool:
+    """Un fișier derivat (Parquet, agregate) e valid doar dacă există și nu e mai vechi decât CSV-ul."""
+    if not os.path.exists(derived_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(derived_path) >= os.path.getmtime(csv_path)
+
+
+def write_column_store(df: pd.DataFrame, directory: str = COLOANE_TRANSFORMAT) -> None:
+    """
+    Salvează fiecare coloană (cu SCHEMA aplicată) într-un fișier .npy separat, plus un manifest.
+    'date' se salvează ca int64 (epoch în unitatea datetime64 a coloanei),
+    zi_saptamana ca coduri de categorie (categoriile sunt în manifest).
+    Manifestul se scrie ultimul: data lui de modificare marchează un depozit complet.
+    Fiecare fișier se scrie întâi ca .tmp și apoi se redenumește (os.replace): cititorii care
+    au deja fișierele vechi deschise prin memory-map le păstrează intacte, în loc să vadă
+    conținutul suprascris pe loc.
+    """
+    os.makedirs(directory, exist_ok=True)
+    df = apply_schema(df)
+    manifest = {"rows": len(df), "columns": {}}
+    for col in df.columns:
+        series = df[col]
+        entry = {"file": f"{col}.npy"}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.codes.to_numpy()
+            entry.update(kind="category", categories=[str(c) for c in series.cat.categories])
+        elif series.dtype.kind == "M":
+            values = series.to_numpy().view("int64")
+            entry.update(kind="datetime", unit=np.datetime_data(series.dtype)[0])
+        elif series.dtype.kind in "iufb":
+            values = series.to_numpy()
+            entry.update(kind="numeric")
+        else:
+            # coloane text: nu au loc în depozitul numeric
+            continue
+        path = os.path.join(directory, entry["file"])
+        # prin handle: np.save ar adăuga extensia .npy unui nume care se termină în .tmp
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, values, allow_pickle=False)
+        os.replace(path + ".tmp", path)
+        manifest["columns"][col] = entry
+    manifest["sorted_by_date"] = bool("date" in df.columns and df["date"].is_monotonic_increasing)
+    path = os.path.join(directory, MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+def read_manifest(directory: str = COLOANE_TRANSFORMAT) -> dict:
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_column(directory: str, col: str, manifest: Optional[dict] = None) -> np.ndarray:
+    """Coloana `col` ca np.memmap read-only (tipul din fișier: date = int64, categorie = coduri)."""
+    manifest = manifest or read_manifest(directory)
+    return np.load(os.path.join(directory, manifest["columns"][col]["file"]), mmap_mode="r")
+
+
+def load_columns(
+    directory: str = COLOANE_TRANSFORMAT,
+    columns: Optional[List[str]] = None,
+    start=None,
+    end=None
+) -> pd.DataFrame:
+    """
+    Construiește un DataFrame din depozitul .npy, deschizând doar coloanele cerute.
+    Coloanele rămân memory-mapped (fără copie): mai multe procese care le citesc
+    partajează page cache-ul sistemului de operare.
+    - start / end: interval [start, end) pe 'date'; dacă depozitul e sortat după dată
+      se caută prin căutare binară și rezultatul e tot o vedere fără copie
+    """
+    manifest = read_manifest(directory)
+    names = list(manifest["columns"]) if columns is None else columns
+
+    rows = slice(None)
+    if start is not None or end is not None:
+        unit = manifest["columns"]["date"]["unit"]
+        dates = open_column(directory, "date", manifest).view(f"datetime64[{unit}]")
+        if manifest["sorted_by_date"]:
+            rows = slice(*date_bounds(dates, start, end))
+        else:
+            lo = np.datetime64(pd.Timestamp(start)) if start is not None else None
+            hi = np.datetime64(pd.Timestamp(end)) if end is not None else None
+            rows = np.ones(len(dates), dtype=bool)
+            if lo is not None:
+                rows &= dates >= lo
+            if hi is not None:
+                rows &= dates < hi
+
+    data = {}
+    for col in names:
+        entry = manifest["columns"][col]
+        values = open_column(directory, col, manifest)[rows]
+        if entry["kind"] == "datetime":
+            data[col] = values.view(f"datetime64[{entry['unit']}]")
+        elif entry["kind"] == "category":
+            data[col] = pd.Categorical.from_codes(values, categories=entry["categories"])
+        else:
+            data[col] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def partition_dir(root: str, an: int, luna: int) -> str:
+    """Directorul partiției (an, lună): root/an=2024/luna=03."""
+    return os.path.join(root, f"an={an}", f"luna={luna:02d}")
+
+
+def _swap_dir(staged: str, target: str) -> None:
+    """
+    Înlocuiește directorul `target` cu `staged` prin redenumiri: cititorii nu văd niciodată
+    un director scris pe jumătate, iar cei care au deja fișierele vechi deschise prin
+    memory-map le păstrează (se șterg doar intrările din director, nu și datele lor).
+    """
+    old = target + ".old"
+    if os.path.exists(old):
+        shutil.rmtree(old)
+    if os.path.exists(target):
+        os.rename(target, old)
+    os.rename(staged, target)
+    if os.path.exists(old):
+        shutil.rmtree(old)
+
+
+def _staging_dir(target: str) -> str:
+    """Directorul vecin în care se construiește noul conținut al lui `target` (golit de resturi)."""
+    staged = target + ".tmp"
+    if os.path.exists(staged):
+        shutil.rmtree(staged)
+    return staged
+
+
+def _write_partitions_manifest(root: str, partitions: List[dict]) -> None:
+    path = os.path.join(root, MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"partitions": partitions}, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+def write_partitioned(df: pd.DataFrame, root: str = PARTITII_TRANSFORMAT) -> int:
+    """
+    Salvează datele partiționate pe an / lună: fiecare partiție este un depozit de coloane
+    .npy (write_column_store), sortat după dată. Manifestul de la rădăcină (lista partițiilor)
+    se scrie ultimul, ca la depozitul simplu. Setul nou se construiește într-un director vecin
+    și înlocuiește setul vechi printr-o redenumire (_swap_dir).
+    Returnează numărul de partiții.
+    """
+    staged = _staging_dir(root)
+    os.makedirs(staged)
+    df = df[df["date"].notna()]
+    partitions = []
+    for (an, luna), part in df.groupby([df["date"].dt.year, df["date"].dt.month], sort=True):
+        write_column_store(sort_by_date(part), partition_dir(staged, an, luna))
+        partitions.append({"an": int(an), "luna": int(luna), "rows": len(part)})
+    _write_partitions_manifest(staged, partitions)
+    _swap_dir(staged, root)
+    return len(partitions)
+
+
+def _as_list(value) -> Optional[List[int]]:
+    if value is None:
+        return None
+    return [int(v) for v in (value if isinstance(value, Iterable) else [value])]
+
+
+def select_partitions(
+    partitions: List[dict],
+    an: Union[int, Iterable[int], None] = None,
+    luna: Union[int, Iterable[int], None] = None,
+    start=None,
+    end=None
+) -> List[Tuple[int, int]]:
+    """
+    Partițiile (an, lună) care pot conține rânduri pentru predicatul dat (partition pruning):
+    anii / lunile cerute și luna calendaristică ce se suprapune cu intervalul [start, end).
+    """
+    years, months = _as_list(an), _as_list(luna)
+    lo = pd.Timestamp(start) if start is not None else None
+    hi = pd.Timestamp(end) if end is not None else None
+    selected = []
+    for p in partitions:
+        if years is not None and p["an"] not in years:
+            continue
+        if months is not None and p["luna"] not in months:
+            continue
+        month_start = pd.Timestamp(p["an"], p["luna"], 1)
+        month_end = month_start + pd.offsets.MonthBegin(1)
+        if (lo is not None and month_end <= lo) or (hi is not None and month_start >= hi):
+            continue
+        selected.append((p["an"], p["luna"]))
+    return selected
+
+
+def load_partitions(
+    root: str = PARTITII_TRANSFORMAT,
+    an: Union[int, Iterable[int], None] = None,
+    luna: Union[int, Iterable[int], None] = None,
+    start=None,
+    end=None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Citește din setul partiționat doar partițiile care corespund predicatului (an, luna,
+    interval [start, end)); în fiecare partiție intervalul se caută binar (load_columns).
+    Rezultatul e sortat după dată (partițiile se concatenează în ordine cronologică).
+    """
+    partitions = read_manifest(root)["partitions"]
+    parts = [
+        load_columns(partition_dir(root, a, l), columns, start, end)
+        for a, l in select_partitions(partitions, an, luna, start, end)
+    ]
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts, ignore_index=True)
+
+
+def append_partitioned(df_new: pd.DataFrame, root: str = PARTITII_TRANSFORMAT) -> int:
+    """
+    Adaugă rânduri noi în setul partiționat, rescriind doar partițiile (an, lună) atinse:
+    fiecare se scrie într-un director vecin și înlocuiește partiția veche prin redenumire.
+    Returnează numărul de partiții rescrise.
+    """
+    if not os.path.exists(os.path.join(root, MANIFEST)):
+        return write_partitioned(df_new, root)
+    partitions = {(p["an"], p["luna"]): p for p in read_manifest(root)["partitions"]}
+    df_new = df_new[df_new["date"].notna()]
+    touched = 0
+    for (an, luna), part in df_new.groupby([df_new["date"].dt.year, df_new["date"].dt.month], sort=True):
+        key = (int(an), int(luna))
+        directory = partition_dir(root, *key)
+        if key in partitions:
+            part = pd.concat([load_columns(directory), part], ignore_index=True)
+        staged = _staging_dir(directory)
+        write_column_store(sort_by_date(part), staged)
+        _swap_dir(staged, directory)
+        partitions[key] = {"an": key[0], "luna": key[1], "rows": len(part)}
+        touched += 1
+    _write_partitions_manifest(root, [partitions[k] for k in sorted(partitions)])
+    return touched
+
+
+def load_transformed(
+    csv_path: str = CSV_TRANSFORMAT,
+    columnar_path: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    compact: bool = True,
+    store_path: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Încarcă datele transformate (ieșirea din convert.py).
+    Ordinea surselor, prima care este mai nouă decât CSV-ul:
+      1. depozitul de coloane .npy (memory-map, doar coloanele cerute)
+      2. copia Parquet (fără parsare de text și de date calendaristice)
+      3. CSV-ul, cu conversia coloanei 'date'
+    - store_path: None -> același nume ca CSV-ul, cu sufixul _coloane
+    - columnar_path: None -> același nume ca CSV-ul, cu extensia .parquet
+    - columns: citește doar coloanele cerute
+    - compact: aplică convert.SCHEMA (tipuri mici, zi_saptamana categorică);
+      False -> citește CSV-ul cu tipurile implicite pandas
+    """
+    if columnar_path is None:
+        columnar_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if store_path is None:
+        store_path = os.path.splitext(csv_path)[0] + "_coloane"
+
+    if compact and is_fresh(os.path.join(store_path, MANIFEST), csv_path):
+        return load_columns(store_path, columns)
+
+    # fișierul Parquet are deja schema aplicată
+    if compact and is_fresh(columnar_path, csv_path):
+        try:
+            return pd.read_parquet(columnar_path, columns=columns, memory_map=True)
+        except ImportError:
+            # pyarrow lipsește -> revenim la CSV
+            pass
+
+    df = pd.read_csv(csv_path, usecols=columns)
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"])
+    if compact:
+        df = apply_schema(df, copy=False)
+    return df
+
+
+def load_range(
+    an: Union[int, Iterable[int], None] = None,
+    luna: Union[int, Iterable[int], None] = None,
+    start=None,
+    end=None,
+    columns: Optional[List[str]] = None,
+    csv_path: str = CSV_TRANSFORMAT,
+    partitions_path: str = PARTITII_TRANSFORMAT
+) -> pd.DataFrame:
+    """
+    Datele transformate care satisfac predicatul (an, luna, interval [start, end)).
+    Cu setul partiționat la zi se deschid doar partițiile potrivite; altfel se citește
+    totul prin load_transformed și se filtrează.
+    """
+    if is_fresh(os.path.join(partitions_path, MANIFEST), csv_path):
+        return load_partitions(partitions_path, an, luna, start, end, columns)
+
+    needed = None if columns is None else list(dict.fromkeys(list(columns) + ["date"]))
+    df = sort_by_date(load_transformed(csv_path, columns=needed))
+    df = slice_range(df, start, end)
+    years, months = _as_list(an), _as_list(luna)
+    if years is not None:
+        df = df[df["date"].dt.year.isin(years)]
+    if months is not None:
+        df = df[df["date"].dt.month.isin(months)]
+    return df if columns is None else df[columns]
+
+
+def dataset_date_span(
+    csv_path: str = CSV_TRANSFORMAT,
+    partitions_path: str = PARTITII_TRANSFORMAT
+) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Prima și ultima dată din setul de date (din prima / ultima partiție, dacă există);
+    None dacă nu există nicio înregistrare cu dată validă.
+    """
+    if is_fresh(os.path.join(partitions_path, MANIFEST), csv_path):
+        partitions = read_manifest(partitions_path)["partitions"]
+        if not partitions:
+            return None
+        first = load_columns(partition_dir(partitions_path, partitions[0]["an"], partitions[0]["luna"]), ["date"])
+        last = load_columns(partition_dir(partitions_path, partitions[-1]["an"], partitions[-1]["luna"]), ["date"])
+        return first["date"].iloc[0], last["date"].iloc[-1]
+    dates = load_transformed(csv_path, columns=["date"])["date"].dropna()
+    if dates.empty:
+        return None
+    return dates.min(), dates.max()
+
+
+if __name__ == "__main__":
+    # Raport de memorie: CSV citit ca până acum vs. schema compactă
+    df_raw = load_transformed(compact=False)
+    print(memory_report(df_raw))
@@ -0,0 +1,51 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Sortează după 'date' (stabil); dacă datele sunt deja sortate nu face nicio copie."""
+    if df["date"].is_monotonic_increasing:
+        return df
+    return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def date_bounds(dates: np.ndarray, start=None, end=None) -> Tuple[int, int]:
+    """
+    Pozițiile [i0, i1) ale intervalului [start, end) într-un vector datetime64 sortat,
+    prin căutare binară (O(log n)). start / end None -> începutul / sfârșitul datelor.
+    """
+    i0 = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side="left"))
+    i1 = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side="left"))
+    return i0, max(i0, i1)
+
+
+def slice_range(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Rândurile cu 'date' în [start, end), pentru un DataFrame sortat după 'date'.
+    Rezultatul este o felie pozițională (fără mască booleană peste tot setul de date).
+    """
+    i0, i1 = date_bounds(df["date"].to_numpy(), start, end)
+    return df.iloc[i0:i1]
+
+
+def slice_year(df: pd.DataFrame, an: int) -> pd.DataFrame:
+    return slice_range(df, pd.Timestamp(an, 1, 1), pd.Timestamp(an + 1, 1, 1))
+
+
+def slice_month(df: pd.DataFrame, an: int, luna: int) -> pd.DataFrame:
+    start = pd.Timestamp(an, luna, 1)
+    return slice_range(df, start, start + pd.offsets.MonthBegin(1))
+
+
+def slice_day(df: pd.DataFrame, zi) -> pd.DataFrame:
+    start = pd.Timestamp(zi).normalize()
+    return slice_range(df, start, start + pd.Timedelta(days=1))
+
+
+def date_span(df: pd.DataFrame) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Prima și ultima dată (O(1) pentru date sortate); None pentru un DataFrame gol."""
+    if df.empty:
+        return None
+    return df["date"].iloc[0], df["date"].iloc[-1]
@@ -0,0 +1,138 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+PERCENTILE = [0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]
+
+
+def percentile_label(p: float) -> str:
+    """0.05 -> 'P5', 0.5 -> 'P50'."""
+    return f"P{int(round(p * 100))}"
+
+
+def describe_all(
+    df: pd.DataFrame,
+    columns: List[str],
+    by: Optional[str] = None,
+    percentiles: Sequence[float] = PERCENTILE
+) -> pd.DataFrame:
+    """
+    Calculează toate statisticile descriptive pentru `columns` dintr-o singură trecere NumPy.
+    Momentele (medie, varianță, asimetrie, aplatizare) se obțin din sume pe blocuri
+    (np.add.reduceat), iar mediana și percentilele dintr-o singură sortare per grup.
+    Valorile lipsă sunt ignorate, ca în pandas; std/var/skew/kurtosis folosesc aceleași
+    corecții ca pandas (ddof=1, estimatori nedeplasați).
+    - by: coloană de grupare (ex. 'an', 'luna', 'ora'); None -> tot setul de date
+    Returnează DataFrame cu un rând per coloană (index = coloana) sau per (grup, coloană),
+    și coloanele: count, mean, median, std, var, min, max, range, cv, skew, kurtosis, P5 ... P99.
+    """
+    values = df[columns].to_numpy(dtype="float64")
+    if by is None:
+        codes = np.zeros(len(df), dtype=np.intp)
+        keys = [None]
+    else:
+        codes, keys = pd.factorize(df[by], sort=True)
+        valid = codes >= 0
+        values, codes = values[valid], codes[valid]
+
+    order = np.argsort(codes, kind="stable")
+    values, codes = values[order], codes[order]
+    if len(values) == 0:
+        return pd.DataFrame()
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(codes)])
+    group_keys = [keys[c] for c in codes[starts]]
+
+    # ------------------------------
+    # Momente: sume pe blocuri de grup
+    # ------------------------------
+    mask = ~np.isnan(values)
+    filled = np.where(mask, values, 0.0)
+    n = np.add.reduceat(mask, starts, axis=0).astype("float64")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.add.reduceat(filled, starts, axis=0) / n
+        dev = np.where(mask, values - np.repeat(mean, sizes, axis=0), 0.0)
+        dev2 = dev * dev
+        m2 = np.add.reduceat(dev2, starts, axis=0)
+        m3 = np.add.reduceat(dev2 * dev, starts, axis=0)
+        m4 = np.add.reduceat(dev2 * dev2, starts, axis=0)
+
+        var = np.where(n > 1, m2 / (n - 1), np.nan)
+        std = np.sqrt(var)
+        # coeficienți de asimetrie / aplatizare corectați (aceleași formule ca pandas)
+        skew = np.where(n > 2, np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5, np.nan)
+        kurt = np.where(
+            n > 3,
+            n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+            - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)),
+            np.nan
+        )
+        skew = np.where(m2 == 0, 0.0, skew)
+        kurt = np.where(m2 == 0, 0.0, kurt)
+
+    vmin = np.fmin.reduceat(values, starts, axis=0)
+    vmax = np.fmax.reduceat(values, starts, axis=0)
+
+    # ------------------------------
+    # Mediană și percentile: o sortare per grup (toate coloanele deodată)
+    # ------------------------------
+    qs = [0.5] + list(percentiles)
+    quant = np.full((len(qs), len(starts), len(columns)), np.nan)
+    col_idx = np.arange(len(columns))
+    for g, (start, size) in enumerate(zip(starts, sizes)):
+        block = np.sort(values[start:start + size], axis=0)  # NaN ajung la final
+        n_valid = n[g]
+        for i, q in enumerate(qs):
+            pos = (n_valid - 1) * q
+            lo = np.floor(pos).astype(np.intp)
+            hi = np.ceil(pos).astype(np.intp)
+            ok = n_valid > 0
+            lo, hi = np.where(ok, lo, 0), np.where(ok, hi, 0)
+            v_lo, v_hi = block[lo, col_idx], block[hi, col_idx]
+            quant[i, g] = np.where(ok, v_lo + (v_hi - v_lo) * (pos - lo), np.nan)
+
+    stats = {
+        "count": n,
+        "mean": mean,
+        "median": quant[0],
+        "std": std,
+        "var": var,
+        "min": vmin,
+        "max": vmax,
+        "range": vmax - vmin,
+        "cv": std / mean * 100,
+        "skew": skew,
+        "kurtosis": kurt,
+    }
+    for i, q in enumerate(percentiles, start=1):
+        stats[percentile_label(q)] = quant[i]
+
+    if by is None:
+        index = pd.Index(columns)
+    else:
+        index = pd.MultiIndex.from_product([group_keys, columns], names=[by, None])
+    result = pd.DataFrame({name: arr.ravel() for name, arr in stats.items()}, index=index)
+
+    # pentru coloane întregi, min/max/range rămân întregi (ca în pandas)
+    if all(df[c].dtype.kind in "iu" for c in columns) and mask.all():
+        result[["min", "max", "range"]] = result[["min", "max", "range"]].astype("int64")
+    return result
+
+
+def describe_table(stats: pd.DataFrame) -> pd.DataFrame:
+    """Tabelul în formatul DataFrame.describe() (statistici pe rânduri, coloane pe coloane)."""
+    table = stats[["count", "mean", "std", "min", "P25", "P50", "P75", "max"]].T
+    table.index = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+    return table
+
+
+def percentile_table(stats: pd.DataFrame, percentiles: Sequence[float] = PERCENTILE) -> pd.DataFrame:
+    """Percentilele pe rânduri (P5 ... P99), coloanele setului de date pe coloane."""
+    return stats[[percentile_label(p) for p in percentiles]].T
+
+
+def group_table(stats: pd.DataFrame, column: str, fields: List[str]) -> pd.DataFrame:
+    """Statisticile `fields` ale unei coloane, pe grupuri (rezultatul describe_all cu `by`)."""
+    return stats.xs(column, level=1)[fields]
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+TESTE_NORMALITATE = ["shapiro", "anderson", "dagostino", "jarque_bera"]
+PRAG_SEMNIFICATIE = 0.05
+
+# testele vectorizate din SciPy și numărul minim de valori pentru care dau un rezultat
+_TESTE_SCIPY = {"shapiro": stats.shapiro, "dagostino": stats.normaltest, "jarque_bera": stats.jarque_bera}
+_MINIM_VALORI = {"shapiro": 3, "anderson": 3, "dagostino": 8, "jarque_bera": 2}
+
+
+def stratified_sample(
+    df: pd.DataFrame,
+    n: int,
+    by: Union[str, List[str], None] = None,
+    random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Eșantion de aproximativ n rânduri. Cu `by` (ex. 'an' sau ['an', 'luna']) fiecare grup
+    contribuie proporțional cu mărimea lui, deci toate perioadele sunt reprezentate.
+    """
+    n = min(n, len(df))
+    if by is None:
+        return df.sample(n=n, random_state=random_state)
+    return df.groupby(by, observed=True, group_keys=False).sample(frac=n / len(df), random_state=random_state)
+
+
+def _anderson(values: np.ndarray) -> tuple:
+    """Anderson-Darling pe fiecare coloană: (statistici, p-values; NaN dacă SciPy nu le calculează)."""
+    stat = np.full(values.shape[1], np.nan)
+    p_value = np.full(values.shape[1], np.nan)
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        col = col[~np.isnan(col)]
+        if len(col) < _MINIM_VALORI["anderson"]:
+            continue
+        try:
+            res = stats.anderson(col, method="interpolate")
+            stat[j], p_value[j] = res.statistic, res.pvalue
+        except TypeError:
+            # SciPy mai vechi: doar valori critice -> p-value aproximat ca prag (< 0.05 sau nu)
+            res = stats.anderson(col)
+            stat[j] = res.statistic
+            critical = res.critical_values[list(res.significance_level).index(5.0)]
+            p_value[j] = 1.0 if res.statistic < critical else 0.0
+    return stat, p_value
+
+
+def _run_test(test: str, values: np.ndarray) -> tuple:
+    """
+    Un test aplicat pe toate coloanele: deodată (axa 0) dacă matricea nu are NaN, altfel pe
+    fiecare coloană fără valorile ei lipsă. O coloană cu prea puține valori primește NaN.
+    """
+    if test == "anderson":
+        return _anderson(values)
+    if test not in _TESTE_SCIPY:
+        raise ValueError(f"Test de normalitate necunoscut: {test}")
+    func, minim = _TESTE_SCIPY[test], _MINIM_VALORI[test]
+    if len(values) >= minim and not np.isnan(values).any():
+        res = func(values, axis=0)
+        return np.atleast_1d(res.statistic), np.atleast_1d(res.pvalue)
+
+    stat = np.full(values.shape[1], np.nan)
+    p_value = np.full(values.shape[1], np.nan)
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        col = col[~np.isnan(col)]
+        if len(col) >= minim:
+            res = func(col)
+            stat[j], p_value[j] = res.statistic, res.pvalue
+    return stat, p_value
+
+
+def normality_tests(
+    df: pd.DataFrame,
+    columns: Sequence[str],
+    tests: Sequence[str] = ("shapiro",),
+    sample_size: Optional[int] = 5000,
+    by: Union[str, List[str], None] = None,
+    random_state: int = 42,
+    workers: int = 1
+) -> pd.DataFrame:
+    """
+    Testele de normalitate cerute (vezi TESTE_NORMALITATE) pe toate coloanele, într-un singur apel:
+    fiecare test primește matricea eșantionului și lucrează vectorizat pe coloane.
+    - sample_size: mărimea eșantionului (None -> toate rândurile); by -> eșantion stratificat
+    - workers > 1: testele rulează în paralel, pe fire de execuție
+    Returnează un rând per (test, coloană): statistic, p_value, normal (p_value > 0.05;
+    <NA> dacă testul nu a putut rula, ex. coloană cu prea puține valori prezente).
+    """
+    sample = df if sample_size is None else stratified_sample(df, sample_size, by, random_state)
+    values = sample[list(columns)].to_numpy(dtype="float64")
+
+    if workers > 1 and len(tests) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda t: _run_test(t, values), tests))
+    else:
+        results = [_run_test(t, values) for t in tests]
+
+    frames = []
+    for test, (stat, p_value) in zip(tests, results):
+        frames.append(pd.DataFrame({
+            "test": test,
+            "variabila": list(columns),
+            "statistic": stat,
+            "p_value": p_value,
+            "normal": pd.array(np.where(np.isnan(p_value), None, p_value > PRAG_SEMNIFICATIE), dtype="boolean"),
+        }))
+    result = pd.concat(frames, ignore_index=True)
+    result.attrs["sample_size"] = len(sample)
+    return result
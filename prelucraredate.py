@@ -1,12 +1,24 @@
 # cleaning_part1.py
+import argparse
+import logging
+import os
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from acumulatori import SchitaCuantile
+
+# Mesajele de diagnostic trec prin logging (nivel INFO; exemplele de rânduri la DEBUG).
+# Fiecare mesaj are în record.metrics valorile numerice afișate, pentru handlere structurate.
+# Fără handler activ (ex. rulare în batch), calculele folosite doar pentru afișare nu se mai fac.
+logger = logging.getLogger(__name__)
 
 def load_data(path: str, encoding: str = "utf-8") -> pd.DataFrame:
     """Încarcă CSV-ul într-un DataFrame."""
     df = pd.read_csv(path, encoding=encoding)
-    print(f"Date citite: {len(df)} rânduri, {len(df.columns)} coloane.")
+    logger.info("Date citite: %d rânduri, %d coloane.", len(df), len(df.columns),
+                extra={"metrics": {"path": path, "rows": len(df), "columns": len(df.columns)}})
     return df
 
 def report_missing(df: pd.DataFrame) -> pd.DataFrame:
@@ -20,8 +32,9 @@ def report_missing(df: pd.DataFrame) -> pd.DataFrame:
         "missing_count": missing_count,
         "missing_pct": missing_pct
     }).sort_values("missing_pct", ascending=False)
-    print("\n--- Valori lipsă pe coloane ---")
-    print(summary[summary["missing_count"] > 0])
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n--- Valori lipsă pe coloane ---\n%s", summary[summary["missing_count"] > 0],
+                    extra={"metrics": {"missing_count": missing_count[missing_count > 0].to_dict()}})
     return summary
 
 def detect_bad_rows(df: pd.DataFrame, threshold_row_pct: float = 50.0) -> pd.DataFrame:
@@ -31,9 +44,163 @@ def detect_bad_rows(df: pd.DataFrame, threshold_row_pct: float = 50.0) -> pd.Dat
     """
     row_missing_pct = (df.isna().sum(axis=1) / df.shape[1]) * 100
     bad_idx = df.index[row_missing_pct > threshold_row_pct].tolist()
-    print(f"\nRânduri cu > {threshold_row_pct}% valori lipsă: {len(bad_idx)}")
+    logger.info("\nRânduri cu > %s%% valori lipsă: %d", threshold_row_pct, len(bad_idx),
+                extra={"metrics": {"threshold_row_pct": threshold_row_pct, "bad_rows": len(bad_idx)}})
     return df.loc[bad_idx]
 
+@dataclass
+class ProfilCalitate:
+    """
+    Raportul de calitate a datelor produs de profile_data într-o singură trecere:
+      - missing_count: valori lipsă pe coloană
+      - row_missing_hist: numărul de rânduri după procentul de valori lipsă pe rând
+      - bad_rows: pozițiile (0..rows-1) rândurilor cu > threshold_row_pct% valori lipsă
+      - duplicate_count: rânduri identice cu un rând anterior (ca df.duplicated().sum())
+      - value_ranges: min / max pentru coloanele numerice
+    """
+    rows: int
+    missing_count: pd.Series
+    row_missing_hist: pd.Series
+    bad_rows: List[int]
+    duplicate_count: int
+    value_ranges: pd.DataFrame
+    threshold_row_pct: float = 50.0
+
+    @property
+    def missing_pct(self) -> pd.Series:
+        return (self.missing_count / self.rows) * 100 if self.rows else self.missing_count * 0.0
+
+    def missing_table(self) -> pd.DataFrame:
+        """Același tabel ca report_missing (col: missing_count, missing_pct), fără afișare."""
+        return pd.DataFrame({
+            "missing_count": self.missing_count,
+            "missing_pct": self.missing_pct
+        }).sort_values("missing_pct", ascending=False)
+
+def _hash_rows_stable(chunk: pd.DataFrame) -> np.ndarray:
+    """Hash pe rând care nu depinde de tipul inferat într-un chunk (int vs float cu NaN)."""
+    numeric = chunk.select_dtypes(include=[np.number]).columns
+    if len(numeric):
+        chunk = chunk.astype({col: "float64" for col in numeric})
+    return _row_hashes(chunk, None)
+
+class _MultimeChei:
+    """
+    Mulțime de hash-uri uint64 (8 bytes pe cheie) păstrată ca tablouri sortate, disjuncte,
+    fuzionate geometric (fiecare tablou are cel puțin dublul cheilor celui de după el):
+    o adăugare costă amortizat O(log n) pe cheie, nu o refacere a întregii mulțimi,
+    iar căutarea este o căutare binară în O(log n) tablouri.
+    """
+
+    def __init__(self, keys: Optional[np.ndarray] = None):
+        self.runs: List[np.ndarray] = []
+        if keys is not None:
+            self.add(keys)
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self.runs)
+
+    def _contains_sorted(self, h: np.ndarray) -> np.ndarray:
+        # căutarea binară a unor chei deja sortate parcurge tablourile în ordine (cache-friendly)
+        found = np.zeros(len(h), dtype=bool)
+        for run in self.runs:
+            pos = np.minimum(np.searchsorted(run, h), len(run) - 1)
+            found |= run[pos] == h
+        return found
+
+    def contains(self, h: np.ndarray) -> np.ndarray:
+        """Masca booleană a cheilor din `h` care sunt deja în mulțime."""
+        order = np.argsort(h)
+        found = np.empty(len(h), dtype=bool)
+        found[order] = self._contains_sorted(h[order])
+        return found
+
+    def add(self, h: np.ndarray) -> None:
+        """Adaugă cheile din `h` care nu sunt deja în mulțime."""
+        new = np.sort(np.asarray(h, dtype="uint64"))
+        new = new[np.r_[True, new[1:] != new[:-1]]] if len(new) else new
+        new = new[~self._contains_sorted(new)]
+        if not len(new):
+            return
+        self.runs.append(new)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]), kind="stable")
+
+    def to_array(self) -> np.ndarray:
+        """Toate cheile, sortate."""
+        if not self.runs:
+            return np.empty(0, dtype="uint64")
+        return np.sort(np.concatenate(self.runs), kind="stable")
+
+def profile_data(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    threshold_row_pct: float = 50.0
+) -> ProfilCalitate:
+    """
+    Profilul de calitate (valori lipsă pe coloană și pe rând, rânduri sărace, duplicate,
+    domeniul valorilor) calculat parcurgând datele o singură dată.
+    - data: un DataFrame sau un iterabil de chunk-uri (ex. pd.read_csv(..., chunksize=...))
+    Duplicatele se detectează prin hash-uri de 64 biți pe rând, deci și între chunk-uri.
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+    rows = 0
+    missing = None
+    hist = None
+    bad_rows = []
+    seen = _MultimeChei()
+    duplicates = 0
+    mins = maxs = None
+    for chunk in chunks:
+        isna = chunk.isna().to_numpy()
+        n_cols = chunk.shape[1]
+        col_missing = pd.Series(isna.sum(axis=0), index=chunk.columns)
+        row_missing = isna.sum(axis=1)
+        row_hist = np.bincount(row_missing, minlength=n_cols + 1)
+
+        bad = np.flatnonzero(row_missing * 100 > threshold_row_pct * n_cols)
+        bad_rows.extend((bad + rows).tolist())
+
+        h = _hash_rows_stable(chunk)
+        first = ~pd.Series(h).duplicated(keep="first").to_numpy() & ~seen.contains(h)
+        duplicates += int(len(h) - first.sum())
+        seen.add(h[first])
+
+        numeric = chunk.select_dtypes(include=[np.number])
+        chunk_min, chunk_max = numeric.min(), numeric.max()
+
+        if missing is None:
+            missing, hist, mins, maxs = col_missing, row_hist, chunk_min, chunk_max
+        else:
+            missing = missing + col_missing
+            hist = hist + row_hist
+            mins = pd.concat([mins, chunk_min], axis=1).min(axis=1)
+            maxs = pd.concat([maxs, chunk_max], axis=1).max(axis=1)
+        rows += len(chunk)
+
+    if missing is None:
+        empty = pd.Series(dtype="int64")
+        return ProfilCalitate(0, empty, empty, [], 0, pd.DataFrame(columns=["min", "max"]), threshold_row_pct)
+
+    n_cols = len(missing)
+    row_missing_hist = pd.Series(hist, index=np.arange(n_cols + 1) * 100 / n_cols, name="randuri")
+    row_missing_hist.index.name = "missing_pct_rand"
+    return ProfilCalitate(
+        rows=rows,
+        missing_count=missing,
+        row_missing_hist=row_missing_hist,
+        bad_rows=bad_rows,
+        duplicate_count=duplicates,
+        value_ranges=pd.DataFrame({"min": mins, "max": maxs}),
+        threshold_row_pct=threshold_row_pct,
+    )
+
+def profile_csv(path: str, threshold_row_pct: float = 50.0,
+                chunksize: int = 100_000, encoding: str = "utf-8") -> ProfilCalitate:
+    """profile_data pe un fișier CSV citit pe bucăți (memoria depinde de chunksize)."""
+    return profile_data(pd.read_csv(path, chunksize=chunksize, encoding=encoding), threshold_row_pct)
+
 def remove_duplicates(df: pd.DataFrame, subset: Optional[List[str]] = None, keep: str = "first") -> Tuple[pd.DataFrame, int]:
     """
     Detectează și elimină duplicate.
@@ -42,27 +209,208 @@ def remove_duplicates(df: pd.DataFrame, subset: Optional[List[str]] = None, keep
     Returnează (df_no_duplicates, n_removed)
     """
     before = len(df)
-    # număr duplicate
-    dup_mask = df.duplicated(subset=subset, keep=False)
-    n_total_duplicates = dup_mask.sum()
-    # opțional: afișează câteva rânduri duplicate pentru inspectare
-    if n_total_duplicates:
-        print(f"\nAu fost găsite {n_total_duplicates} rânduri care apar ca duplicat (nu neapărat eliminate încă).")
-        print("Exemple (duplicați):")
-        print(df[dup_mask].head(10))
+    # opțional (nivel DEBUG): numărul total de duplicate și câteva exemple pentru inspectare
+    if logger.isEnabledFor(logging.DEBUG):
+        dup_mask = df.duplicated(subset=subset, keep=False)
+        n_total_duplicates = int(dup_mask.sum())
+        if n_total_duplicates:
+            logger.debug("\nAu fost găsite %d rânduri care apar ca duplicat (nu neapărat eliminate încă).\n"
+                         "Exemple (duplicați):\n%s", n_total_duplicates, df[dup_mask].head(10),
+                         extra={"metrics": {"duplicate_rows": n_total_duplicates}})
     # eliminare efectivă
     df_clean = df.drop_duplicates(subset=subset, keep=keep)
     after = len(df_clean)
     removed = before - after
-    print(f"Duplicate eliminate: {removed} (rămase: {after}).")
+    logger.info("Duplicate eliminate: %d (rămase: %d).", removed, after,
+                extra={"metrics": {"removed": removed, "rows": after}})
     return df_clean, removed
 
+def _row_hashes(chunk: pd.DataFrame, subset: Optional[List[str]]) -> np.ndarray:
+    """Hash uint64 pe rând, calculat o singură dată pe coloanele cheie (toate coloanele dacă subset e None)."""
+    keys = chunk if subset is None else chunk[subset]
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+def _read_text_chunks(paths: List[str], chunksize: int, encoding: str) -> Iterator[pd.DataFrame]:
+    """
+    Citește mai multe fișiere CSV pe bucăți, cu toate valorile ca text (fără inferență de tip),
+    astfel încât aceeași valoare are același hash în orice fișier și rândurile se rescriu neschimbate.
+    """
+    columns = None
+    for path in paths:
+        for chunk in pd.read_csv(path, chunksize=chunksize, encoding=encoding,
+                                 dtype=str, keep_default_na=False):
+            if columns is None:
+                columns = chunk.columns.tolist()
+            elif chunk.columns.tolist() != columns:
+                raise ValueError(f"Fișierul '{path}' are alte coloane decât primul fișier.")
+            yield chunk
+
+def _lookup(keys: np.ndarray, h: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pentru fiecare hash din `h`: poziția în tabloul sortat `keys` și dacă se găsește acolo."""
+    if not len(keys):
+        return np.zeros(len(h), dtype="int64"), np.zeros(len(h), dtype=bool)
+    idx = np.minimum(np.searchsorted(keys, h), len(keys) - 1)
+    return idx, keys[idx] == h
+
+def load_key_index(path: str) -> np.ndarray:
+    """Index de chei (hash-uri uint64 sortate) salvat de remove_duplicates_chunked; gol dacă nu există."""
+    if os.path.exists(path):
+        return np.load(path, allow_pickle=False)
+    return np.empty(0, dtype="uint64")
+
+def remove_duplicates_chunked(
+    sources: List[str],
+    dst: str,
+    subset: Optional[List[str]] = None,
+    keep: Union[str, bool] = "first",
+    index_path: Optional[str] = None,
+    chunksize: int = 100_000,
+    encoding: str = "utf-8"
+) -> Tuple[int, int]:
+    """
+    Deduplicare streaming peste unul sau mai multe fișiere CSV (ex. exporturi zilnice care se
+    suprapun la granița zilelor), fără a încărca istoricul într-un singur DataFrame.
+    Fiecare rând se reduce la un hash de 64 biți al coloanelor cheie (subset); în memorie rămân
+    doar hash-urile cheilor distincte (_MultimeChei), nu rândurile. Valorile sunt comparate ca text,
+    exact cum apar în fișiere.
+    - keep: 'first' -> o singură trecere; False -> o trecere în plus care găsește cheile repetate;
+      'last' -> încă o trecere, care reține poziția ultimei apariții doar pentru cheile repetate
+    - index_path: fișier .npy cu cheile deja scrise la rulările anterioare; rândurile cu aceste chei
+      sunt ignorate (indiferent de keep), iar la final indexul se actualizează cu cheile noi
+    Returnează (rânduri_scrise, rânduri_eliminate).
+    """
+    if keep not in ("first", "last", False):
+        raise ValueError(f"keep trebuie să fie 'first', 'last' sau False, nu {keep!r}")
+    if isinstance(sources, str):
+        sources = [sources]
+
+    known = _MultimeChei(load_key_index(index_path) if index_path is not None else None)
+    written_keys = _MultimeChei()
+
+    repeated = last_pos = None
+    if keep != "first":
+        # Trecerea 1: cheile care apar de mai multe ori
+        seen, dups = _MultimeChei(), _MultimeChei()
+        for chunk in _read_text_chunks(sources, chunksize, encoding):
+            h = _row_hashes(chunk, subset)
+            dups.add(h[pd.Series(h).duplicated(keep="first").to_numpy() | seen.contains(h)])
+            seen.add(h)
+        del seen
+        repeated = dups.to_array()
+    if keep == "last" and len(repeated):
+        # Trecerea 2: poziția ultimei apariții a fiecărei chei repetate
+        last_pos = np.full(len(repeated), -1, dtype="int64")
+        pos = 0
+        for chunk in _read_text_chunks(sources, chunksize, encoding):
+            idx, hit = _lookup(repeated, _row_hashes(chunk, subset))
+            np.maximum.at(last_pos, idx[hit], pos + np.flatnonzero(hit))
+            pos += len(chunk)
+
+    written = removed = 0
+    pos = 0
+    first = True
+    for chunk in _read_text_chunks(sources, chunksize, encoding):
+        h = _row_hashes(chunk, subset)
+        if keep == "first":
+            # prima apariție: nu s-a mai scris în chunk-urile anterioare și nici mai sus în acest chunk
+            mask = ~pd.Series(h).duplicated(keep="first").to_numpy() & ~written_keys.contains(h)
+        else:
+            idx, hit = _lookup(repeated, h)
+            mask = ~hit
+            if last_pos is not None:
+                mask[hit] = last_pos[idx[hit]] == pos + np.flatnonzero(hit)
+        pos += len(h)
+        mask &= ~known.contains(h)
+        written_keys.add(h[mask])
+
+        out = chunk[mask]
+        out.to_csv(dst, index=False, header=first, mode="w" if first else "a")
+        first = False
+        written += len(out)
+        removed += len(chunk) - len(out)
+
+    n_new = len(written_keys)
+    if index_path is not None:
+        known.add(written_keys.to_array())
+        np.save(index_path, known.to_array(), allow_pickle=False)
+
+    logger.info("Duplicate eliminate: %d (rămase: %d, chei noi: %d).", removed, written, n_new,
+                extra={"metrics": {"removed": removed, "rows": written, "new_keys": n_new}})
+    return written, removed
+
+def _gap_bounds(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pentru fiecare celulă a matricei `values` (rânduri sortate în timp × coloane):
+    poziția ultimei valori prezente de deasupra (-1 dacă nu există) și a primei
+    valori prezente de dedesubt (n dacă nu există). Calculat pe toate coloanele deodată.
+    """
+    n = values.shape[0]
+    valid = ~np.isnan(values)
+    rows = np.arange(n)[:, None]
+    prev = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    nxt = np.minimum.accumulate(np.where(valid, rows, n)[::-1], axis=0)[::-1]
+    return prev, nxt
+
+def _fill_time_gaps(
+    values: np.ndarray,
+    t: np.ndarray,
+    strategy: str,
+    profile: Optional[np.ndarray] = None,
+    max_gap: Optional[float] = None
+) -> np.ndarray:
+    """
+    Completează golurile (NaN) din `values` (rânduri sortate după timpul `t`, în secunde).
+      - 'interpolate': interpolare liniară ponderată cu timpul între valorile vecine
+        (golurile de la capete rămân NaN, nu se extrapolează)
+      - 'seasonal': valoarea din `profile` (aceeași formă ca values)
+    max_gap: golurile în care distanța dintre valorile prezente vecine depășește
+    max_gap secunde rămân NaN (golurile de la capete au lungime infinită).
+    """
+    n = values.shape[0]
+    prev, nxt = _gap_bounds(values)
+    missing = np.isnan(values)
+    has_prev, has_next = prev >= 0, nxt < n
+    prev_c, next_c = np.clip(prev, 0, n - 1), np.clip(nxt, 0, n - 1)
+    t_prev, t_next = t[prev_c], t[next_c]
+
+    if max_gap is not None:
+        span = np.where(has_prev & has_next, t_next - t_prev, np.inf)
+        missing &= span <= max_gap
+
+    filled = values.copy()
+    if strategy == "interpolate":
+        missing &= has_prev & has_next
+        v_prev = np.take_along_axis(values, prev_c, axis=0)
+        v_next = np.take_along_axis(values, next_c, axis=0)
+        span_t = t_next - t_prev
+        with np.errstate(invalid="ignore", divide="ignore"):
+            w = np.where(span_t > 0, (t[:, None] - t_prev) / span_t, 0.0)
+        filled[missing] = (v_prev + w * (v_next - v_prev))[missing]
+    else:
+        filled[missing] = profile[missing]
+    return filled
+
+def _log_fill(values: Optional[pd.Series], col: str, tip: str, fill_val, n_before: Optional[int] = None) -> None:
+    """
+    Mesajul 'Col ...: n -> 0 NaN (umplut cu ...)'. Valorile lipsă se numără doar dacă
+    mesajul chiar e emis; după umplere cu o valoare validă nu mai rămâne niciun NaN.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if n_before is None:
+        n_before = int(values.isna().sum())
+    shown = fill_val if tip == "numeric" else f"'{fill_val}'"
+    logger.info("Col %s '%s': %d -> 0 NaN (umplut cu %s).", tip, col, n_before, shown,
+                extra={"metrics": {"column": col, "missing_before": n_before, "missing_after": 0,
+                                   "fill_value": fill_val}})
+
 def impute_missing(
     df: pd.DataFrame,
     strategy: str = "median",
     numeric_cols: Optional[List[str]] = None,
     categorical_cols: Optional[List[str]] = None,
-    date_col: Optional[str] = None
+    date_col: Optional[str] = None,
+    max_gap: Optional[Union[str, pd.Timedelta]] = None
 ) -> Tuple[pd.DataFrame, dict]:
     """
     Tratează valorile lipsă.
@@ -71,9 +419,14 @@ def impute_missing(
       - 'median': pentru coloane numerice -> mediană; categorice -> modul
       - 'mode': pentru numerice -> mod (rareori folosit), categorice -> mod
       - 'ffill': forward-fill (util pentru serii temporale; recomandat cu date sortate)
+      - 'interpolate': numerice -> interpolare liniară în timp (după date_col); categoricele rămân neatinse
+      - 'seasonal': numerice -> media pentru aceeași zi a săptămânii × oră (profil sezonier)
     Parametri:
       - numeric_cols / categorical_cols: liste explicite (dacă None se detectează automat)
       - date_col: dacă se dorește imputare pe serie temporală, trece coloana date pentru sortare înainte de ffill
+        (obligatoriu pentru 'interpolate' și 'seasonal')
+      - max_gap: doar pentru 'interpolate' / 'seasonal' - golurile mai lungi de atât (ex. "6h")
+        rămân necompletate; None -> fără limită
     Returnează (df_imputed, info_dict) cu statistici despre imputare.
     """
     info = {"before_missing": df.isna().sum().to_dict()}
@@ -91,7 +444,8 @@ def impute_missing(
         before = len(df_work)
         df_work = df_work.dropna()
         info["dropped_rows"] = before - len(df_work)
-        print(f"Drop strategy: am eliminat {info['dropped_rows']} rânduri care conțineau NaN.")
+        logger.info("Drop strategy: am eliminat %d rânduri care conțineau NaN.", info["dropped_rows"],
+                    extra={"metrics": {"dropped_rows": info["dropped_rows"]}})
         info["after_missing"] = df_work.isna().sum().to_dict()
         return df_work, info
 
@@ -99,7 +453,44 @@ def impute_missing(
         if date_col and date_col in df_work.columns:
             df_work = df_work.sort_values(date_col)
         df_work = df_work.ffill().bfill()
-        print("Imputare ffill/bfill aplicată (ordinea: sort după date dacă a fost indicată).")
+        logger.info("Imputare ffill/bfill aplicată (ordinea: sort după date dacă a fost indicată).")
+        info["after_missing"] = df_work.isna().sum().to_dict()
+        return df_work, info
+
+    if strategy in ("interpolate", "seasonal"):
+        if not date_col or date_col not in df_work.columns:
+            raise ValueError(f"Strategia '{strategy}' necesită coloana de timp (date_col).")
+        cols = [c for c in numeric_cols if c in df_work.columns and c != date_col]
+        dates = pd.to_datetime(df_work[date_col], errors="coerce")
+        # rândurile fără dată validă nu participă (nici ca sursă, nici ca țintă)
+        pos = np.flatnonzero(dates.notna().to_numpy())
+        pos = pos[np.argsort(dates.to_numpy()[pos], kind="stable")]
+        ordered = dates.iloc[pos]
+
+        numeric = df_work[cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64", copy=True)
+        values = numeric[pos]
+        t = ordered.to_numpy().astype("datetime64[s]").astype("float64")
+
+        profile = None
+        if strategy == "seasonal":
+            keys = [ordered.dt.dayofweek.to_numpy(), ordered.dt.hour.to_numpy()]
+            means = pd.DataFrame(values, columns=cols).groupby(keys).transform("mean")
+            profile = means.to_numpy(dtype="float64")
+
+        gap = pd.Timedelta(max_gap).total_seconds() if max_gap is not None else None
+        filled = _fill_time_gaps(values, t, strategy, profile=profile, max_gap=gap)
+
+        n_before = np.isnan(numeric).sum(axis=0)
+        numeric[pos] = filled
+        n_after = np.isnan(numeric).sum(axis=0)
+        # doar coloanele în care s-a completat ceva se rescriu (float64); celelalte își păstrează tipul
+        changed = np.flatnonzero(n_before > n_after)
+        for j in changed:
+            df_work[cols[j]] = numeric[:, j]
+        info["filled"] = dict(zip(cols, (n_before - n_after).tolist()))
+        logger.info("Imputare '%s' aplicată pe %d coloane numerice (%d valori completate, %d rămase NaN).",
+                    strategy, len(cols), int((n_before - n_after).sum()), int(n_after.sum()),
+                    extra={"metrics": {"strategy": strategy, "filled": info["filled"]}})
         info["after_missing"] = df_work.isna().sum().to_dict()
         return df_work, info
 
@@ -119,10 +510,8 @@ def impute_missing(
                     mode = df_work[col].mode(dropna=True)
                     fill_val = mode[0] if not mode.empty else np.nan
                 if pd.notna(fill_val):
-                    n_before = df_work[col].isna().sum()
+                    _log_fill(df_work[col], col, "numeric", fill_val)
                     df_work[col] = df_work[col].fillna(fill_val)
-                    n_after = df_work[col].isna().sum()
-                    print(f"Col numeric '{col}': {n_before} -> {n_after} NaN (umplut cu {fill_val}).")
 
         # Categorical: fill with mode
         for col in categorical_cols:
@@ -130,23 +519,173 @@ def impute_missing(
                 mode_vals = df_work[col].mode(dropna=True)
                 if not mode_vals.empty:
                     fill_val = mode_vals[0]
-                    n_before = df_work[col].isna().sum()
+                    _log_fill(df_work[col], col, "categoric", fill_val)
                     df_work[col] = df_work[col].fillna(fill_val)
-                    n_after = df_work[col].isna().sum()
-                    print(f"Col categoric '{col}': {n_before} -> {n_after} NaN (umplut cu '{fill_val}').")
                 else:
                     # dacă nu există mod (ex. toate NaN) nu facem nimic
-                    print(f"Col categoric '{col}': nu s-a găsit mod (toate NaN?).")
+                    logger.info("Col categoric '%s': nu s-a găsit mod (toate NaN?).", col,
+                                extra={"metrics": {"column": col, "fill_value": None}})
 
         info["after_missing"] = df_work.isna().sum().to_dict()
         return df_work, info
 
     raise ValueError(f"Strategie necunoscută: {strategy}")
 
+def _merge_counts(acc: dict, counts: pd.Series) -> None:
+    """Adună pe loc în `acc` (valoare -> apariții) o numărătoare parțială (value_counts)."""
+    for value, n in zip(counts.index.tolist(), counts.to_numpy().tolist()):
+        acc[value] = acc.get(value, 0) + n
+
+def _median_from_counts(counts: pd.Series) -> float:
+    """Mediana exactă calculată din numărătoarea valorilor (valoare -> apariții)."""
+    if counts.empty:
+        return np.nan
+    counts = counts.sort_index()
+    cum = counts.to_numpy().cumsum()
+    n = cum[-1]
+    values = counts.index.to_numpy(dtype=float)
+    lo = values[np.searchsorted(cum, (n - 1) // 2 + 1)]
+    hi = values[np.searchsorted(cum, n // 2 + 1)]
+    return (lo + hi) / 2
+
+def _mode_from_counts(counts: pd.Series):
+    """Modul din numărătoarea valorilor; la egalitate, cea mai mică valoare (ca Series.mode()[0])."""
+    if counts.empty:
+        return np.nan
+    return sorted(counts.index[counts == counts.max()])[0]
+
+def impute_missing_chunked(
+    src: str,
+    dst: str,
+    strategy: str = "median",
+    numeric_cols: Optional[List[str]] = None,
+    categorical_cols: Optional[List[str]] = None,
+    date_col: Optional[str] = "date",
+    max_categories: int = 10_000,
+    chunksize: int = 100_000,
+    encoding: str = "utf-8"
+) -> dict:
+    """
+    Variantă streaming (două treceri) a impute_missing pentru strategiile 'median' și 'mode',
+    pentru fișiere CSV mai mari decât memoria.
+      - trecerea 1: numără aparițiile fiecărei valori pe coloană (value_counts pe chunk-uri),
+        cel mult `max_categories` valori distincte pe coloană; valorile lipsă se contorizează tot aici
+      - trecerea 2: completează fiecare chunk și îl adaugă în `dst`
+    Memoria depinde de chunksize și de max_categories, nu de numărul de rânduri:
+      - cât timp o coloană numerică are cel mult max_categories valori distincte (ex. valori
+        întregi în MW), mediana / modul sunt exacte
+      - peste limită, mediana se estimează cu o schiță de cuantile (acumulatori.SchitaCuantile,
+        eroare relativă cel mult 1%), iar cu strategia 'mode' coloana rămâne necompletată
+        (o coloană continuă nu are un mod util)
+    Dacă numeric_cols / categorical_cols sunt None, coloanele se detectează după tipurile din primul chunk;
+    la detectarea automată a categoricelor se exclude `date_col`; o coloană categorică cu peste
+    `max_categories` valori distincte (coloană-cheie) nu mai e numărată și rămâne necompletată.
+    Returnează info_dict ca impute_missing (before_missing, after_missing, fill_values, rows).
+    """
+    if strategy not in ("median", "mode"):
+        raise ValueError(f"Strategie necunoscută pentru imputarea pe chunk-uri: {strategy}")
+
+    # ---- Trecerea 1: numărători de valori + valori lipsă ----
+    counts = {}
+    sketches = {}
+    before_missing = None
+    coerced_missing = None
+    n_rows = 0
+    for chunk in pd.read_csv(src, chunksize=chunksize, encoding=encoding):
+        if before_missing is None:
+            if numeric_cols is None:
+                numeric_cols = chunk.select_dtypes(include=[np.number]).columns.tolist()
+            if categorical_cols is None:
+                categorical_cols = [c for c in chunk.columns if c not in numeric_cols and c != date_col]
+            numeric_cols = [c for c in numeric_cols if c in chunk.columns]
+            categorical_cols = [c for c in categorical_cols if c in chunk.columns]
+            before_missing = chunk.isna().sum()
+            coerced_missing = pd.Series(0, index=numeric_cols + categorical_cols)
+            counts = {col: {} for col in numeric_cols + categorical_cols}
+        else:
+            before_missing = before_missing + chunk.isna().sum()
+        n_rows += len(chunk)
+
+        for col in numeric_cols + categorical_cols:
+            values = pd.to_numeric(chunk[col], errors="coerce") if col in numeric_cols else chunk[col]
+            coerced_missing[col] += values.isna().sum()
+            if col in sketches:
+                sketches[col].update(values.to_numpy(dtype="float64")[:, None])
+                continue
+            if col not in counts:
+                continue
+            _merge_counts(counts[col], values.value_counts(dropna=True))
+            if len(counts[col]) <= max_categories:
+                continue
+            if col in numeric_cols and strategy == "median":
+                # coloană continuă: numărătoarea exactă trece într-o schiță de cuantile (memorie limitată)
+                col_counts = pd.Series(counts.pop(col), dtype="float64")
+                sketches[col] = SchitaCuantile([col]).update(col_counts.index.to_numpy(dtype="float64")[:, None],
+                                                              col_counts.to_numpy())
+                logger.info("Col numeric '%s': peste %d valori distincte, mediana se estimează aproximativ.",
+                            col, max_categories, extra={"metrics": {"column": col}})
+            else:
+                # coloană-cheie sau continuă (aproape toate valorile distincte): modul nu are sens
+                tip = "numeric" if col in numeric_cols else "categoric"
+                logger.warning("Col %s '%s': peste %d valori distincte, nu se completează.",
+                               tip, col, max_categories, extra={"metrics": {"column": col, "fill_value": None}})
+                del counts[col]
+
+    if before_missing is None:
+        return {"before_missing": {}, "after_missing": {}, "fill_values": {}, "rows": 0}
+
+    fill_values = {}
+    for col in numeric_cols:
+        if col in sketches:
+            fill_values[col] = sketches[col].quantiles([0.5])[0, 0]
+        elif col in counts:
+            col_counts = pd.Series(counts[col], dtype="float64")
+            fill_values[col] = _median_from_counts(col_counts) if strategy == "median" else _mode_from_counts(col_counts)
+    for col in categorical_cols:
+        if col in counts:
+            fill_values[col] = _mode_from_counts(pd.Series(counts[col], dtype="object"))
+    fill_values = {col: val for col, val in fill_values.items() if pd.notna(val)}
+
+    # ---- Trecerea 2: completare + scriere ----
+    first = True
+    for chunk in pd.read_csv(src, chunksize=chunksize, encoding=encoding):
+        for col in numeric_cols:
+            chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+        chunk = chunk.fillna(fill_values)
+        chunk.to_csv(dst, index=False, header=first, mode="w" if first else "a")
+        first = False
+
+    # după completare rămân lipsă doar coloanele fără valoare de umplere
+    after_missing = before_missing.copy()
+    for col in numeric_cols + categorical_cols:
+        after_missing[col] = 0 if col in fill_values else coerced_missing[col]
+
+    for col in numeric_cols + categorical_cols:
+        tip = "numeric" if col in numeric_cols else "categoric"
+        if col in fill_values:
+            _log_fill(None, col, tip, fill_values[col], n_before=int(coerced_missing[col]))
+        elif tip == "categoric" and col in counts:
+            logger.info("Col categoric '%s': nu s-a găsit mod (toate NaN?).", col,
+                        extra={"metrics": {"column": col, "fill_value": None}})
+
+    return {
+        "before_missing": before_missing.to_dict(),
+        "after_missing": after_missing.to_dict(),
+        "fill_values": fill_values,
+        "rows": n_rows,
+    }
+
 # -------------------------
 # Exemplar de rulare
 # -------------------------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Curățarea datelor brute (valori lipsă, duplicate).")
+    parser.add_argument("-q", "--quiet", action="store_true", help="doar avertismente și erori")
+    parser.add_argument("-v", "--verbose", action="store_true", help="include exemple de rânduri (DEBUG)")
+    args = parser.parse_args()
+    level = logging.WARNING if args.quiet else logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(level=level, format="%(message)s")
+
     # Înlocuiește cu calea ta
     input_csv = "datalab1.csv"
 
@@ -160,13 +699,10 @@ if __name__ == "__main__":
 
     # 2) Tratare valori lipsă (alege strategia: 'median', 'ffill', 'drop', 'mode')
     df_imputed, impute_info = impute_missing(df, strategy="median")
-    print("\nSumar imputare (excerpts):")
-    for k, v in list(impute_info["before_missing"].items())[:10]:
-        pass  # doar exemple; poți printa aici dacă vrei
 
     # 3) Verificare + eliminare duplicate (poți da subset dacă ai chei)
     df_no_dup, removed = remove_duplicates(df_imputed, subset=None, keep="first")
 
     # Salvare
     df_no_dup.to_csv("energy_data.csv", index=False)
-    print("\nFișier salvat: energy_data.csv")
+    logger.info("\nFișier salvat: energy_data.csv")
@@ -0,0 +1,427 @@
+import json
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from convert import calendar_fields
+from interval_timp import sort_by_date
+
+TINTE_PROGNOZA = ["consum", "productie", "sold"]
+ORIZONT = "24h"
+MODELE_PROGNOZA = "modele_prognoza.json"
+
+ORA = pd.Timedelta("1h")
+
+
+def _observations(df: pd.DataFrame, targets: Sequence[str]) -> Tuple[pd.Series, np.ndarray]:
+    """Datele (sortate) și valorile țintelor ca matrice (rânduri x ținte)."""
+    df = sort_by_date(df)
+    return df["date"].reset_index(drop=True), df[list(targets)].to_numpy(dtype="float64")
+
+
+def _hours(dates) -> np.ndarray:
+    return pd.DatetimeIndex(dates).hour.to_numpy()
+
+
+def _frame(dates, values: np.ndarray, targets: Sequence[str]) -> pd.DataFrame:
+    return pd.DataFrame(values, index=pd.DatetimeIndex(dates, name="date"), columns=list(targets))
+
+
+class NaivSezonier:
+    """
+    Prognoza naivă sezonieră: ultima valoare observată la aceeași oră din zi.
+    Pe date neregulate, fiecare oră din zi păstrează ultima observație căzută în ea;
+    orele fără nicio observație primesc ultima valoare cunoscută.
+    """
+    nume = "naiv_sezonier"
+
+    def __init__(self, targets: Sequence[str] = TINTE_PROGNOZA):
+        self.targets = list(targets)
+        self.table = np.full((24, len(self.targets)), np.nan)
+        self.last_value = np.full(len(self.targets), np.nan)
+        self.last_time: Optional[pd.Timestamp] = None
+
+    def fit(self, df: pd.DataFrame) -> "NaivSezonier":
+        return self.update(df)
+
+    def update(self, df_new: pd.DataFrame) -> "NaivSezonier":
+        """Rândurile noi (ulterioare celor deja văzute) suprascriu ultimele valori pe oră."""
+        dates, values = _observations(df_new, self.targets)
+        if dates.empty:
+            return self
+        # ultima valoare nenulă pe fiecare oră din zi, respectiv pe tot lotul
+        last = pd.DataFrame(values).groupby(_hours(dates)).last()
+        hours = last.index.to_numpy()
+        self.table[hours] = np.where(last.isna(), self.table[hours], last)
+        latest = pd.DataFrame(values).ffill().to_numpy()[-1]
+        self.last_value = np.where(np.isnan(latest), self.last_value, latest)
+        self.last_time = dates.iloc[-1]
+        return self
+
+    def predict(self, dates) -> pd.DataFrame:
+        values = self.table[_hours(dates)]
+        return _frame(dates, np.where(np.isnan(values), self.last_value, values), self.targets)
+
+    def to_dict(self) -> dict:
+        return {"targets": self.targets, "table": _to_list(self.table),
+                "last_value": _to_list(self.last_value), "last_time": _time_str(self.last_time)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NaivSezonier":
+        model = cls(data["targets"])
+        model.table = _from_list(data["table"])
+        model.last_value = _from_list(data["last_value"])
+        model.last_time = _time(data["last_time"])
+        return model
+
+
+# Grila de parametri încercată la antrenarea Holt-Winters (nivel, pantă, sezonalitate)
+ALFA = (0.05, 0.1, 0.2, 0.4)
+BETA = (0.0, 0.005)
+GAMA = (0.05, 0.1, 0.2, 0.3)
+
+
+class HoltWinters:
+    """
+    Netezire exponențială Holt-Winters aditivă (nivel, pantă, sezonalitate zilnică pe 24 de ore),
+    adaptată măsurătorilor neregulate: între două observații nivelul avansează cu panta
+    înmulțită cu numărul de ore scurse, iar sezonalitatea se citește la ora din zi a observației.
+    fit() rulează simultan recursia pentru toate combinațiile (ALFA, BETA, GAMA) și toate țintele
+    (matrice combinații x ținte) și păstrează, per țintă, combinația cu eroarea pătratică
+    minimă la un pas. update() continuă recursia pe rândurile noi, cu parametrii aleși.
+    """
+    nume = "holt_winters"
+
+    def __init__(self, targets: Sequence[str] = TINTE_PROGNOZA):
+        self.targets = list(targets)
+        self.params: Optional[np.ndarray] = None
+        self.level = self.slope = None
+        self.season: Optional[np.ndarray] = None
+        self.last_time: Optional[pd.Timestamp] = None
+
+    @staticmethod
+    def _run(dates, values, alpha, beta, gamma, level, slope, season, last_time):
+        """
+        Recursia pe observații; parametrii și stările au forma (combinații, ținte),
+        sezonalitatea (combinații, 24, ținte). Returnează stările finale și suma erorilor pătratice.
+        """
+        sse = np.zeros_like(level)
+        steps = np.diff(np.r_[np.datetime64(last_time, "ns"), dates.to_numpy(dtype="datetime64[ns]")])
+        steps = steps / np.timedelta64(1, "h")
+        cols = np.arange(values.shape[1])
+        for h, hour, y in zip(steps, _hours(dates), values):
+            observed = ~np.isnan(y)
+            prev_level = level + h * slope
+            s = season[:, hour, cols]
+            err = np.where(observed, y - prev_level - s, 0.0)
+            sse += err * err
+            level = np.where(observed, prev_level + alpha * err, prev_level)
+            slope = np.where(observed, slope + beta * alpha * err / np.maximum(h, 1.0), slope)
+            season[:, hour, cols] = np.where(observed, s + gamma * (1 - alpha) * err, s)
+        return level, slope, season, sse
+
+    def fit(self, df: pd.DataFrame) -> "HoltWinters":
+        dates, values = _observations(df, self.targets)
+        # starea inițială: media și profilul orar din prima săptămână
+        start = dates < dates.iloc[0] + pd.Timedelta("7D")
+        level0 = np.nanmean(values[start], axis=0)
+        profile = pd.DataFrame(values[start] - level0).groupby(_hours(dates[start])).mean()
+        season0 = np.nan_to_num(profile.reindex(range(24)).to_numpy())
+
+        grid = np.array([(a, b, g) for a in ALFA for b in BETA for g in GAMA])
+        n, k = len(grid), len(self.targets)
+        alpha, beta, gamma = (np.repeat(grid[:, [i]], k, axis=1) for i in range(3))
+        level, slope, season, sse = self._run(
+            dates, values, alpha, beta, gamma, np.tile(level0, (n, 1)), np.zeros((n, k)),
+            np.tile(season0, (n, 1, 1)), dates.iloc[0])
+
+        best = sse.argmin(axis=0)
+        cols = np.arange(k)
+        self.params = grid[best]
+        self.level, self.slope = level[best, cols][None], slope[best, cols][None]
+        self.season = season[best, :, cols].T[None]
+        self.last_time = dates.iloc[-1]
+        return self
+
+    def update(self, df_new: pd.DataFrame) -> "HoltWinters":
+        dates, values = _observations(df_new, self.targets)
+        if dates.empty:
+            return self
+        alpha, beta, gamma = (self.params[:, i][None] for i in range(3))
+        self.level, self.slope, self.season, _ = self._run(
+            dates, values, alpha, beta, gamma, self.level, self.slope, self.season, self.last_time)
+        self.last_time = dates.iloc[-1]
+        return self
+
+    def predict(self, dates) -> pd.DataFrame:
+        h = ((pd.DatetimeIndex(dates) - self.last_time) / ORA).to_numpy()[:, None]
+        values = self.level + h * self.slope + self.season[0, _hours(dates)]
+        return _frame(dates, values, self.targets)
+
+    def to_dict(self) -> dict:
+        return {"targets": self.targets, "params": _to_list(self.params), "level": _to_list(self.level),
+                "slope": _to_list(self.slope), "season": _to_list(self.season),
+                "last_time": _time_str(self.last_time)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HoltWinters":
+        model = cls(data["targets"])
+        for camp in ("params", "level", "slope", "season"):
+            setattr(model, camp, _from_list(data[camp]))
+        model.last_time = _time(data["last_time"])
+        return model
+
+
+class RidgeLaguri:
+    """
+    Regresie ridge pe caracteristici calendaristice (ora, zi_saptamana, luna, codificate one-hot
+    cu convert.calendar_fields) și pe valorile decalate ale tuturor țintelor: ultima observație
+    de la cel puțin `lags` în urmă (implicit 24h și 168h, deci prognoza pe 24h folosește doar
+    date cunoscute). Toate țintele se rezolvă într-un singur sistem liniar (mai multe coloane
+    în membrul drept). Se păstrează doar X^T X, X^T Y și coada de observații necesară decalajelor,
+    deci update() pe rânduri noi dă exact aceiași coeficienți ca o reantrenare completă.
+    Rândurile cu valori lipsă (țintă sau decalaj) nu intră în antrenare.
+    """
+    nume = "ridge"
+
+    # valorile decalate sunt în GWh, ca penalizarea să fie comparabilă cu a variabilelor one-hot
+    SCALA = 1000.0
+
+    def __init__(self, targets: Sequence[str] = TINTE_PROGNOZA, lags: Sequence[str] = ("24h", "168h"),
+                 lam: float = 1.0):
+        self.targets = list(targets)
+        self.lags = list(lags)
+        self.lam = lam
+        n_features = 1 + 24 + 7 + 12 + len(self.lags) * len(self.targets)
+        self.xtx = np.zeros((n_features, n_features))
+        self.xty = np.zeros((n_features, len(self.targets)))
+        self.rows = 0
+        self.coef: Optional[np.ndarray] = None
+        self.tail = pd.DataFrame(columns=["date"] + self.targets)
+        self.last_time: Optional[pd.Timestamp] = None
+
+    def _features(self, dates: pd.Series, history: pd.DataFrame) -> np.ndarray:
+        cal = calendar_fields(pd.Series(pd.DatetimeIndex(dates)))
+        n = len(dates)
+        parts = [np.ones((n, 1))]
+        for values, size, offset in ((cal["ora"], 24, 0), (cal["zi_saptamana"].cat.codes, 7, 0),
+                                     (cal["luna"], 12, 1)):
+            onehot = np.zeros((n, size))
+            onehot[np.arange(n), np.asarray(values, dtype="int64") - offset] = 1.0
+            parts.append(onehot)
+        hist_dates = history["date"].to_numpy(dtype="datetime64[ns]")
+        hist_values = history[self.targets].to_numpy(dtype="float64") / self.SCALA
+        query = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[ns]")
+        for lag in self.lags:
+            pos = np.searchsorted(hist_dates, query - pd.Timedelta(lag).to_timedelta64(), side="right") - 1
+            lagged = np.where((pos >= 0)[:, None], hist_values[np.maximum(pos, 0)], np.nan)
+            parts.append(lagged)
+        return np.hstack(parts)
+
+    def _solve(self) -> None:
+        penalty = self.lam * np.eye(len(self.xtx))
+        penalty[0, 0] = 0.0
+        self.coef = np.linalg.solve(self.xtx + penalty, self.xty)
+
+    def fit(self, df: pd.DataFrame) -> "RidgeLaguri":
+        return self.update(df)
+
+    def update(self, df_new: pd.DataFrame) -> "RidgeLaguri":
+        new = sort_by_date(df_new)[["date"] + self.targets].reset_index(drop=True)
+        if new.empty:
+            return self
+        history = pd.concat([self.tail, new], ignore_index=True) if len(self.tail) else new
+        x = self._features(new["date"], history)
+        y = new[self.targets].to_numpy(dtype="float64")
+        ok = ~(np.isnan(x).any(axis=1) | np.isnan(y).any(axis=1))
+        self.xtx += x[ok].T @ x[ok]
+        self.xty += x[ok].T @ y[ok]
+        self.rows += int(ok.sum())
+        self._solve()
+
+        self.last_time = history["date"].iloc[-1]
+        # coada: decalajul maxim + orizontul (prognoza cere decalaje de la momente viitoare)
+        keep = max(pd.Timedelta(lag) for lag in self.lags) + pd.Timedelta(ORIZONT)
+        self.tail = history[history["date"] >= self.last_time - keep].reset_index(drop=True)
+        return self
+
+    def predict(self, dates) -> pd.DataFrame:
+        return _frame(dates, self._features(pd.Series(dates), self.tail) @ self.coef, self.targets)
+
+    def to_dict(self) -> dict:
+        tail = self.tail.assign(date=self.tail["date"].astype(str))
+        return {"targets": self.targets, "lags": self.lags, "lam": self.lam,
+                "xtx": _to_list(self.xtx), "xty": _to_list(self.xty), "rows": self.rows,
+                "tail": tail.to_dict(orient="list"), "last_time": _time_str(self.last_time)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RidgeLaguri":
+        model = cls(data["targets"], data["lags"], data["lam"])
+        model.xtx, model.xty, model.rows = _from_list(data["xtx"]), _from_list(data["xty"]), data["rows"]
+        model.tail = pd.DataFrame(data["tail"]).astype({"date": "datetime64[ns]"})
+        model.last_time = _time(data["last_time"])
+        if model.rows:
+            model._solve()
+        return model
+
+
+MODELE = {cls.nume: cls for cls in (NaivSezonier, HoltWinters, RidgeLaguri)}
+
+
+def _to_list(arr: Optional[np.ndarray]):
+    return None if arr is None else np.where(np.isnan(arr), None, arr).tolist()
+
+
+def _from_list(data) -> Optional[np.ndarray]:
+    return None if data is None else np.array(data, dtype="float64")
+
+
+def _time_str(ts: Optional[pd.Timestamp]) -> Optional[str]:
+    return None if ts is None else ts.isoformat(sep=" ")
+
+
+def _time(text: Optional[str]) -> Optional[pd.Timestamp]:
+    return None if text is None else pd.Timestamp(text)
+
+
+# ------------------------------
+# Antrenare, persistență, prognoză
+# ------------------------------
+def fit_models(
+    df: pd.DataFrame,
+    targets: Sequence[str] = TINTE_PROGNOZA,
+    models: Sequence[str] = tuple(MODELE)
+) -> Dict[str, object]:
+    """Antrenează modelele cerute (vezi MODELE), fiecare pe toate țintele deodată."""
+    return {name: MODELE[name](targets).fit(df) for name in models}
+
+
+def update_models(models: Dict[str, object], df_new: pd.DataFrame) -> Dict[str, object]:
+    """Actualizează modelele cu rândurile ulterioare ultimei date văzute."""
+    for model in models.values():
+        new = df_new if model.last_time is None else df_new[df_new["date"] > model.last_time]
+        model.update(new)
+    return models
+
+
+def save_models(models: Dict[str, object], path: str = MODELE_PROGNOZA) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({name: model.to_dict() for name, model in models.items()}, f)
+
+
+def load_models(path: str = MODELE_PROGNOZA) -> Dict[str, object]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: MODELE[name].from_dict(state) for name, state in data.items()}
+
+
+def forecast_times(last_time: pd.Timestamp, horizon: str = ORIZONT) -> pd.DatetimeIndex:
+    """Orele întregi din intervalul (last_time, last_time + horizon]."""
+    start = last_time.floor("h") + ORA
+    return pd.date_range(start, last_time + pd.Timedelta(horizon), freq="h", name="date")
+
+
+def forecast(models: Dict[str, object], horizon: str = ORIZONT) -> pd.DataFrame:
+    """
+    Prognoza orară pe `horizon` după ultima observație, pentru toate modelele și țintele.
+    Coloane MultiIndex (model, țintă).
+    """
+    last_time = max(model.last_time for model in models.values())
+    dates = forecast_times(last_time, horizon)
+    return pd.concat({name: model.predict(dates) for name, model in models.items()}, axis=1)
+
+
+# ------------------------------
+# Backtest cu origine mobilă
+# ------------------------------
+# MAPE ignoră observațiile cu |y| sub prag (MWh): soldul trece prin 0 și eroarea relativă explodează;
+# WAPE (sum |eroare| / sum |y|) rămâne comparabil între ținte, inclusiv pentru sold
+PRAG_MAPE = 1.0
+
+
+def backtest(
+    df: pd.DataFrame,
+    targets: Sequence[str] = TINTE_PROGNOZA,
+    models: Sequence[str] = tuple(MODELE),
+    horizon: str = ORIZONT,
+    step: str = "7D",
+    initial: str = "90D"
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Evaluare cu origine mobilă: modelele se antrenează pe primele `initial` zile, apoi la fiecare
+    origine (din `step` în `step`) prognozează observațiile reale din (origine, origine + horizon]
+    și se actualizează incremental cu datele până la următoarea origine.
+    Returnează (erori, timpi):
+    - erori: per (origine, model, țintă): n, mae, rmse, mape (fără |y| < PRAG_MAPE), wape
+    - timpi: per model: secunde la antrenare, medie per update și per prognoză (ms)
+    """
+    df = sort_by_date(df)[["date"] + list(targets)]
+    first, last = df["date"].iloc[0], df["date"].iloc[-1]
+    origins = pd.date_range(first + pd.Timedelta(initial), last - pd.Timedelta(horizon), freq=step)
+
+    fitted, timpi = {}, {}
+    train = df[df["date"] <= origins[0]] if len(origins) else df
+    for name in models:
+        t0 = time.perf_counter()
+        fitted[name] = MODELE[name](targets).fit(train)
+        timpi[name] = {"fit_s": time.perf_counter() - t0, "update_ms": [], "predict_ms": []}
+
+    rows = []
+    for i, origin in enumerate(origins):
+        actual = df[(df["date"] > origin) & (df["date"] <= origin + pd.Timedelta(horizon))]
+        if not actual.empty:
+            y = actual[list(targets)].to_numpy(dtype="float64")
+            for name, model in fitted.items():
+                t0 = time.perf_counter()
+                pred = model.predict(actual["date"]).to_numpy()
+                timpi[name]["predict_ms"].append((time.perf_counter() - t0) * 1000)
+                err = pred - y
+                for j, tinta in enumerate(targets):
+                    abs_err, abs_y = np.abs(err[:, j]), np.abs(y[:, j])
+                    measured = ~np.isnan(abs_err)
+                    relevant = measured & (abs_y >= PRAG_MAPE)
+                    rows.append({
+                        "origine": origin, "model": name, "tinta": tinta, "n": len(y),
+                        "mae": np.nanmean(abs_err),
+                        "rmse": np.sqrt(np.nanmean(err[:, j] ** 2)),
+                        "mape": np.mean(abs_err[relevant] / abs_y[relevant]) * 100 if relevant.any() else np.nan,
+                        "wape": abs_err[measured].sum() / abs_y[measured].sum() * 100
+                        if abs_y[measured].sum() > 0 else np.nan,
+                    })
+        # datele până la următoarea origine intră în modele incremental
+        end = origins[i + 1] if i + 1 < len(origins) else last
+        new = df[(df["date"] > origin) & (df["date"] <= end)]
+        for name, model in fitted.items():
+            t0 = time.perf_counter()
+            model.update(new)
+            timpi[name]["update_ms"].append((time.perf_counter() - t0) * 1000)
+
+    timpi = pd.DataFrame({
+        name: {"fit_s": t["fit_s"],
+               "update_ms": np.mean(t["update_ms"]) if t["update_ms"] else np.nan,
+               "predict_ms": np.mean(t["predict_ms"]) if t["predict_ms"] else np.nan}
+        for name, t in timpi.items()
+    }).T
+    return pd.DataFrame(rows), timpi
+
+
+def backtest_summary(erori: pd.DataFrame) -> pd.DataFrame:
+    """Erorile medii pe toate originile, per (țintă, model)."""
+    return erori.groupby(["tinta", "model"])[["mae", "rmse", "mape", "wape"]].mean()
+
+
+if __name__ == "__main__":
+    from incarcare import load_range
+
+    df = load_range(columns=["date"] + TINTE_PROGNOZA)
+    erori, timpi = backtest(df)
+    print(f"📊 Backtest cu origine mobilă ({erori['origine'].nunique()} origini, orizont {ORIZONT}):")
+    print(backtest_summary(erori).round(2))
+    print()
+    print("⏱️  Timpi per model:")
+    print(timpi.round(3))
+
+    save_models(fit_models(df))
+    print(f"✔ Modelele de prognoză au fost salvate în '{MODELE_PROGNOZA}'")
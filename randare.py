@@ -0,0 +1,69 @@
+import io
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import matplotlib.pyplot as plt
+
+
+def figure_to_png(fig, dpi: int = 100) -> bytes:
+    """Randează figura în PNG și o închide (pyplot nu mai păstrează nicio referință la ea)."""
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi)
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
+
+
+class CacheImagini:
+    """
+    Cache LRU pentru imaginile PNG ale graficelor, cu limită totală în bytes.
+    Cheia este tuplul complet al selecțiilor care determină graficul; la depășirea
+    limitei se elimină imaginile folosite cel mai demult. Sigur pentru mai multe fire
+    (sesiunile Streamlit rulează în fire separate).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, dpi: int = 100):
+        self.max_bytes = max_bytes
+        self.dpi = dpi
+        self._images: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            png = self._images.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key: Hashable, png: bytes) -> None:
+        """Adaugă imaginea; o imagine mai mare decât toată limita nu se păstrează."""
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._images[key] = png
+            self._bytes += len(png)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def render(self, key: Hashable, fig) -> bytes:
+        """Randează figura (și o închide), păstrează PNG-ul sub `key` și îl întoarce."""
+        png = figure_to_png(fig, self.dpi)
+        self.put(key, png)
+        return png
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"images": len(self._images), "bytes": self._bytes,
+                    "hits": self.hits, "misses": self.misses}
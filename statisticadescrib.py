@@ -1,470 +1,819 @@
+import argparse
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import cached_property
+from typing import Dict, List, Optional
+
 import pandas as pd
-import numpy as np
-from scipy import stats
 
-# Configurare afișare pandas
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', None)
-pd.set_option('display.max_rows', 100)
+from acumulatori import STATISTICI_ENERGIE, StatisticiIncrementale, load_statistics
+from autocorelatie import SURSE_DECALAJ, TINTE_DECALAJ, acf, ccf, lead_lag, regular_series
+from corelatii import MatriceCorelatie
+from incarcare import CSV_TRANSFORMAT, MANIFEST, is_fresh, load_columns, load_transformed
+from interval_timp import sort_by_date
+from motor_statistici import describe_all, describe_table, group_table, percentile_table
+from normalitate import normality_tests
+from prelucraredate import ProfilCalitate, profile_data
 
-# Încărcare date
-print("=" * 80)
-print("📊 ANALIZA STATISTICILOR DESCRIPTIVE - ENERGIE ROMÂNIA")
-print("=" * 80)
-print()
+SURSE_ENERGIE = ["carbune", "hidro", "hidrocarburi", "nuclear",
+                 "eolian", "fotovolt", "biomasa"]
+VARIABILE_CHEIE = ["productie", "consum", "sold", "stocare"]
+# Sursele plus totalurile: folosite la comparația pe ani și la testele de normalitate
+COLOANE_ANALIZA = SURSE_ENERGIE + ["productie", "consum", "sold"]
 
-df = pd.read_csv("energie_transformata.csv")
-df["date"] = pd.to_datetime(df["date"])
+LUNI = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun',
+        'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec']
+ZILE_ORDONATE = ['monday', 'tuesday', 'wednesday', 'thursday',
+                 'friday', 'saturday', 'sunday']
+ZILE_RO = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică']
+
+
+class RaportStatistic:
+    """
+    Calculele raportului de statistici descriptive, fără afișare.
+    Fiecare metodă întoarce un DataFrame (sau o valoare) și calculează doar ce îi trebuie;
+    apelurile către motorul de statistici sunt păstrate și refolosite între secțiuni.
+    Cu `statistici` (acumulatori.load_statistics), secțiunile 3-7 se citesc din acumulatorii
+    persistați în loc să parcurgă datele; percentilele sunt atunci aproximative.
+    """
+
+    def __init__(self, df: pd.DataFrame, statistici: Optional[Dict[str, StatisticiIncrementale]] = None):
+        self.df = df
+        self.statistici = statistici
+
+    def _describe(self, columns: List[str], by: Optional[str] = None) -> pd.DataFrame:
+        if self.statistici is None:
+            return describe_all(self.df, columns, by=by)
+        stats = self.statistici["total" if by is None else by].describe()
+        if by is None:
+            return stats.loc[columns]
+        keys = stats.index.get_level_values(0).unique()
+        return stats.loc[pd.MultiIndex.from_product([keys, columns], names=stats.index.names)]
+
+    # ------------------------------
+    # Statistici partajate (calculate la prima folosire)
+    # ------------------------------
+    @cached_property
+    def stats_surse(self) -> pd.DataFrame:
+        return self._describe(SURSE_ENERGIE)
+
+    @cached_property
+    def stats_cheie(self) -> pd.DataFrame:
+        return self._describe(VARIABILE_CHEIE)
+
+    @cached_property
+    def stats_ani(self) -> pd.DataFrame:
+        return self._describe(COLOANE_ANALIZA, by="an")
+
+    @cached_property
+    def stats_luna(self) -> pd.DataFrame:
+        return self._describe(["productie", "consum", "sold"], by="luna")
+
+    @cached_property
+    def stats_ora(self) -> pd.DataFrame:
+        return self._describe(["productie", "consum"], by="ora")
+
+    @cached_property
+    def stats_raport(self) -> pd.Series:
+        return self._describe(['raport_pret_calitate']).loc['raport_pret_calitate']
+
+    @cached_property
+    def profil(self) -> ProfilCalitate:
+        """Valori lipsă și duplicate, dintr-o singură trecere (prelucraredate.profile_data)."""
+        return profile_data(self.df)
+
+    @cached_property
+    def corelatii(self) -> MatriceCorelatie:
+        """Matricea de corelație surse + totaluri, calculată o singură dată (corelatii.MatriceCorelatie)."""
+        return MatriceCorelatie(self.df, SURSE_ENERGIE + ["productie", "consum"])
+
+    # ------------------------------
+    # 1. Informații generale
+    # ------------------------------
+    def general_info(self) -> pd.DataFrame:
+        """Tipul și numărul de valori nenule pentru fiecare coloană."""
+        return pd.DataFrame({
+            'Tip': self.df.dtypes.astype(str),
+            'Valori nenule': self.profil.rows - self.profil.missing_count
+        })
+
+    # ------------------------------
+    # 2. Calitatea datelor
+    # ------------------------------
+    def missing_values(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'Valori lipsă': self.profil.missing_count,
+            'Procent (%)': self.profil.missing_pct
+        })
+
+    def duplicate_count(self) -> int:
+        return self.profil.duplicate_count
+
+    # ------------------------------
+    # 3. Surse de energie
+    # ------------------------------
+    def source_describe(self) -> pd.DataFrame:
+        return describe_table(self.stats_surse)
+
+    def source_stats(self) -> pd.DataFrame:
+        extra = self.stats_surse[["mean", "median", "std", "var", "min", "max",
+                                  "range", "cv", "skew", "kurtosis"]].copy()
+        extra.columns = ['Medie', 'Mediană', 'Std Dev', 'Varianta', 'Min', 'Max',
+                         'Range', 'CV (%)', 'Skewness', 'Kurtosis']
+        return extra
+
+    # ------------------------------
+    # 4. Producție, consum, sold
+    # ------------------------------
+    def key_describe(self) -> pd.DataFrame:
+        return describe_table(self.stats_cheie)
+
+    def key_stats(self) -> pd.DataFrame:
+        extra = self.stats_cheie[["mean", "median", "std", "min", "max", "range", "cv"]].copy()
+        extra["cv"] = extra["cv"].abs()
+        extra.columns = ['Medie', 'Mediană', 'Std Dev', 'Min', 'Max', 'Range', 'CV (%)']
+        return extra
+
+    def sold_balance(self) -> pd.DataFrame:
+        """Numărul, procentul și media înregistrărilor cu sold pozitiv / negativ / zero."""
+        sold = self.df['sold']
+        masti = {'pozitiv': sold > 0, 'negativ': sold < 0, 'zero': sold == 0}
+        return pd.DataFrame({
+            'Înregistrări': {k: int(m.sum()) for k, m in masti.items()},
+            'Procent (%)': {k: m.sum() / len(sold) * 100 for k, m in masti.items()},
+            'Medie': {k: sold[m].mean() for k, m in masti.items()},
+        })
+
+    # ------------------------------
+    # 5. Percentile
+    # ------------------------------
+    def source_percentiles(self) -> pd.DataFrame:
+        return percentile_table(self.stats_surse)
+
+    def key_percentiles(self) -> pd.DataFrame:
+        return percentile_table(self.stats_cheie.loc[["productie", "consum", "sold"]])
+
+    # ------------------------------
+    # 6. Pe ani
+    # ------------------------------
+    def year_describe(self, an: int) -> pd.DataFrame:
+        return describe_table(self.stats_ani.xs(an, level="an"))
+
+    def year_comparison(self, an_1: int = 2024, an_2: int = 2025) -> pd.DataFrame:
+        medie_1 = self.stats_ani.xs(an_1, level="an")["mean"]
+        medie_2 = self.stats_ani.xs(an_2, level="an")["mean"]
+        return pd.DataFrame({
+            f'Medie {an_1}': medie_1,
+            f'Medie {an_2}': medie_2,
+            'Diferență': medie_2 - medie_1,
+            'Variație (%)': (medie_2 - medie_1) / medie_1 * 100
+        })
+
+    # ------------------------------
+    # 7-9. Pe luni, ore, zile ale săptămânii
+    # ------------------------------
+    def month_stats(self, col: str) -> pd.DataFrame:
+        tabel = group_table(self.stats_luna, col, ['mean', 'std', 'min', 'max', 'median'])
+        tabel.index = LUNI[:len(tabel)]
+        return tabel
+
+    def hour_stats(self, col: str) -> pd.DataFrame:
+        return group_table(self.stats_ora, col, ['mean', 'std', 'min', 'max', 'median'])
+
+    def weekday_stats(self) -> pd.DataFrame:
+        cols = ["productie", "consum", "sold"]
+        stats_zi = describe_all(self.df, cols, by="zi_saptamana")
+        tabel = pd.concat({col: group_table(stats_zi, col, ['mean', 'std', 'min', 'max'])
+                           for col in cols}, axis=1)
+        tabel = tabel.reindex(ZILE_ORDONATE)
+        tabel.index = ZILE_RO
+        return tabel
+
+    # ------------------------------
+    # 10. Raport preț/calitate
+    # ------------------------------
+    def ratio_describe(self) -> pd.Series:
+        return describe_table(self.stats_raport.to_frame().T)['raport_pret_calitate']
+
+    def ratio_stats(self) -> pd.DataFrame:
+        s = self.stats_raport
+        return pd.DataFrame({
+            'Medie': [s['mean']],
+            'Mediană': [s['median']],
+            'Std Dev': [s['std']],
+            'Min': [s['min']],
+            'Max': [s['max']],
+            'CV (%)': [s['cv']]
+        })
+
+    def ratio_categories(self) -> pd.DataFrame:
+        r = self.df['raport_pret_calitate']
+        categorii = {
+            'Excelent': (r >= 0.8).sum(),
+            'Bun': ((r >= 0.6) & (r < 0.8)).sum(),
+            'Mediu': ((r >= 0.4) & (r < 0.6)).sum(),
+            'Slab': (r < 0.4).sum(),
+        }
+        return pd.DataFrame({
+            'Înregistrări': categorii,
+            'Procent (%)': {k: v / len(r) * 100 for k, v in categorii.items()}
+        })
+
+    # ------------------------------
+    # 11. Normalitate
+    # ------------------------------
+    def normality(self, sample_size: int = 5000, tests: tuple = ("shapiro",),
+                  by: Optional[str] = None) -> pd.DataFrame:
+        """
+        Teste de normalitate pe un eșantion (Shapiro-Wilk nu funcționează bine pe seturi mari),
+        toate coloanele deodată (normalitate.normality_tests).
+        - tests: subset din normalitate.TESTE_NORMALITATE; cu mai multe teste apare coloana 'Test'
+        - by: eșantion stratificat (ex. 'an')
+        """
+        rez = normality_tests(self.df, COLOANE_ANALIZA, tests=tests, sample_size=sample_size, by=by)
+        normalitate = pd.DataFrame({
+            'Variabilă': rez['variabila'],
+            'Statistic': rez['statistic'],
+            'P-value': rez['p_value'],
+            'Normal?': rez['normal'].map({True: 'Da', False: 'Nu'}).fillna('n/a'),
+        })
+        if len(tests) > 1:
+            normalitate.insert(0, 'Test', rez['test'])
+        return normalitate
+
+    # ------------------------------
+    # 12. Corelații
+    # ------------------------------
+    def correlation_matrix(self) -> pd.DataFrame:
+        return self.corelatii.matrix(SURSE_ENERGIE)
+
+    def correlation_with(self, col: str) -> pd.Series:
+        return self.corelatii.with_column(col, SURSE_ENERGIE)
+
+    # ------------------------------
+    # 13. Corelații decalate
+    # ------------------------------
+    @cached_property
+    def serii_orare(self) -> pd.DataFrame:
+        """Sursele variabile și țintele pe grila orară (golurile rămân NaN, vezi autocorelatie)."""
+        return regular_series(sort_by_date(self.df), SURSE_DECALAJ + TINTE_DECALAJ + ["productie"], "h")
+
+    def lag_correlations(self, nlags: int = 168) -> pd.DataFrame:
+        """Decalajul (în ore) cu corelația maximă sursă -> țintă, în intervalul ±nlags."""
+        return lead_lag(ccf(self.serii_orare, SURSE_DECALAJ, TINTE_DECALAJ, nlags), freq=None)
+
+    def autocorrelation(self, lags: tuple = (1, 12, 24, 48, 168), min_pairs: int = 30) -> pd.DataFrame:
+        """
+        Autocorelația totalurilor la decalajele cerute (ore). Decalajele cu mai puțin de
+        `min_pairs` perechi de măsurători (ex. 1h pe grila orară rară) se omit;
+        lista lor e în attrs['omise'].
+        """
+        rez = acf(self.serii_orare[["productie", "consum", "sold"]], max(lags))
+        rez = rez.where(rez.attrs["pairs"] >= min_pairs).loc[list(lags)]
+        tabel = rez.dropna(how="all").T
+        tabel.attrs["omise"] = [k for k in lags if k not in tabel.columns]
+        return tabel
+
+    # ------------------------------
+    # 14. Rezumat
+    # ------------------------------
+    def summary(self) -> pd.DataFrame:
+        """Indicatorii principali ai raportului, ca tabel (indicator -> valoare)."""
+        consum_ora = self.hour_stats("consum")['mean']
+        cv = self.stats_surse["cv"]
+        return pd.Series({
+            'Înregistrări': len(self.df),
+            'Început perioadă': self.df['date'].min(),
+            'Sfârșit perioadă': self.df['date'].max(),
+            'Sursa cu producția medie maximă': self.stats_surse["mean"].idxmax(),
+            'Sursa cu CV maxim': cv.idxmax(),
+            'Sursa cu CV minim': cv.idxmin(),
+            'Producție medie': self.stats_cheie.loc['productie', 'mean'],
+            'Consum mediu': self.stats_cheie.loc['consum', 'mean'],
+            'Sold mediu': self.stats_cheie.loc['sold', 'mean'],
+            'Ora cu consum maxim': consum_ora.idxmax(),
+            'Ora cu consum minim': consum_ora.idxmin(),
+        }, dtype=object).to_frame('Valoare')
 
-print(f"✅ Date încărcate cu succes!")
-print(f"   📅 Perioada: {df['date'].min()} → {df['date'].max()}")
-print(f"   📊 Total înregistrări: {len(df):,}")
-print(f"   📈 Coloane: {len(df.columns)}")
-print()
 
 # ============================================================================
-# 1. INFORMAȚII GENERALE DESPRE DATASET
+# Afișarea raportului (câte o funcție per secțiune)
 # ============================================================================
-print("=" * 80)
-print("1️⃣  INFORMAȚII GENERALE DESPRE DATASET")
-print("=" * 80)
-print()
 
-print("📋 Structura datelor:")
-print(df.info())
-print()
+def _titlu(text: str) -> None:
+    print("=" * 80)
+    print(text)
+    print("=" * 80)
+    print()
 
-print("🔍 Primele 5 rânduri:")
-print(df.head())
-print()
 
-print("📏 Dimensiuni dataset:")
-print(f"   Rânduri: {df.shape[0]:,}")
-print(f"   Coloane: {df.shape[1]}")
-print()
+def print_general_info(r: RaportStatistic) -> None:
+    df = r.df
+    _titlu("1️⃣  INFORMAȚII GENERALE DESPRE DATASET")
 
-# ============================================================================
-# 2. VERIFICARE CALITATE DATE
-# ============================================================================
-print("=" * 80)
-print("2️⃣  VERIFICARE CALITATE DATE")
-print("=" * 80)
-print()
-
-print("❓ Valori lipsă per coloană:")
-missing = df.isnull().sum()
-missing_percent = (df.isnull().sum() / len(df)) * 100
-missing_df = pd.DataFrame({
-    'Valori lipsă': missing,
-    'Procent (%)': missing_percent
-})
-print(missing_df[missing_df['Valori lipsă'] > 0])
-if missing.sum() == 0:
-    print("   ✅ Nu există valori lipsă!")
-print()
-
-print("🔄 Duplicate:")
-duplicates = df.duplicated().sum()
-print(f"   Total duplicate: {duplicates}")
-if duplicates == 0:
-    print("   ✅ Nu există duplicate!")
-print()
+    print("📋 Structura datelor:")
+    print(df.info())
+    print()
 
-# ============================================================================
-# 3. STATISTICI DESCRIPTIVE - SURSE DE ENERGIE
-# ============================================================================
-print("=" * 80)
-print("3️⃣  STATISTICI DESCRIPTIVE - SURSE DE ENERGIE")
-print("=" * 80)
-print()
+    print("🔍 Primele 5 rânduri:")
+    print(df.head())
+    print()
 
-surse_energie = ["carbune", "hidro", "hidrocarburi", "nuclear",
-                 "eolian", "fotovolt", "biomasa"]
+    print("📏 Dimensiuni dataset:")
+    print(f"   Rânduri: {df.shape[0]:,}")
+    print(f"   Coloane: {df.shape[1]}")
+    print()
 
-print("📊 Statistici complete pentru sursele de energie:")
-print()
-statistici = df[surse_energie].describe()
-print(statistici.round(2))
-print()
-
-# Statistici suplimentare
-print("📈 Statistici suplimentare:")
-print()
-statistici_extra = pd.DataFrame({
-    'Medie': df[surse_energie].mean(),
-    'Mediană': df[surse_energie].median(),
-    'Std Dev': df[surse_energie].std(),
-    'Varianta': df[surse_energie].var(),
-    'Min': df[surse_energie].min(),
-    'Max': df[surse_energie].max(),
-    'Range': df[surse_energie].max() - df[surse_energie].min(),
-    'CV (%)': (df[surse_energie].std() / df[surse_energie].mean() * 100),
-    'Skewness': df[surse_energie].skew(),
-    'Kurtosis': df[surse_energie].kurtosis()
-})
-print(statistici_extra.round(2))
-print()
-
-# Explicații
-print("📖 Explicații:")
-print("   • CV (Coeficient de Variație): măsoară variabilitatea relativă")
-print("     - CV < 15%: variabilitate redusă (stabilă)")
-print("     - CV 15-30%: variabilitate moderată")
-print("     - CV > 30%: variabilitate ridicată (instabilă)")
-print()
-print("   • Skewness (Asimetrie):")
-print("     - Pozitivă: distribuție asimetrică spre dreapta")
-print("     - Negativă: distribuție asimetrică spre stânga")
-print("     - ~0: distribuție simetrică")
-print()
-print("   • Kurtosis (Aplatizare):")
-print("     - Pozitivă: distribuție cu vârfuri ascuțite")
-print("     - Negativă: distribuție aplatizată")
-print()
 
-# ============================================================================
-# 4. STATISTICI DESCRIPTIVE - PRODUCȚIE ȘI CONSUM
-# ============================================================================
-print("=" * 80)
-print("4️⃣  STATISTICI DESCRIPTIVE - PRODUCȚIE, CONSUM, SOLD")
-print("=" * 80)
-print()
-
-variabile_cheie = ["productie", "consum", "sold", "stocare"]
-
-print("📊 Statistici complete:")
-print()
-statistici_prod_consum = df[variabile_cheie].describe()
-print(statistici_prod_consum.round(2))
-print()
-
-print("📈 Statistici suplimentare:")
-print()
-statistici_extra_pc = pd.DataFrame({
-    'Medie': df[variabile_cheie].mean(),
-    'Mediană': df[variabile_cheie].median(),
-    'Std Dev': df[variabile_cheie].std(),
-    'Min': df[variabile_cheie].min(),
-    'Max': df[variabile_cheie].max(),
-    'Range': df[variabile_cheie].max() - df[variabile_cheie].min(),
-    'CV (%)': (df[variabile_cheie].std() / df[variabile_cheie].mean() * 100).abs()
-})
-print(statistici_extra_pc.round(2))
-print()
-
-# Analiza soldului
-print("⚖️  Analiza detaliată a soldului energetic:")
-print()
-sold_pozitiv = (df['sold'] > 0).sum()
-sold_negativ = (df['sold'] < 0).sum()
-sold_zero = (df['sold'] == 0).sum()
-total = len(df)
-
-print(f"   🟢 Sold pozitiv (surplus): {sold_pozitiv:,} înregistrări ({sold_pozitiv / total * 100:.2f}%)")
-print(f"   🔴 Sold negativ (deficit): {sold_negativ:,} înregistrări ({sold_negativ / total * 100:.2f}%)")
-print(f"   ⚪ Sold zero (echilibru): {sold_zero:,} înregistrări ({sold_zero / total * 100:.2f}%)")
-print()
-print(f"   📊 Sold mediu: {df['sold'].mean():.2f} MWh")
-print(f"   📈 Sold mediu pozitiv: {df[df['sold'] > 0]['sold'].mean():.2f} MWh")
-print(f"   📉 Sold mediu negativ: {df[df['sold'] < 0]['sold'].mean():.2f} MWh")
-print()
+def print_quality(r: RaportStatistic) -> None:
+    _titlu("2️⃣  VERIFICARE CALITATE DATE")
 
-# ============================================================================
-# 5. PERCENTILE ȘI CUARTILE
-# ============================================================================
-print("=" * 80)
-print("5️⃣  PERCENTILE ȘI CUARTILE")
-print("=" * 80)
-print()
-
-print("📊 Percentile pentru sursele de energie:")
-print()
-percentile = [0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]
-percentile_df = df[surse_energie].quantile(percentile)
-percentile_df.index = [f'P{int(p * 100)}' for p in percentile]
-print(percentile_df.round(2))
-print()
-
-print("📊 Percentile pentru producție și consum:")
-print()
-percentile_pc = df[["productie", "consum", "sold"]].quantile(percentile)
-percentile_pc.index = [f'P{int(p * 100)}' for p in percentile]
-print(percentile_pc.round(2))
-print()
+    print("❓ Valori lipsă per coloană:")
+    missing_df = r.missing_values()
+    print(missing_df[missing_df['Valori lipsă'] > 0])
+    if missing_df['Valori lipsă'].sum() == 0:
+        print("   ✅ Nu există valori lipsă!")
+    print()
 
-# ============================================================================
-# 6. ANALIZA PE ANI
-# ============================================================================
-print("=" * 80)
-print("6️⃣  ANALIZA COMPARATIVĂ PE ANI (2024 vs 2025)")
-print("=" * 80)
-print()
-
-print("📊 Statistici 2024:")
-print()
-df_2024 = df[df["an"] == 2024]
-stats_2024 = df_2024[surse_energie + ["productie", "consum", "sold"]].describe()
-print(stats_2024.round(2))
-print()
-
-print("📊 Statistici 2025:")
-print()
-df_2025 = df[df["an"] == 2025]
-stats_2025 = df_2025[surse_energie + ["productie", "consum", "sold"]].describe()
-print(stats_2025.round(2))
-print()
-
-print("📈 Comparație medie 2024 vs 2025:")
-print()
-comparatie = pd.DataFrame({
-    'Medie 2024': df_2024[surse_energie + ["productie", "consum", "sold"]].mean(),
-    'Medie 2025': df_2025[surse_energie + ["productie", "consum", "sold"]].mean(),
-    'Diferență': df_2025[surse_energie + ["productie", "consum", "sold"]].mean() -
-                 df_2024[surse_energie + ["productie", "consum", "sold"]].mean(),
-    'Variație (%)': ((df_2025[surse_energie + ["productie", "consum", "sold"]].mean() -
-                      df_2024[surse_energie + ["productie", "consum", "sold"]].mean()) /
-                     df_2024[surse_energie + ["productie", "consum", "sold"]].mean() * 100)
-})
-print(comparatie.round(2))
-print()
+    print("🔄 Duplicate:")
+    duplicates = r.duplicate_count()
+    print(f"   Total duplicate: {duplicates}")
+    if duplicates == 0:
+        print("   ✅ Nu există duplicate!")
+    print()
 
-# ============================================================================
-# 7. ANALIZA PE LUNI
-# ============================================================================
-print("=" * 80)
-print("7️⃣  ANALIZA PE LUNI")
-print("=" * 80)
-print()
-
-print("📊 Producție medie pe luni:")
-print()
-prod_luna = df.groupby("luna")["productie"].agg(['mean', 'std', 'min', 'max', 'median'])
-prod_luna.index = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun',
-                   'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec'][:len(prod_luna)]
-print(prod_luna.round(2))
-print()
-
-print("📊 Consum mediu pe luni:")
-print()
-consum_luna = df.groupby("luna")["consum"].agg(['mean', 'std', 'min', 'max', 'median'])
-consum_luna.index = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun',
-                     'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec'][:len(consum_luna)]
-print(consum_luna.round(2))
-print()
-
-print("📊 Sold mediu pe luni:")
-print()
-sold_luna = df.groupby("luna")["sold"].agg(['mean', 'std', 'min', 'max', 'median'])
-sold_luna.index = ['Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun',
-                   'Iul', 'Aug', 'Sep', 'Oct', 'Noi', 'Dec'][:len(sold_luna)]
-print(sold_luna.round(2))
-print()
 
-# ============================================================================
-# 8. ANALIZA PE ORE
-# ============================================================================
-print("=" * 80)
-print("8️⃣  ANALIZA PE ORE")
-print("=" * 80)
-print()
-
-print("📊 Producție pe ore - Statistici complete:")
-print()
-prod_ora = df.groupby("ora")["productie"].agg(['mean', 'std', 'min', 'max', 'median'])
-print(prod_ora.round(2))
-print()
-
-print("🔝 Top 5 ore cu producție maximă:")
-print(prod_ora.nlargest(5, 'mean').round(2))
-print()
-
-print("⬇️ Top 5 ore cu producție minimă:")
-print(prod_ora.nsmallest(5, 'mean').round(2))
-print()
-
-print("📊 Consum pe ore - Statistici complete:")
-print()
-consum_ora = df.groupby("ora")["consum"].agg(['mean', 'std', 'min', 'max', 'median'])
-print(consum_ora.round(2))
-print()
-
-print("🔝 Top 5 ore cu consum maxim:")
-print(consum_ora.nlargest(5, 'mean').round(2))
-print()
-
-print("⬇️ Top 5 ore cu consum minim:")
-print(consum_ora.nsmallest(5, 'mean').round(2))
-print()
+def print_source_stats(r: RaportStatistic) -> None:
+    _titlu("3️⃣  STATISTICI DESCRIPTIVE - SURSE DE ENERGIE")
 
-# ============================================================================
-# 9. ANALIZA PE ZILE SĂPTĂMÂNII
-# ============================================================================
-print("=" * 80)
-print("9️⃣  ANALIZA PE ZILE SĂPTĂMÂNII")
-print("=" * 80)
-print()
+    print("📊 Statistici complete pentru sursele de energie:")
+    print()
+    print(r.source_describe().round(2))
+    print()
 
-zile_ordonate = ['monday', 'tuesday', 'wednesday', 'thursday',
-                 'friday', 'saturday', 'sunday']
-zile_ro = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică']
+    # Statistici suplimentare
+    print("📈 Statistici suplimentare:")
+    print()
+    print(r.source_stats().round(2))
+    print()
 
-print("📊 Statistici pe zile săptămânii:")
-print()
-stats_zile = df.groupby("zi_saptamana")[["productie", "consum", "sold"]].agg(['mean', 'std', 'min', 'max'])
-stats_zile = stats_zile.reindex(zile_ordonate)
-stats_zile.index = zile_ro
-print(stats_zile.round(2))
-print()
+    # Explicații
+    print("📖 Explicații:")
+    print("   • CV (Coeficient de Variație): măsoară variabilitatea relativă")
+    print("     - CV < 15%: variabilitate redusă (stabilă)")
+    print("     - CV 15-30%: variabilitate moderată")
+    print("     - CV > 30%: variabilitate ridicată (instabilă)")
+    print()
+    print("   • Skewness (Asimetrie):")
+    print("     - Pozitivă: distribuție asimetrică spre dreapta")
+    print("     - Negativă: distribuție asimetrică spre stânga")
+    print("     - ~0: distribuție simetrică")
+    print()
+    print("   • Kurtosis (Aplatizare):")
+    print("     - Pozitivă: distribuție cu vârfuri ascuțite")
+    print("     - Negativă: distribuție aplatizată")
+    print()
+
+
+def print_key_stats(r: RaportStatistic) -> None:
+    _titlu("4️⃣  STATISTICI DESCRIPTIVE - PRODUCȚIE, CONSUM, SOLD")
+
+    print("📊 Statistici complete:")
+    print()
+    print(r.key_describe().round(2))
+    print()
+
+    print("📈 Statistici suplimentare:")
+    print()
+    print(r.key_stats().round(2))
+    print()
+
+    # Analiza soldului
+    print("⚖️  Analiza detaliată a soldului energetic:")
+    print()
+    bilant = r.sold_balance()
+    poz, neg, zero = bilant.loc['pozitiv'], bilant.loc['negativ'], bilant.loc['zero']
+
+    print(f"   🟢 Sold pozitiv (surplus): {int(poz['Înregistrări']):,} înregistrări ({poz['Procent (%)']:.2f}%)")
+    print(f"   🔴 Sold negativ (deficit): {int(neg['Înregistrări']):,} înregistrări ({neg['Procent (%)']:.2f}%)")
+    print(f"   ⚪ Sold zero (echilibru): {int(zero['Înregistrări']):,} înregistrări ({zero['Procent (%)']:.2f}%)")
+    print()
+    print(f"   📊 Sold mediu: {r.stats_cheie.loc['sold', 'mean']:.2f} MWh")
+    print(f"   📈 Sold mediu pozitiv: {poz['Medie']:.2f} MWh")
+    print(f"   📉 Sold mediu negativ: {neg['Medie']:.2f} MWh")
+    print()
+
+
+def print_percentiles(r: RaportStatistic) -> None:
+    _titlu("5️⃣  PERCENTILE ȘI CUARTILE")
+
+    print("📊 Percentile pentru sursele de energie:")
+    print()
+    print(r.source_percentiles().round(2))
+    print()
+
+    print("📊 Percentile pentru producție și consum:")
+    print()
+    print(r.key_percentiles().round(2))
+    print()
 
-# ============================================================================
-# 10. ANALIZA RAPORT PREȚ/CALITATE
-# ============================================================================
-print("=" * 80)
-print("🔟 ANALIZA RAPORT PREȚ/CALITATE")
-print("=" * 80)
-print()
 
-if 'raport_pret_calitate' in df.columns:
+def print_years(r: RaportStatistic) -> None:
+    _titlu("6️⃣  ANALIZA COMPARATIVĂ PE ANI (2024 vs 2025)")
+
+    print("📊 Statistici 2024:")
+    print()
+    print(r.year_describe(2024).round(2))
+    print()
+
+    print("📊 Statistici 2025:")
+    print()
+    print(r.year_describe(2025).round(2))
+    print()
+
+    print("📈 Comparație medie 2024 vs 2025:")
+    print()
+    print(r.year_comparison(2024, 2025).round(2))
+    print()
+
+
+def print_months(r: RaportStatistic) -> None:
+    _titlu("7️⃣  ANALIZA PE LUNI")
+
+    print("📊 Producție medie pe luni:")
+    print()
+    print(r.month_stats("productie").round(2))
+    print()
+
+    print("📊 Consum mediu pe luni:")
+    print()
+    print(r.month_stats("consum").round(2))
+    print()
+
+    print("📊 Sold mediu pe luni:")
+    print()
+    print(r.month_stats("sold").round(2))
+    print()
+
+
+def print_hours(r: RaportStatistic) -> None:
+    _titlu("8️⃣  ANALIZA PE ORE")
+
+    prod_ora = r.hour_stats("productie")
+    print("📊 Producție pe ore - Statistici complete:")
+    print()
+    print(prod_ora.round(2))
+    print()
+
+    print("🔝 Top 5 ore cu producție maximă:")
+    print(prod_ora.nlargest(5, 'mean').round(2))
+    print()
+
+    print("⬇️ Top 5 ore cu producție minimă:")
+    print(prod_ora.nsmallest(5, 'mean').round(2))
+    print()
+
+    consum_ora = r.hour_stats("consum")
+    print("📊 Consum pe ore - Statistici complete:")
+    print()
+    print(consum_ora.round(2))
+    print()
+
+    print("🔝 Top 5 ore cu consum maxim:")
+    print(consum_ora.nlargest(5, 'mean').round(2))
+    print()
+
+    print("⬇️ Top 5 ore cu consum minim:")
+    print(consum_ora.nsmallest(5, 'mean').round(2))
+    print()
+
+
+def print_weekdays(r: RaportStatistic) -> None:
+    _titlu("9️⃣  ANALIZA PE ZILE SĂPTĂMÂNII")
+
+    print("📊 Statistici pe zile săptămânii:")
+    print()
+    print(r.weekday_stats().round(2))
+    print()
+
+
+def print_ratio(r: RaportStatistic) -> None:
+    _titlu("🔟 ANALIZA RAPORT PREȚ/CALITATE")
+
+    if 'raport_pret_calitate' not in r.df.columns:
+        return
+
     print("📊 Statistici raport preț/calitate:")
     print()
-    stats_raport = df['raport_pret_calitate'].describe()
-    print(stats_raport.round(4))
+    print(r.ratio_describe().round(4))
     print()
 
     print("📊 Statistici suplimentare raport preț/calitate:")
     print()
-    raport_stats = pd.DataFrame({
-        'Medie': [df['raport_pret_calitate'].mean()],
-        'Mediană': [df['raport_pret_calitate'].median()],
-        'Std Dev': [df['raport_pret_calitate'].std()],
-        'Min': [df['raport_pret_calitate'].min()],
-        'Max': [df['raport_pret_calitate'].max()],
-        'CV (%)': [df['raport_pret_calitate'].std() / df['raport_pret_calitate'].mean() * 100]
-    })
-    print(raport_stats.round(4))
+    print(r.ratio_stats().round(4))
     print()
 
     print("📈 Categorii raport preț/calitate:")
     print()
-    excelent = (df['raport_pret_calitate'] >= 0.8).sum()
-    bun = ((df['raport_pret_calitate'] >= 0.6) & (df['raport_pret_calitate'] < 0.8)).sum()
-    mediu = ((df['raport_pret_calitate'] >= 0.4) & (df['raport_pret_calitate'] < 0.6)).sum()
-    slab = (df['raport_pret_calitate'] < 0.4).sum()
+    cat = r.ratio_categories()
+    etichete = {
+        'Excelent': "   🟢 Excelent (≥80% energie curată)",
+        'Bun': "   🟡 Bun (60-79% energie curată)",
+        'Mediu': "   🟠 Mediu (40-59% energie curată)",
+        'Slab': "   🔴 Slab (<40% energie curată)",
+    }
+    for categorie, eticheta in etichete.items():
+        n, pct = cat.loc[categorie, 'Înregistrări'], cat.loc[categorie, 'Procent (%)']
+        print(f"{eticheta}: {n:,} ({pct:.2f}%)")
+    print()
+
+
+def print_normality(r: RaportStatistic) -> None:
+    _titlu("1️⃣1️⃣  TESTE DE NORMALITATE (Shapiro-Wilk)")
 
-    print(f"   🟢 Excelent (≥80% energie curată): {excelent:,} ({excelent / len(df) * 100:.2f}%)")
-    print(f"   🟡 Bun (60-79% energie curată): {bun:,} ({bun / len(df) * 100:.2f}%)")
-    print(f"   🟠 Mediu (40-59% energie curată): {mediu:,} ({mediu / len(df) * 100:.2f}%)")
-    print(f"   🔴 Slab (<40% energie curată): {slab:,} ({slab / len(df) * 100:.2f}%)")
+    print("📊 Testarea normalității distribuțiilor:")
+    print("   (p-value > 0.05 → distribuție normală)")
     print()
 
-# ============================================================================
-# 11. TESTE DE NORMALITATE
-# ============================================================================
-print("=" * 80)
-print("1️⃣1️⃣  TESTE DE NORMALITATE (Shapiro-Wilk)")
-print("=" * 80)
-print()
-
-print("📊 Testarea normalității distribuțiilor:")
-print("   (p-value > 0.05 → distribuție normală)")
-print()
-
-# Test pe un subset (Shapiro-Wilk nu funcționează bine pe seturi mari)
-sample_size = min(5000, len(df))
-df_sample = df.sample(n=sample_size, random_state=42)
-
-normalitate = []
-for col in surse_energie + ["productie", "consum", "sold"]:
-    stat, p_value = stats.shapiro(df_sample[col])
-    normalitate.append({
-        'Variabilă': col,
-        'Statistic': stat,
-        'P-value': p_value,
-        'Normal?': 'Da' if p_value > 0.05 else 'Nu'
-    })
-
-normalitate_df = pd.DataFrame(normalitate)
-print(normalitate_df.to_string(index=False))
-print()
-print(f"   ℹ️  Test efectuat pe un eșantion de {sample_size:,} înregistrări")
-print()
+    sample_size = min(5000, len(r.df))
+    print(r.normality(sample_size).to_string(index=False))
+    print()
+    print(f"   ℹ️  Test efectuat pe un eșantion de {sample_size:,} înregistrări")
+    print()
+
+
+def print_correlations(r: RaportStatistic) -> None:
+    _titlu("1️⃣2️⃣  MATRICE DE CORELAȚIE")
+
+    print("📊 Matricea de corelație între sursele de energie:")
+    print()
+    print(r.correlation_matrix().round(3))
+    print()
+
+    print("📊 Corelații cu producția totală:")
+    print()
+    print(r.correlation_with("productie").round(3))
+    print()
+
+    print("📊 Corelații cu consumul:")
+    print()
+    print(r.correlation_with("consum").round(3))
+    print()
+
+
+def print_lag_correlations(r: RaportStatistic) -> None:
+    _titlu("1️⃣3️⃣  CORELAȚII DECALATE (ACF / CCF)")
+
+    print("📊 Decalajul cu corelația maximă sursă → țintă (±7 zile, grilă orară):")
+    print("   (decalaj > 0 → sursa precede ținta cu atâtea ore)")
+    print()
+    tabel = r.lag_correlations().rename(columns={
+        'sursa': 'Sursă', 'tinta': 'Țintă', 'corelatie_0': 'Corelație (0h)',
+        'decalaj': 'Decalaj (ore)', 'corelatie_max': 'Corelație maximă'})
+    print(tabel.round(3).to_string(index=False))
+    print()
+
+    print("📊 Autocorelația totalurilor (decalaj în ore):")
+    print()
+    autocorelatii = r.autocorrelation()
+    print(autocorelatii.round(3))
+    print()
+    if autocorelatii.attrs["omise"]:
+        omise = ", ".join(f"{k}h" for k in autocorelatii.attrs["omise"])
+        print(f"   ℹ️  Decalaje omise (prea puține perechi de măsurători): {omise}")
+    print(f"   ℹ️  Grilă orară cu {r.serii_orare['consum'].notna().mean():.1%} intervale cu măsurători; "
+          "fiecare decalaj folosește doar perechile prezente")
+    print()
+
+
+def print_summary(r: RaportStatistic) -> None:
+    df = r.df
+    _titlu("1️⃣4️⃣  REZUMAT FINAL")
+
+    print("📊 REZUMAT STATISTICI DESCRIPTIVE:")
+    print()
+    print(f"✅ Total înregistrări analizate: {len(df):,}")
+    print(f"✅ Perioada: {df['date'].min().strftime('%Y-%m-%d')} → {df['date'].max().strftime('%Y-%m-%d')}")
+    print(f"✅ Surse de energie analizate: {len(SURSE_ENERGIE)}")
+    print()
+
+    print("🔝 TOP 3 SURSE CU PRODUCȚIE MEDIE CEA MAI MARE:")
+    top_3 = r.stats_surse["mean"].nlargest(3)
+    for i, (sursa, val) in enumerate(top_3.items(), 1):
+        print(f"   {i}. {sursa.capitalize()}: {val:.2f} MWh")
+    print()
+
+    print("📉 TOP 3 SURSE CU CEA MAI MARE VARIABILITATE (CV):")
+    cv = r.stats_surse["cv"].nlargest(3)
+    for i, (sursa, val) in enumerate(cv.items(), 1):
+        print(f"   {i}. {sursa.capitalize()}: CV = {val:.2f}%")
+    print()
+
+    print("🔵 SURSĂ CEA MAI STABILĂ (CV minim):")
+    cv_min = r.stats_surse["cv"].nsmallest(1)
+    for sursa, val in cv_min.items():
+        print(f"   • {sursa.capitalize()}: CV = {val:.2f}%")
+    print()
+
+    sold_mediu = r.stats_cheie.loc['sold', 'mean']
+    print("⚖️  BILANȚ ENERGETIC:")
+    print(f"   Producție medie totală: {r.stats_cheie.loc['productie', 'mean']:.2f} MWh")
+    print(f"   Consum mediu total: {r.stats_cheie.loc['consum', 'mean']:.2f} MWh")
+    print(f"   Sold mediu: {sold_mediu:.2f} MWh")
+    if sold_mediu > 0:
+        print(f"   ✅ Sistemul este în SURPLUS mediu de {sold_mediu:.2f} MWh")
+    else:
+        print(f"   ⚠️  Sistemul este în DEFICIT mediu de {abs(sold_mediu):.2f} MWh")
+    print()
+
+    consum_ora = r.hour_stats("consum")
+    print("📅 PERIODICITATE:")
+    print(f"   Ora cu consum maxim: {consum_ora['mean'].idxmax()}:00 ({consum_ora['mean'].max():.2f} MWh)")
+    print(f"   Ora cu consum minim: {consum_ora['mean'].idxmin()}:00 ({consum_ora['mean'].min():.2f} MWh)")
+    print(
+        f"   Diferență vârf-minimă: {(consum_ora['mean'].max() - consum_ora['mean'].min()):.2f} MWh ({(consum_ora['mean'].max() - consum_ora['mean'].min()) / consum_ora['mean'].min() * 100:.1f}%)")
+    print()
+
+
+# Numărul secțiunii -> funcția care o afișează
+SECTIUNI = {
+    1: print_general_info,
+    2: print_quality,
+    3: print_source_stats,
+    4: print_key_stats,
+    5: print_percentiles,
+    6: print_years,
+    7: print_months,
+    8: print_hours,
+    9: print_weekdays,
+    10: print_ratio,
+    11: print_normality,
+    12: print_correlations,
+    13: print_lag_correlations,
+    14: print_summary,
+}
 
-# ============================================================================
-# 12. MATRICE DE CORELAȚIE
-# ============================================================================
-print("=" * 80)
-print("1️⃣2️⃣  MATRICE DE CORELAȚIE")
-print("=" * 80)
-print()
-
-print("📊 Matricea de corelație între sursele de energie:")
-print()
-corr_matrix = df[surse_energie].corr()
-print(corr_matrix.round(3))
-print()
-
-print("📊 Corelații cu producția totală:")
-print()
-corr_productie = df[surse_energie + ["productie"]].corr()["productie"].sort_values(ascending=False)
-print(corr_productie.round(3))
-print()
-
-print("📊 Corelații cu consumul:")
-print()
-corr_consum = df[surse_energie + ["consum"]].corr()["consum"].sort_values(ascending=False)
-print(corr_consum.round(3))
-print()
 
 # ============================================================================
-# 13. REZUMAT FINAL
+# Execuție paralelă a secțiunilor
 # ============================================================================
-print("=" * 80)
-print("1️⃣3️⃣  REZUMAT FINAL")
-print("=" * 80)
-print()
-
-print("📊 REZUMAT STATISTICI DESCRIPTIVE:")
-print()
-print(f"✅ Total înregistrări analizate: {len(df):,}")
-print(f"✅ Perioada: {df['date'].min().strftime('%Y-%m-%d')} → {df['date'].max().strftime('%Y-%m-%d')}")
-print(f"✅ Surse de energie analizate: {len(surse_energie)}")
-print()
-
-print("🔝 TOP 3 SURSE CU PRODUCȚIE MEDIE CEA MAI MARE:")
-top_3 = df[surse_energie].mean().nlargest(3)
-for i, (sursa, val) in enumerate(top_3.items(), 1):
-    print(f"   {i}. {sursa.capitalize()}: {val:.2f} MWh")
-print()
-
-print("📉 TOP 3 SURSE CU CEA MAI MARE VARIABILITATE (CV):")
-cv = (df[surse_energie].std() / df[surse_energie].mean() * 100).nlargest(3)
-for i, (sursa, val) in enumerate(cv.items(), 1):
-    print(f"   {i}. {sursa.capitalize()}: CV = {val:.2f}%")
-print()
-
-print("🔵 SURSĂ CEA MAI STABILĂ (CV minim):")
-cv_min = (df[surse_energie].std() / df[surse_energie].mean() * 100).nsmallest(1)
-for sursa, val in cv_min.items():
-    print(f"   • {sursa.capitalize()}: CV = {val:.2f}%")
-print()
-
-print("⚖️  BILANȚ ENERGETIC:")
-print(f"   Producție medie totală: {df['productie'].mean():.2f} MWh")
-print(f"   Consum mediu total: {df['consum'].mean():.2f} MWh")
-print(f"   Sold mediu: {df['sold'].mean():.2f} MWh")
-if df['sold'].mean() > 0:
-    print(f"   ✅ Sistemul este în SURPLUS mediu de {df['sold'].mean():.2f} MWh")
-else:
-    print(f"   ⚠️  Sistemul este în DEFICIT mediu de {abs(df['sold'].mean()):.2f} MWh")
-print()
-
-print("📅 PERIODICITATE:")
-print(f"   Ora cu consum maxim: {consum_ora['mean'].idxmax()}:00 ({consum_ora['mean'].max():.2f} MWh)")
-print(f"   Ora cu consum minim: {consum_ora['mean'].idxmin()}:00 ({consum_ora['mean'].min():.2f} MWh)")
-print(
-    f"   Diferență vârf-minimă: {(consum_ora['mean'].max() - consum_ora['mean'].min()):.2f} MWh ({(consum_ora['mean'].max() - consum_ora['mean'].min()) / consum_ora['mean'].min() * 100:.1f}%)")
-print()
-
-print("=" * 80)
-print("✅ ANALIZA STATISTICĂ COMPLETĂ!")
-print("=" * 80)
\ No newline at end of file
+
+# Raportul din fiecare proces worker (datele se încarcă o singură dată per proces)
+_RAPORT_WORKER: Optional[RaportStatistic] = None
+
+
+def _init_worker(df: Optional[pd.DataFrame], csv_path: str,
+                 statistici: Optional[Dict[str, StatisticiIncrementale]] = None) -> None:
+    global _RAPORT_WORKER
+    if df is None:
+        # depozitul .npy rămâne memory-mapped: procesele partajează paginile prin page cache;
+        # read_parquet ar decoda tabelul în memoria privată a fiecărui proces
+        store_path = os.path.splitext(csv_path)[0] + "_coloane"
+        if is_fresh(os.path.join(store_path, MANIFEST), csv_path):
+            df = load_columns(store_path)
+        else:
+            df = load_transformed(csv_path)
+    _RAPORT_WORKER = RaportStatistic(df, statistici)
+
+
+def _section_text(r: RaportStatistic, nr: int) -> str:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        SECTIUNI[nr](r)
+    return buf.getvalue()
+
+
+def _run_section_worker(nr: int) -> str:
+    return _section_text(_RAPORT_WORKER, nr)
+
+
+class _ThreadStdout(io.TextIOBase):
+    """sys.stdout care scrie în bufferul firului curent (redirect_stdout e global, nu per fir)."""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def capture(self) -> None:
+        self._local.buf = io.StringIO()
+
+    def release(self) -> str:
+        text = self._local.buf.getvalue()
+        del self._local.buf
+        return text
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buf", self._default).write(text)
+
+    def flush(self) -> None:
+        getattr(self._local, "buf", self._default).flush()
+
+
+def run_sections(
+    sections: List[int],
+    df: Optional[pd.DataFrame] = None,
+    csv_path: str = CSV_TRANSFORMAT,
+    workers: int = 1,
+    executor: str = "process",
+    statistici: Optional[Dict[str, StatisticiIncrementale]] = None
+) -> List[str]:
+    """
+    Rulează secțiunile cerute și întoarce textul fiecăreia, în ordinea din `sections`.
+    - workers: 1 -> secvențial; >1 -> secțiunile se distribuie pe un pool
+    - executor: 'process' (fiecare proces își încarcă o dată datele: din `df`, dacă e dat,
+      altfel din depozitul .npy memory-mapped / CSV-ul `csv_path`) sau 'thread' (același DataFrame, partajat)
+    - statistici: acumulatori persistați, transmiși fiecărui RaportStatistic
+    """
+    if workers <= 1 or len(sections) <= 1:
+        r = RaportStatistic(df if df is not None else load_transformed(csv_path), statistici)
+        return [_section_text(r, nr) for nr in sections]
+
+    if executor == "process":
+        initargs = (df, None, statistici) if df is not None else (None, csv_path, statistici)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as ex:
+            return list(ex.map(_run_section_worker, sections))
+
+    if executor == "thread":
+        r = RaportStatistic(df if df is not None else load_transformed(csv_path), statistici)
+        out = _ThreadStdout(sys.stdout)
+
+        def run(nr: int) -> str:
+            out.capture()
+            try:
+                SECTIUNI[nr](r)
+            finally:
+                text = out.release()
+            return text
+
+        with redirect_stdout(out), ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(run, sections))
+
+    raise ValueError(f"Executor necunoscut: {executor}")
+
+
+def main(
+    sections: Optional[List[int]] = None,
+    df: Optional[pd.DataFrame] = None,
+    workers: int = 1,
+    executor: str = "process",
+    incremental: bool = False
+) -> None:
+    """
+    Afișează raportul de statistici descriptive.
+    - sections: numerele secțiunilor de afișat (None -> toate 14); doar acestea se calculează
+    - df: date deja încărcate (None -> incarcare.load_transformed())
+    - workers / executor: execuție paralelă a secțiunilor (vezi run_sections);
+      ordinea afișării rămâne aceeași
+    - incremental: secțiunile 3-7 din acumulatorii persistați (STATISTICI_ENERGIE), dacă sunt
+      la zi față de CSV-ul transformat; altfel se calculează exact din date
+    """
+    # Configurare afișare pandas
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+    pd.set_option('display.max_rows', 100)
+
+    # Încărcare date
+    _titlu("📊 ANALIZA STATISTICILOR DESCRIPTIVE - ENERGIE ROMÂNIA")
+
+    data = df if df is not None else load_transformed()
+
+    print(f"✅ Date încărcate cu succes!")
+    print(f"   📅 Perioada: {data['date'].min()} → {data['date'].max()}")
+    print(f"   📊 Total înregistrări: {len(data):,}")
+    print(f"   📈 Coloane: {len(data.columns)}")
+    print()
+
+    if df is None and executor == "process" and workers > 1:
+        # procesele își deschid singure datele, în loc să primească fiecare o copie serializată
+        data = None
+    statistici = None
+    if incremental:
+        if df is None and is_fresh(STATISTICI_ENERGIE, CSV_TRANSFORMAT):
+            statistici = load_statistics(STATISTICI_ENERGIE)
+        else:
+            print(f"⚠️ '{STATISTICI_ENERGIE}' lipsește sau nu e la zi: statisticile se calculează din date.")
+            print()
+    sections = sorted(SECTIUNI) if sections is None else sections
+    for text in run_sections(sections, df=data, csv_path=CSV_TRANSFORMAT, workers=workers, executor=executor,
+                             statistici=statistici):
+        print(text, end="")
+
+    print("=" * 80)
+    print("✅ ANALIZA STATISTICĂ COMPLETĂ!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    # ex.: python statisticadescrib.py 3 5 12 --workers 3  -> doar secțiunile 3, 5 și 12, în paralel
+    parser = argparse.ArgumentParser(description="Raport de statistici descriptive - energie România")
+    parser.add_argument("sections", nargs="*", type=int, help="secțiunile de afișat (implicit toate)")
+    parser.add_argument("--workers", type=int, default=1, help="numărul de procese / fire")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--incremental", action="store_true",
+                        help="secțiunile 3-7 din statisticile persistate de convert.py / actualizare.py")
+    args = parser.parse_args()
+    main(args.sections or None, workers=args.workers, executor=args.executor, incremental=args.incremental)